@@ -0,0 +1,91 @@
+"""Benchmark a v3 poll with, and without, the connection pool.
+
+A stand-in hub is served on 127.0.0.1:1223, and GeniusHub.update() is called
+repeatedly against it, firstly with a new connection per request (the default),
+then with pooled=True (keep-alive connections, cached DNS).
+
+Usage: PYTHONPATH=. python benchmarks/connection_pool.py [POLLS]
+"""
+
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+from aiohttp import web
+
+from geniushubclient import GeniusHub
+
+HOST = "127.0.0.1"
+PORT = 1223  # the v3 API is always on port 1223
+
+ZONES = {
+    "error": 0,
+    "data": [
+        {
+            "iID": 0,
+            "strName": "My House",
+            "iType": 1,
+            "iMode": 1,
+            "lOptions": 0,
+            "fPV": 20.0,
+            "bIsActive": 0,
+            "bOutRequestHeat": 0,
+            "iFlagExpectedKit": 0,
+            "strBuildDate": "Jan 16 2020",
+            "lstIssues": [],
+        }
+    ],
+}
+DATA_MANAGER = {"error": 0, "data": {"childNodes": {}}}
+AUTH_RELEASE = {"error": 0, "data": {"release": "5.3.6", "UID": "0x0123456789"}}
+
+
+async def _start_server() -> web.AppRunner:
+    def json_handler(payload):
+        body = json.dumps(payload)
+
+        async def handler(request):
+            return web.Response(text=body, content_type="application/json")
+
+        return handler
+
+    app = web.Application()
+    app.router.add_get("/v3/zones", json_handler(ZONES))
+    app.router.add_get("/v3/data_manager", json_handler(DATA_MANAGER))
+    app.router.add_get("/v3/auth/release", json_handler(AUTH_RELEASE))
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, PORT).start()
+    return runner
+
+
+async def _time_polls(polls, pooled) -> list:
+    timings = []
+    async with GeniusHub(HOST, "username", "password", pooled=pooled) as hub:
+        await hub.update()  # warm up (e.g. the first connection)
+        for _ in range(polls):
+            start = time.perf_counter()
+            await hub.update()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def main(polls) -> None:
+    runner = await _start_server()
+    try:
+        for pooled in (False, True):
+            timings = await _time_polls(polls, pooled)
+            print(
+                f"pooled={pooled!s:5}  polls={polls}  "
+                f"mean={statistics.mean(timings) * 1000:.3f} ms  "
+                f"median={statistics.median(timings) * 1000:.3f} ms"
+            )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
@@ -0,0 +1,118 @@
+"""Synthetic (but representative) v3 API payloads, for the benchmarks."""
+
+from geniushubclient.const import ZONE_MODE, ZONE_TYPE
+
+VALUES = 40  # childValues per device (a real TRV has about this many)
+
+
+def _value(path, val) -> dict:
+    return {"path": path, "val": val, "lastUpdated": 1571302800.123}
+
+
+def make_zone(zone_id, zone_type=ZONE_TYPE.ControlSP) -> dict:
+    """Return a v3 zone, with a (7-day) timer and footprint schedule."""
+    return {
+        "iID": zone_id,
+        "strName": "My House" if zone_id == 0 else f"Room {zone_id}",
+        "iType": ZONE_TYPE.Manager if zone_id == 0 else zone_type,
+        "iMode": ZONE_MODE.Timer,
+        "lOptions": 0,
+        "bIsActive": 1,
+        "bInHeatEnabled": 0,
+        "bOutRequestHeat": 0,
+        "fBoostSP": 0,
+        "fPV": 19.5,
+        "fPV_offset": 0.0,
+        "fSP": 16.0,
+        "iBoostTimeRemaining": 0,
+        "iFlagExpectedKit": 517,
+        "strBuildDate": "Jan 16 2020",
+        "zoneSubType": 1,
+        "lstIssues": [],
+        "objFootprint": {
+            "bIsNight": 0,
+            "fFootprintAwaySP": 14.0,
+            "iFootprintTmNightStart": 75600,
+            "iProfile": 1,
+            "lstSP": [
+                {"fSP": sp, "iDay": day, "iTm": tm}
+                for day in range(7)
+                for sp, tm in ((16.0, 0), (14.0, 23400), (20.0, 59700), (16.0, 75600))
+            ],
+            "objReactive": {"fActivityLevel": 0.0},
+        },
+        "objTimer": [
+            {"fSP": sp, "iDay": day, "iTm": tm}
+            for day in range(7)
+            for sp, tm in ((14.0, -1), (19.0, 25200), (14.0, 32400), (21.0, 61200))
+        ],
+        "trigger": {"reactive": 0, "output": 0},
+        "warmupDuration": {"bEnable": "true", "iLagTime": 2420, "iRiseTime": 300},
+        "zoneReactive": {"fActivityLevel": 0},
+    }
+
+
+def make_zones(zones=20) -> dict:
+    """Return a /v3/zones response."""
+    return {"error": 0, "data": [make_zone(i) for i in range(zones)]}
+
+
+def make_device(addr, zones=20) -> dict:
+    """Return a v3 device node (a radiator valve), with its _cfg node."""
+    path = f"/Genius/{addr}"
+    values = {
+        "hash": _value(path, "Danfoss/eTRV0100"),
+        "location": _value(path, f"Room {int(addr) % (zones - 1) + 1}"),
+        "lastComms": _value(path, 1571302800),
+        "Battery": _value(f"{path}/1", 100),
+        "HEATING_1": _value(f"{path}/1", 18.0),
+        "TEMPERATURE": _value(f"{path}/1", 19.5),
+        "WakeUp_Interval": _value(path, 300),
+    }
+    values.update({f"misc_{i}": _value(path, i) for i in range(VALUES - len(values))})
+
+    return {
+        "addr": addr,
+        "childValues": values,
+        "childNodes": {
+            "_cfg": {
+                "addr": "_cfg",
+                "childNodes": {},
+                "childValues": {
+                    "max_sp": _value(f"{path}/_cfg", 32),
+                    "min_sp": _value(f"{path}/_cfg", 4),
+                    "sku": _value(f"{path}/_cfg", "da-wrv-e"),
+                },
+            },
+        },
+    }
+
+
+def make_data_manager(devices=200, zones=20) -> dict:
+    """Return a /v3/data_manager response."""
+    genius = {
+        "addr": "Genius",
+        "childValues": {},
+        "childNodes": {
+            "1": {"addr": "1", "childNodes": {}, "childValues": {}},  # the hub
+            **{str(i): make_device(str(i), zones=zones) for i in range(2, devices + 2)},
+        },
+    }
+    weather = {
+        "addr": "WeatherData",
+        "childValues": {"temperature": _value("/WeatherData", 12.0)},
+        "childNodes": {},
+    }
+    return {
+        "error": 0,
+        "data": {
+            "addr": "root",
+            "childNodes": {"Genius": genius, "WeatherData": weather},
+            "childValues": {},
+        },
+    }
+
+
+def make_auth_release() -> dict:
+    """Return a /v3/auth/release response."""
+    return {"error": 0, "data": {"release": "5.3.6", "UID": "0x0123456789ABCDEF"}}
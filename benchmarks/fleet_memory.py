@@ -0,0 +1,64 @@
+"""Measure the resident memory of a fleet of hubs, with & without lean mode.
+
+Polls a synthetic fleet of hubs (sharing one aiohttp session, as a fleet would),
+each with a few zones & devices, and reports the memory held (per tracemalloc)
+once they have all been updated.
+
+Usage: PYTHONPATH=. python benchmarks/fleet_memory.py [HUBS] [ZONES]
+"""
+
+import asyncio
+import gc
+import json
+import sys
+import tracemalloc
+
+import aiohttp
+from fixtures import make_auth_release, make_data_manager, make_zones
+
+from geniushubclient import GeniusHub
+
+
+async def measure(hubs, zones, **kwargs) -> float:
+    responses = {
+        "zones": json.dumps(make_zones(zones)).encode(),
+        "data_manager": json.dumps(make_data_manager(zones * 2, zones)).encode(),
+        "auth/release": json.dumps(make_auth_release()).encode(),
+    }
+
+    async def request_raw(method, url, data=None) -> bytes:
+        return responses[url]
+
+    async with aiohttp.ClientSession() as session:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+
+        fleet = []
+        for idx in range(hubs):
+            hub = GeniusHub(f"hub-{idx}", "username", "password", session, **kwargs)
+            hub.genius_service.request_raw = request_raw
+            await hub.update()
+            fleet.append(hub)
+
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+    return held
+
+
+async def main(hubs, zones) -> None:
+    print(f"{hubs} hubs, each with {zones} zones & {zones * 2} devices")
+    for label, kwargs in (("default:", {}), ("lean:", {"lean": True})):
+        held = await measure(hubs, zones, **kwargs)
+        print(f"{label:9} {held / 2**20:8.1f} MiB ({held / hubs / 1024:.1f} KiB/hub)")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+        )
+    )
@@ -0,0 +1,58 @@
+"""Measure the effect of hedging on the tail latency of v1 polls.
+
+Polls a mock hub (v1 API) whose responses mostly take 20 ms, but 2% of which take
+500 ms, with and without a HedgePolicy, and compares the distribution of the time
+taken by each poll (i.e. by GeniusHub.update).
+
+Usage: PYTHONPATH=. python benchmarks/hedged_requests.py [POLLS]
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+from geniushubclient import GeniusHub, HedgePolicy, RateLimiter
+from geniushubclient.mock_hub import MockHub, MockHubServer
+from geniushubclient.timing import RollingHistogram
+
+
+def _latency() -> float:
+    return 0.5 if random.random() < 0.02 else random.uniform(0.015, 0.025)
+
+
+async def _time_polls(url, polls, hedge) -> RollingHistogram:
+    result = RollingHistogram(polls)
+    rate_limiter = RateLimiter(1000, 1000, 1000, 1000)  # i.e. none
+
+    async with GeniusHub(
+        "token", base_url=url, pooled=True, rate_limiter=rate_limiter, hedge=hedge
+    ) as hub:
+        for _ in range(polls):
+            start = time.perf_counter()
+            await hub.update()
+            result.add(time.perf_counter() - start)
+    return result
+
+
+async def main(polls) -> None:
+    random.seed(0)
+    async with MockHubServer() as server:
+        mock_hub = server.add_hub("hub", MockHub(latency=_latency))
+        await server.start()
+
+        print(f"{polls} polls (4 requests each), 2% of responses take 500 ms")
+        for name, hedge in (("no hedging", None), ("hedged", HedgePolicy())):
+            mock_hub.requests.clear()
+            polls_ms = await _time_polls(server.url("hub"), polls, hedge)
+
+            p50, p99 = polls_ms.percentile(50) * 1000, polls_ms.percentile(99) * 1000
+            extra = sum(mock_hub.requests.values()) / (polls * 4) - 1
+            print(
+                f"{name:12} p50 {p50:6.1f} ms, p99 {p99:6.1f} ms, "
+                f"extra requests {extra * 100:4.1f}%"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
@@ -0,0 +1,34 @@
+"""Microbenchmark the decoding of a large /v3/data_manager response.
+
+Compares the stdlib's json with GeniusService's default decoder (orjson, if it is
+installed), on a synthetic data_manager payload of several hundred devices.
+
+Usage: PYTHONPATH=. python benchmarks/json_decode.py [DEVICES]
+"""
+
+import json
+import sys
+import timeit
+
+from fixtures import make_data_manager
+
+from geniushubclient.codec import json_loads, orjson
+
+
+def main(devices) -> None:
+    body = json.dumps(make_data_manager(devices=devices)).encode("utf-8")
+    print(f"payload: {devices} devices, {len(body) / 1024:.0f} KiB")
+
+    decoders = {"json.loads": json.loads}
+    if orjson:
+        decoders["orjson.loads"] = orjson.loads
+    decoders["codec.json_loads (default)"] = json_loads
+
+    for name, decoder in decoders.items():
+        number = 20
+        best = min(timeit.repeat(lambda: decoder(body), number=number, repeat=5))
+        print(f"{name:28} {best / number * 1000:8.3f} ms/decode")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,63 @@
+"""Measure the bytes per poll of a PatchFeed, versus the whole state.
+
+Polls a synthetic hub (with a few temperatures changing between polls), and
+compares the JSON of the patches of each poll with the JSON of hub.zones and
+hub.devices, as would be shipped to a replica without a feed.
+
+Usage: PYTHONPATH=. python benchmarks/patch_feed.py [POLLS] [ZONES]
+"""
+
+import asyncio
+import copy
+import json
+import random
+import sys
+
+from fixtures import make_data_manager, make_zones
+
+from geniushubclient import GeniusTestHub, PatchFeed
+
+
+async def main(polls, zones) -> None:
+    rnd = random.Random(0)
+    zones_json, data_manager = make_zones(zones), make_data_manager(zones * 2, zones)
+    nodes = data_manager["data"]["childNodes"]["Genius"]["childNodes"]
+
+    hub = GeniusTestHub(None, None)
+    devices_json = hub._devices_via_v3_data_mgr(data_manager)
+
+    def load() -> None:  # a fresh copy, as if just decoded
+        hub._test_json["zones"] = copy.deepcopy(zones_json["data"])
+        hub._test_json["devices"] = copy.deepcopy(devices_json)
+
+    load()
+    await hub.update()
+    feed = PatchFeed(hub)
+
+    full = patched = 0
+    for idx in range(polls):
+        for zone in rnd.sample(zones_json["data"][1:], 3):
+            zone["fPV"] = round(rnd.uniform(17, 22), 1)
+        for node in rnd.sample([n for a, n in nodes.items() if a != "1"], 5):
+            node["childValues"]["TEMPERATURE"]["val"] = round(rnd.uniform(17, 22), 1)
+        devices_json = hub._devices_via_v3_data_mgr(data_manager)
+
+        seq = feed.seq
+        load()
+        await hub.update()
+
+        full += len(json.dumps({"zones": hub.zones, "devices": hub.devices}))
+        patched += len(json.dumps(feed.patches_since(seq).patches))
+
+    print(f"{polls} polls of a hub with {zones} zones & {zones * 2} devices")
+    print(f"whole state:  {full / polls / 1024:10.1f} KiB/poll")
+    print(f"patches:      {patched / polls:10.0f} B/poll ({full / patched:.0f}x less)")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+        )
+    )
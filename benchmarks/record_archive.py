@@ -0,0 +1,73 @@
+"""Measure the size of an archive of recorded polls (see: ResponseRecorder).
+
+Records a number of polls of a synthetic hub (with a few temperatures changing
+between polls), and compares the archive with the raw responses, and with each
+response compressed on its own.
+
+Usage: PYTHONPATH=. python benchmarks/record_archive.py [POLLS]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import zlib
+
+from fixtures import make_auth_release, make_data_manager, make_zones
+
+from geniushubclient.record import ResponseRecorder, read_archive
+
+
+def _polls(polls, devices=200, zones=20):
+    """Yield the responses of each poll, as a dict of endpoint: body."""
+    rnd = random.Random(0)
+    zones_json, data_manager = make_zones(zones), make_data_manager(devices, zones)
+    nodes = data_manager["data"]["childNodes"]["Genius"]["childNodes"]
+
+    for idx in range(polls):
+        for zone in rnd.sample(zones_json["data"], 3):
+            zone["fPV"] = round(rnd.uniform(17, 22), 1)
+        for node in rnd.sample([n for a, n in nodes.items() if a != "1"], 10):
+            node["childValues"]["TEMPERATURE"]["val"] = round(rnd.uniform(17, 22), 1)
+            node["childValues"]["lastComms"]["val"] = 1571302800 + idx * 60
+
+        yield {
+            "zones": json.dumps(zones_json).encode("utf-8"),
+            "data_manager": json.dumps(data_manager).encode("utf-8"),
+            "auth/release": json.dumps(make_auth_release()).encode("utf-8"),
+        }
+
+
+def main(polls) -> None:
+    raw = compressed = record = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "hub.archive")
+
+        with ResponseRecorder(path) as recorder:
+            for idx, poll in enumerate(_polls(polls)):
+                for endpoint, body in poll.items():
+                    start = time.perf_counter()
+                    recorder.record(endpoint, body, timestamp=idx * 60.0)
+                    record += time.perf_counter() - start
+
+                    raw += len(body)
+                    compressed += len(zlib.compress(body, 6))
+
+        start = time.perf_counter()
+        count = sum(1 for _ in read_archive(path))
+        read = time.perf_counter() - start
+
+        archive = os.path.getsize(path)
+
+    print(f"{polls} polls, {count} responses")
+    print(f"raw responses:     {raw / 1024:10.0f} KiB")
+    print(f"each zlib'd:       {compressed / 1024:10.0f} KiB")
+    print(f"archive (delta):   {archive / 1024:10.0f} KiB ({raw / archive:.0f}x)")
+    print(f"record:            {record / polls * 1000:10.2f} ms/poll")
+    print(f"read:              {read / polls * 1000:10.2f} ms/poll")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
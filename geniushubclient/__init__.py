@@ -7,23 +7,54 @@ see: https://my.geniushub.co.uk/docs
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime as dt
-from typing import Dict, List, Tuple  # Any, Optional, Set
-
-from .const import HUB_SW_VERSIONS, ZONE_MODE
-from .device import GeniusDevice
+from hashlib import blake2b
+from typing import Callable, Dict, List, Optional, Set, Tuple  # Any
+
+from .codec import json_fingerprint
+from .const import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    ENDPOINTS_V1,
+    ENDPOINTS_V1_SUMMARY,
+    ENDPOINTS_V3,
+    ENTITY_KINDS,
+    HUB_SW_VERSIONS,
+    ZONE_MODE,
+)
+from .device import GeniusDevice, flatten_device
+from .events import (  # noqa: F401
+    ADDED,
+    CHANGED,
+    REMOVED,
+    ChangeListeners,
+    EntityChange,
+    Subscription,
+    diff_data,
+)
+from .hedge import HedgePolicy  # noqa: F401
 from .issue import GeniusIssue
+from .patch import Delta, PatchFeed, apply_patch  # noqa: F401
+from .ratelimit import SHARED_RATE_LIMITER, RateLimiter  # noqa: F401
+from .record import ReplayService, ResponseRecorder  # noqa: F401
+from .retry import CircuitBreaker, GeniusHubUnavailable, RetryPolicy  # noqa: F401
 from .session import GeniusService
+from .stream import DataManagerParser
+from .timing import CONVERT, RequestTimings  # noqa: F401
 from .zone import GeniusZone, natural_sort
 
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
 
 
+class NotLoadedError(LookupError):
+    """The data was not loaded by the latest update (see: GeniusHub.update)."""
+
+
 class GeniusHubBase:
     """The class for a Genius Hub."""
 
-    def __init__(self, hub_id, username=None, debug=False) -> None:
+    def __init__(self, hub_id, username=None, debug=False, lean=False) -> None:
         if debug is True:
             _LOGGER.setLevel(logging.DEBUG)
             _LOGGER.debug("Debug mode is explicitly enabled.")
@@ -36,22 +67,32 @@ class GeniusHubBase:
         self.api_version = 3 if username else 1
         self._sense_mode = None
         self._verbose = 1
+        self.lean = lean  # keep only the converted data (see: GeniusBase._slim)
 
         self._zones = self._devices = self._issues = self._version = None
         self._test_json = {}  # v3_zones(raw_json) used by GeniusTestHub
 
+        self._loaded = set(ENTITY_KINDS)  # the kinds loaded by the latest update
+        self._summary_only = False  # if the v1 /summary endpoints were used
+
         self.zone_objs = []
         self.device_objs = []
-        self.issues = []
-        self.version = {}
+        self._issues_v1 = []
+        self._version_v1 = {}
         self.uid = None
 
+        self.entities_reconverted = 0  # zones/devices, by the latest update
+        self.entities_skipped = 0  # zones/devices unchanged since the previous update
+        self.entities_added = []  # zones/devices, new to the latest update
+        self.entities_removed = []  # zones/devices, no longer known to the hub
+        self._listeners = ChangeListeners()  # see: subscribe()
+
         self.zone_by_id = {}
         self.zone_by_name = {}
         self.device_by_id = {}
 
     def __str__(self) -> str:
-        return json.dumps(self.version)
+        return json.dumps(self._version_v1)
 
     @staticmethod
     def _zones_via_v3_zones(raw_json) -> List[Dict]:
@@ -68,13 +109,7 @@ class GeniusHubBase:
             if x["addr"] != "WeatherData"
         ]:
             for device in [x for x in site["childNodes"].values() if x["addr"] != "1"]:
-                result.append(device)
-                for channel in [
-                    x for x in device["childNodes"].values() if x["addr"] != "_cfg"
-                ]:
-                    temp = dict(channel)
-                    temp["addr"] = f"{device['addr']}-{channel['addr']}"
-                    result.append(temp)
+                result.extend(flatten_device(device))
         return result
 
     @staticmethod
@@ -112,6 +147,36 @@ class GeniusHubBase:
                 f"{value} is not valid for verbosity, the permissible range is (0-3)."
             )
 
+    def _kinds_needed(self, kinds) -> Set[str]:
+        """Return the kinds of entity to load, including any they depend upon."""
+        kinds = set(ENTITY_KINDS if kinds is None else kinds)
+        if not kinds <= set(ENTITY_KINDS):
+            raise ValueError(
+                f"{sorted(kinds)} are not valid kinds, the permissible kinds are: "
+                f"{', '.join(ENTITY_KINDS)}."
+            )
+        if self.api_version == 3 and "issues" in kinds:
+            kinds.add("devices")  # the issues are converted via the devices
+        return kinds
+
+    def _check_loaded(self, kind) -> None:
+        """Raise NotLoadedError if a kind of entity was not loaded (in detail)."""
+        if kind not in self._loaded:
+            raise NotLoadedError(
+                f"The hub's {kind} were not loaded by the latest update, "
+                f"which loaded only: {', '.join(sorted(self._loaded))}."
+            )
+        if self._summary_only and self.verbosity > 0 and kind in ("zones", "devices"):
+            raise NotLoadedError(
+                f"Only a summary of the hub's {kind} was loaded by the latest update, "
+                f"which is insufficient for verbosity={self.verbosity}."
+            )
+        if self.lean and self.verbosity == 3 and kind in ("zones", "devices"):
+            raise NotLoadedError(
+                f"The raw JSON of the hub's {kind} is not kept by a lean hub, "
+                f"which is needed for verbosity={self.verbosity}."
+            )
+
     @property
     def zones(self) -> List:
         """Return a list of Zones known to the Hub.
@@ -120,6 +185,7 @@ class GeniusHubBase:
         v1/zones:         id, name, type, mode, temperature, setpoint,
         occupied, override, schedule
         """
+        self._check_loaded("zones")
         return [z.info for z in self.zone_objs]
 
     @property
@@ -129,67 +195,186 @@ class GeniusHubBase:
         v1/devices/summary: id, type
         v1/devices:         id, type, assignedZones, state
         """
+        self._check_loaded("devices")
         key = "addr" if self.verbosity == 3 else "id"
         return natural_sort([d.info for d in self.device_objs], key)
 
+    @property
+    def issues(self) -> List:
+        """Return a list of Issues known to the Hub."""
+        self._check_loaded("issues")
+        return self._issues_v1
+
+    @property
+    def version(self) -> Dict:
+        """Return the version of the Hub's software."""
+        self._check_loaded("version")
+        return self._version_v1
+
     def update(self):
-        """Update the Hub with its latest state data."""
+        """Update the Hub with its latest state data.
+
+        Only the kinds of entity in self._loaded are converted, and only those
+        zones/devices whose raw JSON has changed since the previous update.
+
+        The zone/device objects (and the lists/dicts of them) are updated in place,
+        and entities_added/entities_removed are those new to (or gone from) the hub.
+        If there are any listeners, the changes are published to them.
+
+        A lean hub keeps only the converted data of its zones/devices, and none of
+        their raw JSON once they are loaded (so they are updated only when it has
+        changed).
+        """
+        self.entities_reconverted = self.entities_skipped = 0
+
+        listening = bool(self._listeners)
+        found = []  # (kind, action, entity, old data), if listening
 
         def populate_objects(
-            obj_list, obj_key, obj_by_id, GeniusObject
-        ) -> Tuple[List, Dict]:
-            """Create the current list of GeniusHub objects (zones/devices)."""
-            entities = []  # list of converted zones/devices
+            kind, obj_list, obj_key, objs, obj_by_id, GeniusObject
+        ) -> Tuple[List, List]:
+            """Update the GeniusHub objects (zones/devices) in place.
+
+            An object persists for as long as its id is known to the hub. Return the
+            objects that are new, and those that are no longer known to the hub.
+            """
+            entities, added = [], []  # list of converted zones/devices
             key = "id" if self.api_version == 1 else obj_key
             for raw_json in obj_list:
-                entity = obj_by_id.get(
-                    raw_json[key], GeniusObject(raw_json[key], raw_json, self)
-                )
-                entity._data, entity._raw = None, raw_json
+                entity = obj_by_id.get(raw_json[key])
+                if entity is None:
+                    entity = GeniusObject(raw_json[key], raw_json, self)
+                    added.append(entity)
+                    found.append((kind, ADDED, entity, None))
+
+                fingerprint = json_fingerprint(raw_json)
+                if fingerprint == entity._fingerprint:
+                    self.entities_skipped += 1  # its converted data is still valid
+                else:
+                    if listening and entity._fingerprint is not None:
+                        old = entity._plain_data()  # converted, before it changes
+                        found.append((kind, CHANGED, entity, old))
+                    entity._data, entity._fingerprint = None, fingerprint
+                    self.entities_reconverted += 1
+                entity._raw = raw_json
+                if self.lean:
+                    entity._slim()
                 entities.append(entity)
-            return entities, {e.id: e for e in entities}
 
-        if self.api_version == 1:
-            self._sense_mode = None  # currently, no way to tell
-        else:  # self.api_version == 3:
-            manager = [z for z in self._zones if z["iID"] == 0][0]
-            self._sense_mode = bool(manager["lOptions"] & ZONE_MODE.Other)
+            ids = {e.id for e in entities}
+            removed = [e for e in objs if e.id not in ids]
+            found.extend((kind, REMOVED, e, None) for e in removed)
 
-        # TODO: this looks dodgy: replacing rather than updating entities
-        self.zone_objs, self.zone_by_id = populate_objects(
-            self._zones, "iID", self.zone_by_id, GeniusZone
-        )
-        self.zone_by_name = {z.name: z for z in self.zone_objs}
+            objs[:] = entities
+            obj_by_id.clear()
+            obj_by_id.update((e.id, e) for e in entities)
+            return added, removed
 
-        for zone in self.zone_objs:  # TODO: this need checking
-            zone.device_objs = [
-                d for d in self.device_objs if d.assigned_zone == zone.name
-            ]
-            zone.device_by_id = {d.id: d for d in zone.device_objs}
+        self.entities_added, self.entities_removed = [], []
 
-        self.device_objs, self.device_by_id = populate_objects(
-            self._devices, "addr", self.device_by_id, GeniusDevice
-        )
+        if "zones" in self._loaded and self._zones is not None:  # None if lean
+            if self.api_version == 1:
+                self._sense_mode = None  # currently, no way to tell
+            else:  # self.api_version == 3:
+                manager = [z for z in self._zones if z["iID"] == 0][0]
+                self._sense_mode = bool(manager["lOptions"] & ZONE_MODE.Other)
 
-        old_issues = self.issues
-        if self.api_version == 1:
-            self.issues = self._issues
-            self.version = self._version
-        else:  # self.api_version == 3:
-            self.issues = [
-                GeniusIssue(raw_json, self.device_by_id).data
-                for raw_json in self._issues
-            ]
-            self.version = {
-                "hubSoftwareVersion": self._version,
-                "earliestCompatibleAPI": "https://my.geniushub.co.uk/v1",
-                "latestCompatibleAPI": "https://my.geniushub.co.uk/v1",
-            }
-
-        for issue in [i for i in self.issues if i not in old_issues]:
-            _LOGGER.warning("An Issue has been found: %s", issue)
-        for issue in [i for i in old_issues if i not in self.issues]:
-            _LOGGER.info("An Issue is now resolved: %s", issue)
+            added, removed = populate_objects(
+                "zones", self._zones, "iID", self.zone_objs, self.zone_by_id, GeniusZone
+            )
+            self.entities_added += added
+            self.entities_removed += removed
+
+            self.zone_by_name.clear()
+            self.zone_by_name.update((z.name, z) for z in self.zone_objs)
+
+        if "devices" in self._loaded and self._devices is not None:
+            added, removed = populate_objects(
+                "devices",
+                self._devices,
+                "addr",
+                self.device_objs,
+                self.device_by_id,
+                GeniusDevice,
+            )
+            self.entities_added += added
+            self.entities_removed += removed
+
+        if "zones" in self._loaded or "devices" in self._loaded:
+            devices_by_zone = {}  # after both, as a device refers to its zone
+            for device in self.device_objs:
+                devices_by_zone.setdefault(device.assigned_zone, []).append(device)
+
+            for zone in self.zone_objs:
+                zone.device_objs[:] = devices_by_zone.get(zone, [])
+                zone.device_by_id.clear()
+                zone.device_by_id.update((d.id, d) for d in zone.device_objs)
+
+        for entity in self.entities_added:
+            _LOGGER.debug("A %s has been found: %s", type(entity).__name__, entity.id)
+        for entity in self.entities_removed:
+            _LOGGER.info(
+                "A %s is no longer known: %s", type(entity).__name__, entity.id
+            )
+
+        if "issues" in self._loaded:
+            old_issues = self._issues_v1
+            if self.api_version == 1:
+                self._issues_v1 = self._issues
+            else:  # self.api_version == 3:
+                self._issues_v1 = [
+                    GeniusIssue(raw_json, self.device_by_id).data
+                    for raw_json in self._issues
+                ]
+
+            for issue in [i for i in self._issues_v1 if i not in old_issues]:
+                _LOGGER.warning("An Issue has been found: %s", issue)
+            for issue in [i for i in old_issues if i not in self._issues_v1]:
+                _LOGGER.info("An Issue is now resolved: %s", issue)
+
+        if "version" in self._loaded:
+            if self.api_version == 1:
+                self._version_v1 = self._version
+            else:  # self.api_version == 3:
+                self._version_v1 = {
+                    "hubSoftwareVersion": self._version,
+                    "earliestCompatibleAPI": "https://my.geniushub.co.uk/v1",
+                    "latestCompatibleAPI": "https://my.geniushub.co.uk/v1",
+                }
+
+        if listening:  # the changes are found once, for all the listeners
+            changes = []
+            for kind, action, entity, old in found:
+                data = entity._plain_data()
+                diff = diff_data(old, data) if action == CHANGED else {}
+                if diff or action != CHANGED:
+                    changes.append(EntityChange(kind, entity.id, action, data, diff))
+            if changes:
+                self._listeners.publish(changes)
+
+        if self.lean:  # the zones/devices now hold all that is needed of the JSON
+            if "zones" in self._loaded:  # otherwise, it is kept until they are
+                self._zones = None
+            if "devices" in self._loaded:
+                self._devices = None
+
+    def subscribe(self, callback=None, kinds=None) -> Optional[Subscription]:
+        """Listen for changes to the zones/devices (only those of kinds, if given).
+
+        Each update that changes a zone/device publishes an EntityChange, with the
+        keys of its (v1) data that have changed, e.g. temperature or state. If a
+        callback is given, it is called with each change (and should be quick),
+        otherwise a Subscription is returned: an async iterator of the changes,
+        which coalesces them if its listener falls behind.
+
+        Listeners are held weakly: a callback (or its object, if a bound method),
+        or a Subscription, that is no longer referenced is dropped.
+        """
+        return self._listeners.add(callback, kinds)
+
+    def unsubscribe(self, listener) -> None:
+        """Stop publishing changes to a callback or a Subscription."""
+        self._listeners.remove(listener)
 
     async def reboot(self) -> None:
         """Reboot the hub."""
@@ -201,44 +386,288 @@ class GeniusHub(GeniusHubBase):
     """The class for a Genius Hub."""
 
     def __init__(
-        self, hub_id, username=None, password=None, session=None, debug=False
+        self,
+        hub_id,
+        username=None,
+        password=None,
+        session=None,
+        debug=False,
+        pooled=False,
+        retry_policy=None,
+        circuit_breaker=None,
+        max_concurrent=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        rate_limiter=None,
+        decoder=None,
+        streaming=False,
+        timings=False,
+        write_debounce=None,
+        base_url=None,
+        recorder=None,
+        replay=None,
+        cadence=None,
+        hedge=None,
+        lean=False,
     ) -> None:
-        super().__init__(hub_id, username=username, debug=debug)
+        super().__init__(hub_id, username=username, debug=debug, lean=lean)
 
-        self.genius_service = GeniusService(hub_id, username, password, session)
+        if replay:  # a ReplayService, in place of the hub
+            self.genius_service = replay
+            self.api_version = 1 if replay.use_v1_api else 3
+        else:
+            self.genius_service = GeniusService(
+                hub_id,
+                username,
+                password,
+                session,
+                pooled=pooled,
+                retry_policy=retry_policy,
+                circuit_breaker=circuit_breaker,
+                max_concurrent=max_concurrent,
+                rate_limiter=rate_limiter,
+                decoder=decoder,
+                timings=timings,
+                write_debounce=write_debounce,
+                base_url=base_url,
+                recorder=recorder,
+                hedge=hedge,
+            )
         self.request = self.genius_service.request
 
-    async def update(self) -> None:
-        """Update the Hub with its latest state data."""
-        if self.genius_service.use_v1_api:
-            (
-                self._zones,
-                self._devices,
-                self._issues,
-                self._version,
-            ) = await asyncio.gather(
-                *[
-                    self.genius_service.request("GET", g)
-                    for g in ("zones", "devices", "issues", "version")
-                ]
+        self._streaming = streaming  # parse data_manager incrementally
+        self._cadence = cadence or {}  # endpoint: seconds between fetches (or None)
+        self._refetch_all = False  # the latest update failed
+        self._digests = {}  # endpoint: digest of its last raw response
+        self.unchanged_polls = 0  # polls with no changed responses
+
+        self._update_task = None  # the update in flight, shared by its callers
+        self._update_plan = (frozenset(), ())  # its kinds & endpoints
+        self._next_update = None  # the update queued behind it (updates never overlap)
+        self._next_kinds = set()  # its kinds: those of all its callers, merged
+        self._fetched_at = {}  # endpoint: time.monotonic() of its latest response
+
+    async def __aenter__(self) -> "GeniusHub":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Cancel any updates in flight, and close the session (unless provided)."""
+        tasks = [t for t in (self._next_update, self._update_task) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await self.genius_service.close()
+
+    async def update(self, max_age=None, kinds=None, verbosity=None) -> None:
+        """Update the Hub with its latest state data.
+
+        Only the endpoints needed for kinds (some of ENTITY_KINDS, by default all of
+        them) are fetched, and only those kinds are converted: reading any other
+        kind then raises NotLoadedError. If verbosity is given, it is set first, and
+        (with the v1 API) verbosity 0 uses the smaller /summary endpoints.
+
+        If the hub has a cadence, e.g. {"data_manager": 300, "auth/release": None},
+        an endpoint is fetched only once its latest response is that old (in
+        seconds), or once only (if None), and the other endpoints every update.
+
+        Concurrent calls share the one update, and its outcome. Updates never
+        overlap: a call for kinds (or endpoints) that the update in flight does not
+        include waits for it, and then shares the next update, which is of the kinds
+        of all such calls (and of those of the update before it).
+        If max_age (in seconds) is given, and the kinds were updated more recently
+        than that, then no update is made.
+        """
+        if verbosity is not None:
+            self.verbosity = verbosity
+        kinds = frozenset(self._kinds_needed(kinds))
+        endpoints = self._endpoints_needed(kinds)
+
+        if (
+            max_age is not None
+            and kinds <= self._loaded
+            and all(
+                time.monotonic() - self._fetched_at.get(e, float("-inf")) < max_age
+                for e in endpoints
             )
+        ):
+            return
+
+        task = self._update_task
+        if (
+            task is not None
+            and kinds <= self._update_plan[0]
+            and set(endpoints) <= set(self._update_plan[1])
+        ):
+            pass  # share the update in flight
+
+        elif task is None and self._next_update is None:
+            task = self._start_update(kinds)
+
+        else:  # queue behind the update in flight, merging the kinds
+            self._next_kinds |= kinds
+            if task is not None:  # so that the next update loads them too
+                self._next_kinds |= self._update_plan[0]
+            if self._next_update is None:
+                self._next_update = asyncio.ensure_future(self._update_next(task))
+                self._next_update.add_done_callback(self._update_done)
+            task = self._next_update
+
+        await asyncio.shield(task)
+
+    def _start_update(self, kinds) -> asyncio.Task:
+        """Start an update of the kinds, with the endpoints needed (as of now)."""
+        endpoints = self._endpoints_needed(kinds)
+        task = asyncio.ensure_future(self._update(kinds, endpoints))
+        task.add_done_callback(self._update_done)
+        self._update_task, self._update_plan = task, (kinds, endpoints)
+        return task
+
+    async def _update_next(self, prev) -> None:
+        """Wait for the update in flight (if any), then start the queued update."""
+        if prev is not None:
+            await asyncio.wait([prev])  # its outcome is for its own callers
+        kinds, self._next_kinds = frozenset(self._next_kinds), set()
+        self._next_update = None  # later calls share (or queue behind) this one
+        await self._start_update(kinds)
+
+    def _update_done(self, task) -> None:
+        """Clear the in-flight update, so that the next call starts a new one."""
+        if task is self._update_task:
+            self._update_task = None
+        elif task is self._next_update:  # e.g. it was cancelled while queued
+            self._next_update = None
+        if not task.cancelled():
+            task.exception()  # is re-raised to the callers, not 'never retrieved'
+
+    def _endpoints_needed(self, kinds) -> Tuple[str, ...]:
+        """Return the endpoints needed to load the kinds of entity."""
+        if not self.genius_service.use_v1_api:
+            plan = ENDPOINTS_V3
+        elif self.verbosity == 0:
+            plan = {**ENDPOINTS_V1, **ENDPOINTS_V1_SUMMARY}
+        else:
+            plan = ENDPOINTS_V1
 
-        else:  # self.api_version == 3:
-            zones, data_manager, auth = await asyncio.gather(
-                *[
-                    self.genius_service.request("GET", g)
-                    for g in ("zones", "data_manager", "auth/release")
-                ]
+        endpoints = []
+        for kind in ENTITY_KINDS:
+            if kind in kinds:
+                endpoints += [e for e in plan[kind] if e not in endpoints]
+        return tuple(endpoints)
+
+    async def _fetch(self, endpoint) -> Tuple[bytes, Callable]:
+        """Return the digest of an endpoint's response, and a callable to decode it.
+
+        In streaming mode, the data_manager response is parsed into device records
+        as it arrives, and is decoded to those records.
+        """
+        if self._streaming and endpoint == "data_manager":
+            parser = await self.genius_service.request_stream(
+                "GET", endpoint, DataManagerParser
             )
+            return parser.digest, lambda: parser.devices
 
-            self._zones = self._zones_via_v3_zones(zones)
-            self._devices = self._devices_via_v3_data_mgr(data_manager)
-            self._issues = self._issues_via_v3_zones(zones)
-            self._version = auth["data"]["release"]
+        body = await self.genius_service.request_raw("GET", endpoint)
+        return (
+            blake2b(body, digest_size=16).digest(),
+            lambda: self.genius_service.decode(body),
+        )
 
-            self.uid = auth["data"]["UID"]
+    async def _update(self, kinds, endpoints) -> None:
+        """Update the Hub with its latest state data.
 
+        If the update fails, the next update fetches every endpoint (regardless of
+        its cadence).
+        """
+        try:
+            await self._update_endpoints(kinds, endpoints)
+        except Exception:  # noqa: B902; is re-raised
+            self._refetch_all = True  # e.g. the hub may have been rebooted/upgraded
+            raise
+        self._refetch_all = False
+
+    def _is_due(self, endpoint) -> bool:
+        """Return True if an endpoint is to be fetched, as per its cadence."""
+        if (
+            self._refetch_all
+            or endpoint not in self._digests  # its JSON is not held
+            or endpoint not in self._cadence
+        ):
+            return True
+        if self._cadence[endpoint] is None:  # once (until an update fails)
+            return False
+        age = time.monotonic() - self._fetched_at[endpoint]
+        return age >= self._cadence[endpoint]
+
+    async def _update_endpoints(self, kinds, endpoints) -> None:
+        """Fetch the endpoints that are due, and convert any changes.
+
+        An endpoint with a cadence is not fetched until it is due, and its latest
+        response is used instead. The raw response of each endpoint is digested,
+        and only those responses that have changed since the last poll are decoded.
+        If none have changed (and the same kinds are needed), the conversion is
+        skipped altogether and the existing objects are kept.
+        """
+        due = [e for e in endpoints if self._is_due(e)]
+        responses = await asyncio.gather(*[self._fetch(g) for g in due])
+        fetched_at = dict.fromkeys(due, time.monotonic())
+
+        timings = self.genius_service.timings
+
+        digests = {e: self._digests[e] for e in endpoints if e not in due}
+        changed = {}
+        for endpoint, (digest, decode) in zip(due, responses):
+            digests[endpoint] = digest
+            if digests[endpoint] != self._digests.get(endpoint):
+                start = time.perf_counter()
+                changed[endpoint] = decode()
+                if timings:
+                    timings.record(endpoint, "decode", time.perf_counter() - start)
+
+        summary_only = self.genius_service.use_v1_api and self.verbosity == 0
+        if not changed and (kinds, summary_only) == (
+            self._loaded,
+            self._summary_only,
+        ):
+            self.unchanged_polls += 1
+            self.entities_reconverted = 0
+            self.entities_added, self.entities_removed = [], []
+            self.entities_skipped = len(self.zone_objs) if "zones" in kinds else 0
+            if "devices" in kinds:
+                self.entities_skipped += len(self.device_objs)
+            self._fetched_at.update(fetched_at)
+            return
+
+        if self.genius_service.use_v1_api:
+            for endpoint in ("zones", "zones/summary"):
+                self._zones = changed.get(endpoint, self._zones)
+            for endpoint in ("devices", "devices/summary"):
+                self._devices = changed.get(endpoint, self._devices)
+            self._issues = changed.get("issues", self._issues)
+            self._version = changed.get("version", self._version)
+
+        else:  # self.api_version == 3:
+            if "zones" in changed:
+                self._zones = self._zones_via_v3_zones(changed["zones"])
+                self._issues = self._issues_via_v3_zones(changed["zones"])
+            if "data_manager" in changed and self._streaming:
+                self._devices = changed["data_manager"]  # already parsed
+            elif "data_manager" in changed:
+                self._devices = self._devices_via_v3_data_mgr(changed["data_manager"])
+            if "auth/release" in changed:
+                self._version = changed["auth/release"]["data"]["release"]
+                self.uid = changed["auth/release"]["data"]["UID"]
+
+        self._loaded, self._summary_only = set(kinds), summary_only
+
+        start = time.perf_counter()
         super().update()  # now parse all the JSON
+        if timings:
+            timings.record(CONVERT, "convert", time.perf_counter() - start)
+
+        self._digests = digests  # only those of the endpoints whose JSON is held
+        self._fetched_at.update(fetched_at)
 
 
 class GeniusTestHub(GeniusHubBase):
@@ -246,13 +675,14 @@ class GeniusTestHub(GeniusHubBase):
 
     def __init__(self, zones_json, device_json, debug=None) -> None:
         super().__init__("test_hub", username="test", debug=debug)
-        _LOGGER.info("Using GeniusTestHub()")
+        _LOGGER.debug("Using GeniusTestHub()")
 
         self._test_json["zones"] = zones_json
         self._test_json["devices"] = device_json
 
-    async def update(self) -> None:
-        """Update the Hub with its latest state data."""
+    async def update(self, kinds=None) -> None:
+        """Update the Hub with its latest state data (only the kinds, if given)."""
+        self._loaded = self._kinds_needed(kinds)
         self._zones = self._test_json["zones"]
         self._devices = self._test_json["devices"]
         self._issues = self._issues_via_v3_zones({"data": self._zones})
@@ -0,0 +1,110 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import logging
+import re
+from typing import Awaitable, Callable, Dict, Set
+
+_LOGGER = logging.getLogger(__name__)
+
+_ZONE_URL = re.compile(r"zones?/(\d+)(/|$)")  # v3: zone/{id}, v1: zones/{id}/mode, etc.
+
+
+def write_key(url) -> str:
+    """Return the key by which writes to a url are coalesced, e.g. its zone.
+
+    Every write to a zone (whatever its endpoint) has the same key, so that only
+    the latest command for the zone is sent.
+    """
+    match = _ZONE_URL.match(url)
+    return f"zone/{match[1]}" if match else url
+
+
+class _PendingWrite:
+    """A write that is waiting for its debounce window to close."""
+
+    def __init__(self, future, send) -> None:
+        self.future = future
+        self.send = send
+        self.handle = None
+        self.superseded = 0
+
+
+class WriteCoalescer:
+    """Debounce writes, so that only the latest write for a key is sent.
+
+    The first write for a key (e.g. a zone) opens a window of window seconds. Any
+    further writes for that key within the window replace it, and when the window
+    closes only the latest is sent. Every caller receives the outcome of the write
+    that was actually sent.
+    """
+
+    def __init__(self, window) -> None:
+        self.window = window
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._tasks: Set[asyncio.Task] = set()  # the writes being sent, once due
+
+    async def submit(self, key, send: Callable[[], Awaitable]):
+        """Submit a write, and return the outcome of the write that is sent."""
+        pending = self._pending.get(key)
+
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = self._pending[key] = _PendingWrite(loop.create_future(), send)
+            pending.future.add_done_callback(_retrieve_exception)
+            pending.handle = loop.call_later(self.window, self._send_later, key)
+        else:
+            pending.send = send  # last write wins
+            pending.superseded += 1
+
+        return await asyncio.shield(pending.future)
+
+    async def flush(self) -> None:
+        """Send all the pending writes now, without waiting for their windows.
+
+        Also wait for any writes whose windows have closed, but are still being sent.
+        """
+        for key in list(self._pending):
+            pending = self._pending.get(key)
+            if pending is None:  # its window closed while an earlier key was sent
+                continue
+            pending.handle.cancel()
+            await self._flush(key)
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _send_later(self, key) -> None:
+        """Send a write once its window has closed (keeping a reference to it)."""
+        task = asyncio.ensure_future(self._flush(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._sent)
+
+    def _sent(self, task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            _LOGGER.error("Failed to send a write.", exc_info=task.exception())
+
+    async def _flush(self, key) -> None:
+        pending = self._pending.pop(key, None)
+        if pending is None:  # it has already been flushed
+            return
+
+        if pending.superseded:
+            _LOGGER.debug(
+                "Sending the latest write for %s (%s were superseded).",
+                key,
+                pending.superseded,
+            )
+
+        try:
+            result = await pending.send()
+        except Exception as exc:  # noqa: B902; is given to the callers
+            pending.future.set_exception(exc)
+        else:
+            pending.future.set_result(result)
+
+
+def _retrieve_exception(future) -> None:
+    """Mark the exception as retrieved (it is raised to every waiting caller)."""
+    if not future.cancelled():
+        future.exception()
@@ -0,0 +1,52 @@
+"""Python client library for the Genius Hub API."""
+
+import json
+import logging
+from hashlib import blake2b
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, but much faster
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def json_loads(body):
+    """Decode JSON (bytes or str), using orjson if it is installed."""
+    if orjson:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _orjson_default(obj):
+    """Encode the subclasses of dict, list, etc. (e.g. LazyData) as json does.
+
+    orjson would otherwise serialise a dict subclass from its own storage, rather
+    than via its items().
+    """
+    if isinstance(obj, dict):
+        return dict(obj.items())
+    if isinstance(obj, list):
+        return list(obj)
+    if isinstance(obj, str):
+        return str(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj) -> str:
+    """Encode JSON (as a str), using orjson if it is installed."""
+    if orjson:
+        return orjson.dumps(
+            obj, default=_orjson_default, option=orjson.OPT_PASSTHROUGH_SUBCLASS
+        ).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_fingerprint(obj) -> bytes:
+    """Return a digest of some (decoded) JSON, so that a change can be detected."""
+    if orjson:
+        return blake2b(orjson.dumps(obj), digest_size=16).digest()
+    return blake2b(json.dumps(obj).encode("utf-8"), digest_size=16).digest()
@@ -5,6 +5,62 @@ from types import SimpleNamespace
 DEFAULT_TIMEOUT_V1 = 120
 DEFAULT_TIMEOUT_V3 = 20
 
+# used only when the connection pool is enabled (pooled=True)
+DEFAULT_POOL_LIMIT_PER_HOST = 3  # the v3 API has 3 concurrent GETs per poll
+DEFAULT_POOL_DNS_TTL = 300  # seconds, dyndns addresses rarely change
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 3  # per hub, in-flight at any one time
+
+DEFAULT_RETRY_ATTEMPTS = 2  # i.e. the original request, and one retry
+DEFAULT_RETRY_BACKOFF = 0.5  # seconds, doubled after each attempt (before jitter)
+DEFAULT_RETRY_MAX_BACKOFF = 10  # seconds
+
+# the v1 API is rate-limited by token & by host, shared by all hubs in the process
+DEFAULT_RATE_PER_TOKEN = 1.0  # requests per second, sustained
+DEFAULT_BURST_PER_TOKEN = 8  # i.e. two polls in quick succession
+DEFAULT_RATE_PER_HOST = 20.0
+DEFAULT_BURST_PER_HOST = 40
+DEFAULT_RATE_LIMIT_PRUNE = 300  # seconds between evictions of idle buckets
+
+DEFAULT_FLEET_INTERVAL = 60  # seconds between polls of each hub
+DEFAULT_FLEET_MAX_IN_FLIGHT = 100  # connections (i.e. requests), across all hubs
+DEFAULT_FLEET_STATS_WINDOW = 300  # seconds, over which polls/second is measured
+
+# the kinds of entity, and the endpoints needed for each, see: GeniusHub.update()
+ENTITY_KINDS = ("zones", "devices", "issues", "version")
+ENDPOINTS_V1 = {
+    "zones": ("zones",),
+    "devices": ("devices",),
+    "issues": ("issues",),
+    "version": ("version",),
+}
+ENDPOINTS_V1_SUMMARY = {"zones": ("zones/summary",), "devices": ("devices/summary",)}
+ENDPOINTS_V3 = {
+    "zones": ("zones",),
+    "devices": ("data_manager",),
+    "issues": ("zones",),  # and the devices, via which the issues are converted
+    "version": ("auth/release",),
+}
+
+DEFAULT_SYNC_INTERVAL = 60  # seconds between polls, by a SyncGeniusHub
+
+DEFAULT_TIMING_SAMPLES = 1000  # per endpoint & phase, only if timings are enabled
+
+DEFAULT_PATH_PROBE_INTERVAL = 300  # seconds between measurements of an unused path
+DEFAULT_PATH_LATENCY_WEIGHT = 0.3  # of each new sample, in a path's mean latency
+
+DEFAULT_HEDGE_PERCENTILE = 97  # of recent latencies, after which a GET is hedged
+DEFAULT_HEDGE_BUDGET = 0.05  # the most hedges per request, i.e. 5% extra load
+DEFAULT_HEDGE_SAMPLES = 200  # recent latencies, per endpoint
+DEFAULT_HEDGE_MIN_SAMPLES = 20  # no hedging until an endpoint has this many
+
+DEFAULT_PATCH_LOG_SIZE = 1000  # patches kept by a PatchFeed, for replicas to catch up
+
+DEFAULT_SCHEDULE_CACHE_SIZE = 1024  # distinct converted schedules, per process
+
+DEFAULT_CIRCUIT_THRESHOLD = 5  # consecutive failures before a hub is deemed down
+DEFAULT_CIRCUIT_RESET = 30  # seconds before a down hub is tried again
+
 # see: https://docs.geniushub.co.uk/pages/viewpage.action?pageId=14221432
 HUB_SW_VERSIONS = {
     "Dec 31 9999": "5.3.6+",
@@ -24,10 +80,20 @@ API_STATUS_ERROR = {
     401: "The authorization information is missing or invalid.",
     404: "No zone/device with the specified ID was found "
     "(or the state property does not exist on the specified device).",
+    429: "Too many requests have been made.",
     502: "The hub is offline.",
     503: "The authorization information is invalid.",
 }
 
+API_STATUS_RETRY = {  # True if the request was not processed, so can be retried
+    400: False,
+    401: False,
+    404: False,
+    429: True,
+    502: True,
+    503: False,
+}
+
 FOOTPRINT_MODES = {1: "super-eco", 2: "eco", 3: "comfort"}
 
 # the following is from the vendor's javascript
@@ -110,10 +176,12 @@ ATTRS_ZONE = {
         "override",
         "schedule",
     ],
+    "lean_keys": ["iID", "iFlagExpectedKit", "iType"],  # the raw JSON still needed
 }
 ATTRS_DEVICE = {
     "summary_keys": ["id", "type"],
     "detail_keys": ["assignedZones", "state"],
+    "lean_keys": ["addr"],
 }
 ATTRS_ISSUE = {"summary_keys": ["description", "level"], "detail_keys": []}
 
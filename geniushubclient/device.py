@@ -3,28 +3,72 @@
 import json
 import logging
 from abc import abstractmethod
-from typing import Dict, Optional  # Any, List, Set, Tuple
+from typing import Dict, List, Optional  # Any, Set, Tuple
 
 from .const import ATTRS_DEVICE, DEVICE_HASH_TO_TYPE, STATE_ATTRS
+from .lazy import LazyData
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEVICE_SECTIONS = (  # the keys of each section of a device's v1 data (see: LazyData)
+    ("type", "assignedZones", "state"),
+    ("_state", "_config"),
+)
+_SECTION_OF_KEY = {k: idx for idx, keys in enumerate(_DEVICE_SECTIONS) for k in keys}
+
+
+def flatten_device(device) -> List[Dict]:
+    """Return a v3 device node, followed by its channels (excluding _cfg)."""
+    result = [device]
+    for channel in [x for x in device["childNodes"].values() if x["addr"] != "_cfg"]:
+        temp = dict(channel)
+        temp["addr"] = f"{device['addr']}-{channel['addr']}"
+        result.append(temp)
+    return result
+
 
 class GeniusBase:
     """The base class for any Genius object: Zone, Device or Issue."""
 
+    __slots__ = ("id", "_raw", "_hub", "_attrs", "_data", "_fingerprint")
+
     def __init__(self, entity_id, raw_json, hub, entity_attrs) -> None:
         self.id = entity_id
         self._raw = raw_json
         self._hub = hub
         self._attrs = entity_attrs
 
-        self._data = {}
+        self._data = None  # converted from self._raw, when first needed
+        self._fingerprint = None  # of the raw JSON that self._data was converted from
 
     def __str__(self) -> str:
-        return json.dumps(
-            {k: v for k, v in self.data.items() if k in self._attrs["summary_keys"]}
-        )
+        return json.dumps(self._subset(self._attrs["summary_keys"]))
+
+    def _subset(self, keys) -> Dict:
+        """Return only those keys of the data (converting only what is needed)."""
+        data = self.data
+        if isinstance(data, LazyData):
+            return data.subset(keys)
+        return {k: v for k, v in data.items() if k in keys}
+
+    def _plain_data(self) -> Dict:
+        """Return the data as a plain dict, converting all of it (if not already).
+
+        Thereafter, the data is that plain dict (until the raw JSON changes).
+        """
+        data = self.data
+        if isinstance(data, LazyData):
+            self._data = data = data.copy()
+        return data
+
+    def _slim(self) -> None:
+        """Convert all of the data, and keep only the raw JSON still needed (lean).
+
+        Thereafter, the data is a plain dict, and the raw JSON only its lean_keys.
+        """
+        self._plain_data()  # the sections of a LazyData hold the whole raw JSON
+        raw_json = self._raw
+        self._raw = {k: raw_json[k] for k in self._attrs["lean_keys"] if k in raw_json}
 
     @property
     def info(self) -> Dict:
@@ -34,13 +78,13 @@ class GeniusBase:
 
         # tip: grep -E '("bOutRequestHeat"|"bInHeatEnabled")..true'
         if self._hub.verbosity == 2:
-            return self.data
+            return self._plain_data()  # not a LazyData, for orjson (see: LazyData)
 
         keys = self._attrs["summary_keys"]
         if self._hub.verbosity == 1:
-            keys += self._attrs["detail_keys"]
+            keys = keys + self._attrs["detail_keys"]  # not +=, which mutates ATTRS
 
-        return {k: v for k, v in self.data.items() if k in keys}
+        return self._subset(keys)
 
     @property
     @abstractmethod
@@ -52,73 +96,100 @@ class GeniusBase:
 class GeniusDevice(GeniusBase):
     """The class for a Genius Device."""
 
+    __slots__ = ()
+
     def __init__(self, device_id, raw_json, hub) -> None:
         super().__init__(device_id, raw_json, hub, ATTRS_DEVICE)
 
     @property
     def data(self) -> Dict:
-        """Convert a device's v3 JSON to the v1 schema."""
-        if self._data:
+        """Convert a device's v3 JSON to the v1 schema.
+
+        Each section of the v1 data (e.g. the state) is converted only when one of
+        its keys is first read (see: LazyData).
+        """
+        if self._data is not None:
             return self._data
         if self._hub.api_version == 1:
             self._data = self._raw
             return self._data
 
-        self._data = result = {"id": self._raw["addr"]}
-
-        try:
-            node = self._raw["childValues"]
-
-            if "hash" in node:
-                dev_type = DEVICE_HASH_TO_TYPE.get(node["hash"]["val"])
-                if dev_type:
-                    result["type"] = dev_type
-            elif (
-                "SwitchBinary" in node and node["SwitchBinary"]["path"].count("/") == 3
-            ):
-                result["type"] = f"Dual Channel Receiver - Channel {result['id'][-1]}"
-            elif (
-                "ThermostatMode" in node
-                and node["ThermostatMode"]["path"].count("/") == 3
-            ):
-                result["type"] = f"Powered Room Thermostat - Channel {result['id'][-1]}"
-            elif "TEMPERATURE" in node and node["TEMPERATURE"]["path"].count("/") == 3:
-                result["type"] = f"Powered Room Thermostat - Channel {result['id'][-1]}"
-            else:
-                result["type"] = None
-
-            result["assignedZones"] = [{"name": None}]
-            if node["location"]["val"]:
-                result["assignedZones"] = [{"name": node["location"]["val"]}]
-
-            result["state"] = state = {}
-            state.update(
-                [(v, node[k]["val"]) for k, v in STATE_ATTRS.items() if k in node]
-            )
-            if "outputOnOff" in state:  # this one should be a bool
-                state["outputOnOff"] = bool(state["outputOnOff"])
-
-        except (AttributeError, LookupError, TypeError, ValueError):
-            _LOGGER.exception("Failed to convert Device %s.", result["id"])
-
-        try:
-            result["_state"] = _state = {}
-            for val in ("lastComms", "setback"):
-                if val in node:
-                    _state[val] = node[val]["val"]
-            if "WakeUp_Interval" in node:
-                _state["wakeupInterval"] = node["WakeUp_Interval"]["val"]
-
-            node = self._raw["childNodes"]["_cfg"]["childValues"]
-
-            result["_config"] = _config = {}
-            for val in ("max_sp", "min_sp", "sku"):
-                if val in node:
-                    _config[val] = node[val]["val"]
-
-        except (AttributeError, LookupError, TypeError, ValueError):
-            _LOGGER.exception("Failed to convert Device %s extras.", result["id"])
-
+        raw_json = self._raw  # the sections are converted from this (not a later) JSON
+        device_id = raw_json["addr"]
+
+        def convert_device() -> Dict:
+            result = {}
+            try:
+                node = raw_json["childValues"]
+                channel = device_id[-1]  # of a multi-channel device
+
+                if "hash" in node:
+                    dev_type = DEVICE_HASH_TO_TYPE.get(node["hash"]["val"])
+                    if dev_type:
+                        result["type"] = dev_type
+                elif (
+                    "SwitchBinary" in node
+                    and node["SwitchBinary"]["path"].count("/") == 3
+                ):
+                    result["type"] = f"Dual Channel Receiver - Channel {channel}"
+                elif (
+                    "ThermostatMode" in node
+                    and node["ThermostatMode"]["path"].count("/") == 3
+                ):
+                    result["type"] = f"Powered Room Thermostat - Channel {channel}"
+                elif (
+                    "TEMPERATURE" in node
+                    and node["TEMPERATURE"]["path"].count("/") == 3
+                ):
+                    result["type"] = f"Powered Room Thermostat - Channel {channel}"
+                else:
+                    result["type"] = None
+
+                result["assignedZones"] = [{"name": None}]
+                if node["location"]["val"]:
+                    result["assignedZones"] = [{"name": node["location"]["val"]}]
+
+                result["state"] = state = {}
+                state.update(
+                    [(v, node[k]["val"]) for k, v in STATE_ATTRS.items() if k in node]
+                )
+                if "outputOnOff" in state:  # this one should be a bool
+                    state["outputOnOff"] = bool(state["outputOnOff"])
+
+            except (AttributeError, LookupError, TypeError, ValueError):
+                _LOGGER.exception("Failed to convert Device %s.", device_id)
+
+            return result
+
+        def convert_extras() -> Dict:
+            result = {}
+            try:
+                node = raw_json["childValues"]
+
+                result["_state"] = _state = {}
+                for val in ("lastComms", "setback"):
+                    if val in node:
+                        _state[val] = node[val]["val"]
+                if "WakeUp_Interval" in node:
+                    _state["wakeupInterval"] = node["WakeUp_Interval"]["val"]
+
+                node = raw_json["childNodes"]["_cfg"]["childValues"]
+
+                result["_config"] = _config = {}
+                for val in ("max_sp", "min_sp", "sku"):
+                    if val in node:
+                        _config[val] = node[val]["val"]
+
+            except (AttributeError, LookupError, TypeError, ValueError):
+                _LOGGER.exception("Failed to convert Device %s extras.", device_id)
+
+            return result
+
+        self._data = LazyData(
+            {"id": device_id},
+            [convert_device, convert_extras],
+            _SECTION_OF_KEY,
+        )
         return self._data
 
     @property
@@ -131,5 +202,5 @@ class GeniusDevice(GeniusBase):
         """Return the primary assigned zone, which can change."""
         try:
             return self._hub.zone_by_name[self.data["assignedZones"][0]["name"]]
-        except KeyError:
+        except LookupError:  # e.g. a summary, or unassigned
             return None
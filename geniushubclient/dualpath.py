@@ -0,0 +1,216 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+
+from . import GeniusHub
+from .const import (
+    DEFAULT_CIRCUIT_RESET,
+    DEFAULT_PATH_LATENCY_WEIGHT,
+    DEFAULT_PATH_PROBE_INTERVAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+LOCAL, CLOUD = "local", "cloud"
+
+
+class _Path:
+    """The health & latency of one path to a hub."""
+
+    def __init__(self, hub) -> None:
+        self.hub = hub
+        self.healthy = True  # until proven otherwise
+        self.latency: Optional[float] = None  # the (weighted) mean of its updates
+        self.measured_at: Optional[float] = None  # time.monotonic()
+        self.failures = self.served = 0
+
+    def record_success(self, latency) -> None:
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += DEFAULT_PATH_LATENCY_WEIGHT * (latency - self.latency)
+        self.healthy, self.measured_at = True, time.monotonic()
+
+    def record_failure(self) -> None:
+        self.healthy, self.measured_at = False, time.monotonic()
+        self.failures += 1
+
+
+class DualPathHub:
+    """A hub that is reachable both locally (v3 API) and via the cloud (v1 API).
+
+    Each update is routed to the faster of the healthy paths (the local path, until
+    both have been measured), and fails over to the other path if it fails. The
+    path not in use is measured in the background every probe_interval (or, if it
+    is unhealthy, every DEFAULT_CIRCUIT_RESET seconds), so that the hub switches
+    back once it is faster (or healthy) again.
+
+    The results are in the v1 schema, whichever path served them: the zones, etc.
+    are those of the path that served the latest update, as are the zone/device
+    objects (and so any writes to them are made via that path).
+
+        hub = DualPathHub(
+            GeniusHub(hub_address, username, password), GeniusHub(hub_token)
+        )
+    """
+
+    def __init__(
+        self,
+        local: GeniusHub,
+        cloud: GeniusHub,
+        probe_interval=DEFAULT_PATH_PROBE_INTERVAL,
+    ) -> None:
+        self._paths = {LOCAL: _Path(local), CLOUD: _Path(cloud)}
+        self.probe_interval = probe_interval
+
+        self.path: Optional[str] = None  # the path that served the latest update
+        self._probes: Dict[str, asyncio.Task] = {}  # by path, those in flight
+
+    async def __aenter__(self) -> "DualPathHub":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Cancel any probes in flight, and close both hubs."""
+        probes = list(self._probes.values())
+        for probe in probes:
+            probe.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+
+        for path in self._paths.values():
+            await path.hub.close()
+
+    @property
+    def hub(self) -> GeniusHub:
+        """Return the hub (i.e. path) that served the latest update."""
+        return self._paths[self.path or LOCAL].hub
+
+    @property
+    def zones(self) -> List:
+        """Return a list of Zones known to the Hub (see: GeniusHub.zones)."""
+        return self.hub.zones
+
+    @property
+    def devices(self) -> List:
+        """Return a list of Devices known to the Hub (see: GeniusHub.devices)."""
+        return self.hub.devices
+
+    @property
+    def issues(self) -> List:
+        """Return a list of Issues known to the Hub."""
+        return self.hub.issues
+
+    @property
+    def version(self) -> Dict:
+        """Return the version of the Hub's software."""
+        return self.hub.version
+
+    @property
+    def zone_by_id(self) -> Dict:
+        """Return the Zones of the path that served the latest update, by id."""
+        return self.hub.zone_by_id
+
+    @property
+    def device_by_id(self) -> Dict:
+        """Return the Devices of the path that served the latest update, by id."""
+        return self.hub.device_by_id
+
+    @property
+    def stats(self) -> Dict[str, Dict]:
+        """Return the health, mean latency and usage of each path."""
+        return {
+            name: {
+                "healthy": path.healthy,
+                "latency": path.latency,
+                "failures": path.failures,
+                "served": path.served,
+            }
+            for name, path in self._paths.items()
+        }
+
+    def _route(self) -> List[str]:
+        """Return the paths in the order they are to be tried."""
+
+        def rank(name):
+            path = self._paths[name]
+            return (
+                not path.healthy,
+                path.latency is None and name != LOCAL,  # prefer the local, if unknown
+                path.latency or 0.0,
+            )
+
+        return sorted(self._paths, key=rank)
+
+    async def update(self, **kwargs) -> None:
+        """Update the hub via the best path, failing over to the other if need be.
+
+        The kwargs are those of GeniusHub.update().
+        """
+        routes = self._route()
+        exc = None
+
+        for name in routes:
+            try:
+                await self._update(name, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.warning("Hub update via the %s path failed: %r", name, err)
+                exc = err
+                continue
+
+            if self.path != name:
+                _LOGGER.info("Hub updates are now via the %s path.", name)
+            self.path = name
+            self._paths[name].served += 1
+            break
+
+        else:
+            raise exc
+
+        kwargs.pop("max_age", None)  # a probe is to measure the path, so it fetches
+        for name in routes:
+            if name != self.path:
+                self._probe(name, **kwargs)
+
+    async def _update(self, name, **kwargs) -> None:
+        """Update a path's hub, and record its health & latency.
+
+        The latency is recorded only if the update fetched anything (i.e. it was
+        not skipped, as per max_age).
+        """
+        path = self._paths[name]
+        fetched_at = dict(path.hub._fetched_at)
+        start = time.monotonic()
+        try:
+            await path.hub.update(**kwargs)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            path.record_failure()
+            raise
+        if path.hub._fetched_at != fetched_at:
+            path.record_success(time.monotonic() - start)
+
+    def _probe(self, name, **kwargs) -> None:
+        """Measure a path in the background, if it is due."""
+        path = self._paths[name]
+        interval = self.probe_interval if path.healthy else DEFAULT_CIRCUIT_RESET
+        if name in self._probes or (
+            path.measured_at is not None
+            and time.monotonic() - path.measured_at < interval
+        ):
+            return
+
+        async def probe() -> None:
+            try:
+                await self._update(name, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("Hub probe via the %s path failed: %r", name, err)
+            finally:
+                self._probes.pop(name, None)
+
+        self._probes[name] = asyncio.ensure_future(probe())
@@ -0,0 +1,164 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import logging
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+ADDED, CHANGED, REMOVED = "added", "changed", "removed"
+
+
+class EntityChange(NamedTuple):
+    """A change to a zone/device, as found by an update of the hub."""
+
+    kind: str  # "zones" or "devices"
+    id: Any
+    action: str  # ADDED, CHANGED or REMOVED
+    data: Dict  # the latest (v1) data of the entity
+    changes: Dict[str, Tuple[Any, Any]]  # key: (old, new), only if CHANGED
+
+
+def diff_data(old, new) -> Dict[str, Tuple[Any, Any]]:
+    """Return the (top-level) keys of an entity's data that have changed."""
+    return {
+        k: (old.get(k), new.get(k)) for k in {**old, **new} if old.get(k) != new.get(k)
+    }
+
+
+def coalesce(prev, change) -> Optional[EntityChange]:
+    """Merge a change into the previous (undelivered) change of the same entity.
+
+    Return None if the changes cancel out (e.g. an entity added, then removed).
+    """
+    if change.action == REMOVED:
+        return None if prev.action == ADDED else change
+    if prev.action != CHANGED or change.action != CHANGED:
+        return change._replace(action=ADDED, changes={})  # it is new to the listener
+
+    changes = dict(prev.changes)
+    for key, (old, new) in change.changes.items():
+        changes[key] = (changes[key][0] if key in changes else old, new)
+    changes = {k: v for k, v in changes.items() if v[0] != v[1]}
+    return change._replace(changes=changes) if changes else None
+
+
+class Subscription:
+    """An async iterator of the changes to a hub's zones/devices.
+
+    Changes are delivered in the order they were found, but a listener that falls
+    behind receives one (coalesced) change per entity, with its latest data, rather
+    than a backlog of every change. A hub holds its subscriptions weakly, so one
+    that is no longer referenced is dropped.
+
+        async for change in hub.subscribe(kinds={"zones"}):
+            print(change.id, change.changes)
+    """
+
+    def __init__(self, kinds=None) -> None:
+        self.kinds = kinds
+        self._pending: Dict[Tuple[str, Any], EntityChange] = OrderedDict()
+        self._ready: Optional[asyncio.Event] = None  # created on the loop
+        self._closed = False
+
+        self.coalesced = 0  # changes merged into an undelivered change
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> EntityChange:
+        while not self._pending:
+            if self._closed:
+                raise StopAsyncIteration
+            if self._ready is None:
+                self._ready = asyncio.Event()
+            self._ready.clear()
+            await self._ready.wait()
+        return self._pending.popitem(last=False)[1]
+
+    @property
+    def pending(self) -> int:
+        """Return the number of changes not yet delivered."""
+        return len(self._pending)
+
+    @property
+    def closed(self) -> bool:
+        """Return True if the subscription has been closed."""
+        return self._closed
+
+    def close(self) -> None:
+        """Stop the subscription, once the pending changes have been delivered."""
+        self._closed = True
+        if self._ready is not None:
+            self._ready.set()
+
+    def publish(self, changes) -> None:
+        """Queue changes for delivery, coalescing any with an undelivered change."""
+        for change in changes:
+            if self._closed or (self.kinds and change.kind not in self.kinds):
+                continue
+
+            key = (change.kind, change.id)
+            if key in self._pending:
+                self.coalesced += 1
+                change = coalesce(self._pending[key], change)
+                if change is None:
+                    del self._pending[key]
+                    continue
+            self._pending[key] = change
+
+        if self._pending and self._ready is not None:
+            self._ready.set()
+
+
+class ChangeListeners:
+    """The listeners of a hub (callbacks & subscriptions), all held weakly."""
+
+    def __init__(self) -> None:
+        self._subscriptions = weakref.WeakSet()
+        self._callbacks: List[Tuple[weakref.ref, Any]] = []  # (ref, kinds)
+
+    def __bool__(self) -> bool:
+        self._callbacks = [(r, k) for r, k in self._callbacks if r() is not None]
+        return bool(self._callbacks) or any(not s.closed for s in self._subscriptions)
+
+    def add(self, callback=None, kinds=None) -> Optional[Subscription]:
+        """Add a callback, or (if there is none) return a new Subscription."""
+        if callback is None:
+            subscription = Subscription(kinds)
+            self._subscriptions.add(subscription)
+            return subscription
+
+        if hasattr(callback, "__self__"):  # a bound method, held via its object
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = weakref.ref(callback)
+        self._callbacks.append((ref, kinds))
+        return None
+
+    def remove(self, listener) -> None:
+        """Remove a callback or a Subscription."""
+        if isinstance(listener, Subscription):
+            listener.close()
+            self._subscriptions.discard(listener)
+        else:
+            self._callbacks = [(r, k) for r, k in self._callbacks if r() != listener]
+
+    def publish(self, changes) -> None:
+        """Deliver changes to every listener (a failing callback is logged)."""
+        for subscription in list(self._subscriptions):
+            subscription.publish(changes)
+
+        for ref, kinds in list(self._callbacks):
+            callback = ref()
+            if callback is None:
+                continue
+            for change in changes:
+                if kinds and change.kind not in kinds:
+                    continue
+                try:
+                    callback(change)
+                except Exception:  # noqa: B902; a listener must not break updates
+                    _LOGGER.exception("A change listener failed: %r", callback)
@@ -0,0 +1,163 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import aiohttp
+
+from . import GeniusHub
+from .const import (
+    DEFAULT_FLEET_INTERVAL,
+    DEFAULT_FLEET_MAX_IN_FLIGHT,
+    DEFAULT_FLEET_STATS_WINDOW,
+    DEFAULT_POOL_DNS_TTL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GeniusFleet:
+    """Poll many hubs, sharing one connection pool, with staggered start times.
+
+    Each hub is polled once per interval, with the start times of the hubs spread
+    evenly across the interval (rather than all at once). No more than
+    max_in_flight requests are in flight across the fleet, as that is the limit of
+    the shared connection pool.
+    """
+
+    def __init__(
+        self,
+        interval=DEFAULT_FLEET_INTERVAL,
+        max_in_flight=DEFAULT_FLEET_MAX_IN_FLIGHT,
+        session=None,
+    ) -> None:
+        self.interval = interval
+
+        self._owns_session = session is None
+        self._session = session or aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=max_in_flight,
+                use_dns_cache=True,
+                ttl_dns_cache=DEFAULT_POOL_DNS_TTL,
+            )
+        )
+
+        self.hubs: Dict[str, GeniusHub] = {}
+        self._healthy: Dict[str, bool] = {}
+        self._polls: Dict[str, asyncio.Task] = {}  # those in flight
+
+        self._task: Optional[asyncio.Task] = None
+        self._completed = deque()  # time.monotonic() of recently completed polls
+        self._lags = deque(maxlen=1000)  # seconds late, of recent polls
+        self._skipped = 0  # polls not started, as the hub's last poll was in flight
+
+    async def __aenter__(self) -> "GeniusFleet":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def add_hub(self, hub_id, username=None, password=None, **kwargs) -> GeniusHub:
+        """Add a hub to the fleet (it is polled from the next interval)."""
+        if hub_id in self.hubs:
+            raise ValueError(f"Hub '{hub_id}' is already in the fleet.")
+
+        hub = GeniusHub(
+            hub_id, username, password, session=self._session, pooled=True, **kwargs
+        )
+        self.hubs[hub_id] = hub
+        return hub
+
+    def remove_hub(self, hub_id) -> None:
+        """Remove a hub from the fleet."""
+        del self.hubs[hub_id]
+        self._healthy.pop(hub_id, None)
+        if hub_id in self._polls:
+            self._polls.pop(hub_id).cancel()
+
+    def start(self) -> None:
+        """Start polling the hubs."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling the hubs (and cancel any polls in flight)."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        polls, self._polls = list(self._polls.values()), {}
+        for poll in polls:
+            poll.cancel()
+        await asyncio.gather(*polls, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Stop polling, and close the session if it was created by the fleet."""
+        await self.stop()
+        if self._owns_session and not self._session.closed:
+            await self._session.close()
+
+    @property
+    def stats(self) -> Dict:
+        """Return the fleet's health, throughput and lag behind schedule."""
+        self._prune_completed(time.monotonic())
+
+        return {
+            "hubs": len(self.hubs),
+            "hubs_healthy": sum(self._healthy.get(h, False) for h in self.hubs),
+            "polls_in_flight": len(self._polls),
+            "polls_per_second": len(self._completed) / DEFAULT_FLEET_STATS_WINDOW,
+            "polls_skipped": self._skipped,
+            "lag_mean": sum(self._lags) / len(self._lags) if self._lags else 0.0,
+            "lag_max": max(self._lags, default=0.0),
+        }
+
+    def _prune_completed(self, now) -> None:
+        """Forget the polls that completed before the stats window."""
+        while self._completed and self._completed[0] < now - DEFAULT_FLEET_STATS_WINDOW:
+            self._completed.popleft()
+
+    async def _run(self) -> None:
+        """Start a poll of each hub at its slot in each interval."""
+        cycle_start = time.monotonic()
+
+        while True:
+            hub_ids = list(self.hubs)
+            for idx, hub_id in enumerate(hub_ids):
+                due = cycle_start + idx * self.interval / len(hub_ids)
+                await asyncio.sleep(max(0, due - time.monotonic()))
+
+                if hub_id not in self.hubs:  # it was removed during this interval
+                    continue
+                if hub_id in self._polls:
+                    self._skipped += 1
+                    _LOGGER.warning("Hub %s: the last poll is still in flight.", hub_id)
+                    continue
+
+                self._lags.append(time.monotonic() - due)
+                self._polls[hub_id] = asyncio.ensure_future(self._poll(hub_id))
+
+            cycle_start += self.interval
+            if not hub_ids:
+                await asyncio.sleep(max(0, cycle_start - time.monotonic()))
+            elif cycle_start < time.monotonic() - self.interval:
+                _LOGGER.warning("The fleet is more than an interval behind schedule.")
+                cycle_start = time.monotonic()
+
+    async def _poll(self, hub_id) -> None:
+        try:
+            await self.hubs[hub_id].update()
+        except Exception:  # noqa: B902; a poll must not fail silently
+            _LOGGER.exception("Hub %s: the poll failed.", hub_id)
+            self._healthy[hub_id] = False
+        else:
+            self._healthy[hub_id] = True
+        finally:
+            self._polls.pop(hub_id, None)
+            now = time.monotonic()
+            self._completed.append(now)
+            self._prune_completed(now)  # even if the stats are never read
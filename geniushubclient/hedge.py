@@ -0,0 +1,133 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from .const import (
+    DEFAULT_HEDGE_BUDGET,
+    DEFAULT_HEDGE_MIN_SAMPLES,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_HEDGE_SAMPLES,
+)
+from .timing import RollingHistogram, endpoint_of
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAX_CREDIT = 10  # hedges that can be saved up, e.g. for a burst of slow requests
+
+
+class HedgePolicy:
+    """When to hedge a request: send a duplicate if the first is slow to answer.
+
+    A request is hedged if it has not answered within the percentile of the
+    recent latencies of its endpoint (once there are min_samples of them). The
+    first response wins, and the other request is cancelled (a request that lost
+    to its hedge is still a sample, of at least the time it took).
+
+    Each request earns budget hedges (e.g. 0.05), and each hedge spends one, so
+    that hedging adds no more than that fraction of extra requests. As 100 -
+    percentile (%) of requests are slower than the percentile, the budget must be
+    larger than that, or it is spent on ordinary requests, not the stragglers.
+    """
+
+    def __init__(
+        self,
+        percentile=DEFAULT_HEDGE_PERCENTILE,
+        budget=DEFAULT_HEDGE_BUDGET,
+        samples=DEFAULT_HEDGE_SAMPLES,
+        min_samples=DEFAULT_HEDGE_MIN_SAMPLES,
+    ) -> None:
+        self.percentile = percentile
+        self.budget = budget
+        self._samples = samples
+        self._min_samples = min_samples
+
+        self._latencies: Dict[str, RollingHistogram] = {}  # by endpoint
+        self._credit = 0.0
+
+        self.requests = self.hedges = self.hedges_won = 0
+
+    def delay(self, url) -> Optional[float]:
+        """Return the delay after which a request is hedged (None if never)."""
+        latencies = self._latencies.get(endpoint_of(url))
+        if latencies is None or latencies.count < self._min_samples:
+            return None
+        return latencies.percentile(self.percentile)
+
+    def record(self, url, latency) -> None:
+        """Record the latency of a (successful) request."""
+        endpoint = endpoint_of(url)
+        if endpoint not in self._latencies:
+            self._latencies[endpoint] = RollingHistogram(self._samples)
+        self._latencies[endpoint].add(latency)
+
+    def earn(self) -> None:
+        """Earn the budget for a hedge, for a request."""
+        self.requests += 1
+        self._credit = min(_MAX_CREDIT, self._credit + self.budget)
+
+    def spend(self) -> bool:
+        """Spend the budget for a hedge, return False if there is insufficient."""
+        if self._credit < 1:
+            return False
+        self._credit -= 1
+        self.hedges += 1
+        return True
+
+    @property
+    def stats(self) -> Dict:
+        """Return the number of requests, hedges and hedges that won."""
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedges_won": self.hedges_won,
+        }
+
+    async def request(self, url, send):
+        """Send a request (a coroutine function), hedging it if it is slow.
+
+        Return the first response, or raise the first request's exception if both
+        fail.
+        """
+        self.earn()
+
+        async def timed(hedge=False):
+            start = time.monotonic()
+            try:
+                result = await send()
+            except asyncio.CancelledError:  # i.e. it lost to its hedge
+                if not hedge:  # it took at least this long, so is still a sample
+                    self.record(url, time.monotonic() - start)
+                raise
+            self.record(url, time.monotonic() - start)
+            return result
+
+        first = asyncio.ensure_future(timed())
+        tasks = [first]
+        try:
+            delay = self.delay(url)
+            if delay is not None:
+                done, _ = await asyncio.wait([first], timeout=delay)
+                if not done and self.spend():
+                    _LOGGER.debug("request(url=%s): hedged after %.3f s.", url, delay)
+                    tasks.append(asyncio.ensure_future(timed(hedge=True)))
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in [t for t in tasks if t in done]:
+                    if task.exception() is None:
+                        if task is not first:
+                            self.hedges_won += 1
+                        return task.result()
+
+            return first.result()  # both failed
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,171 @@
+"""Python client library for the Genius Hub API."""
+
+import copy
+import logging
+from typing import Callable, Dict, List
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LazyData(dict):
+    """A dict of converted (v1) data, whose values are converted when first read.
+
+    The conversion is in sections (e.g. a zone's schedules), each a callable that
+    returns a dict of some keys (section_of must include every key a section can
+    return), and a section is converted (once) only when one of its keys is read.
+    Iterating over the dict (or comparing, copying, or serialising it with json)
+    converts every section. Either way, the keys are in the same order as if the
+    sections had been converted in turn.
+
+    A dict subclass is serialised by orjson from its own storage (i.e. without
+    the sections not yet converted), unless OPT_PASSTHROUGH_SUBCLASS is used, as
+    it is by codec.json_dumps(). So, what is handed out (e.g. by an entity's info)
+    is a plain copy().
+    """
+
+    __slots__ = ("_eager", "_sections", "_converted", "_section_of", "_last")
+
+    def __init__(
+        self, eager, sections: List[Callable[[], Dict]], section_of: Dict[str, int]
+    ) -> None:
+        dict.__init__(self, eager)
+        self._eager = eager  # the keys that are not converted lazily
+        self._sections = sections
+        self._converted: List = [None] * len(sections)  # the dict of each section
+        self._section_of = section_of  # key: index of the section it is in
+        self._last = -1  # the index of the last section converted, so far
+
+    def _convert(self, idx) -> None:
+        """Convert a section (if not already converted), keeping the key order."""
+        if self._converted[idx] is not None:
+            return
+        self._converted[idx] = section = self._sections[idx]()
+
+        if idx > self._last:  # its keys go after those already converted
+            self._last = idx
+            dict.update(self, section)
+            return
+
+        dict.clear(self)  # otherwise, rebuild the dict in order
+        dict.update(self, self._eager)
+        for converted in self._converted:
+            if converted:
+                dict.update(self, converted)
+
+    def _convert_all(self) -> None:
+        if None in self._converted:
+            for idx in range(len(self._sections)):
+                self._convert(idx)
+
+    def _convert_key(self, key) -> None:
+        idx = self._section_of.get(key)
+        if idx is not None:  # otherwise, it is not converted lazily (if at all)
+            self._convert(idx)
+
+    def subset(self, keys) -> Dict:
+        """Return a dict of only those keys (that are present), in the same order.
+
+        Only the sections with those keys are converted.
+        """
+        section_of = self._section_of
+        for idx in sorted({section_of[k] for k in keys if k in section_of}):
+            self._convert(idx)
+        return {k: v for k, v in dict.items(self) if k in keys}
+
+    def __getitem__(self, key):
+        self._convert_key(key)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        self._convert_key(key)
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        self._convert_key(key)
+        return dict.get(self, key, default)
+
+    def __iter__(self):
+        self._convert_all()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._convert_all()
+        return dict.__len__(self)
+
+    def __bool__(self) -> bool:
+        return True  # there is always an id, and it is not converted lazily
+
+    def keys(self):
+        self._convert_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._convert_all()
+        return dict.values(self)
+
+    def items(self):
+        self._convert_all()
+        return dict.items(self)
+
+    def __reversed__(self):
+        self._convert_all()
+        return dict.__reversed__(self)
+
+    def __eq__(self, other) -> bool:
+        self._convert_all()
+        if isinstance(other, LazyData):
+            other._convert_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        self._convert_all()
+        if isinstance(other, LazyData):
+            other._convert_all()
+        return dict.__ne__(self, other)
+
+    def __or__(self, other) -> Dict:
+        self._convert_all()
+        return dict.__or__(self, other)
+
+    def __ror__(self, other) -> Dict:
+        self._convert_all()
+        return dict.__ror__(self, other)
+
+    __hash__ = None  # as for a dict
+
+    def __repr__(self) -> str:
+        self._convert_all()
+        return dict.__repr__(self)
+
+    def copy(self) -> Dict:
+        self._convert_all()
+        return dict(dict.items(self))
+
+    def __copy__(self) -> Dict:
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> Dict:
+        return copy.deepcopy(self.copy(), memo)
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+    def _mutator(name):  # a change is made only once every section is converted
+        method = getattr(dict, name)
+
+        def mutate(self, *args, **kwargs):
+            self._convert_all()
+            return method(self, *args, **kwargs)
+
+        mutate.__name__ = name
+        return mutate
+
+    __setitem__ = _mutator("__setitem__")
+    __delitem__ = _mutator("__delitem__")
+    __ior__ = _mutator("__ior__")
+    clear = _mutator("clear")
+    pop = _mutator("pop")
+    popitem = _mutator("popitem")
+    setdefault = _mutator("setdefault")
+    update = _mutator("update")
+    del _mutator
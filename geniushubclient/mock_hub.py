@@ -0,0 +1,388 @@
+"""A mock Genius Hub (v3 & v1 APIs), for testing the client without a real hub.
+
+Any number of virtual hubs can be served by one MockHubServer, each either under
+its own path (e.g. http://127.0.0.1:8080/hub-1/v3/zones), or on its own port (e.g.
+http://127.0.0.1:1223/v3/zones). Point a GeniusHub at one via its base_url:
+
+    server = MockHubServer()
+    server.add_hub("hub-1", MockHub(latency=0.05))
+    await server.start(port=8080)
+
+    hub = GeniusHub("hub-1", "username", "password", base_url=server.url("hub-1"))
+
+To serve many virtual hubs (e.g. for a load test) from the command line:
+
+    python -m geniushubclient.mock_hub --hubs 1000 --port 8080 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import copy
+import logging
+import random
+from hashlib import sha256
+from typing import Dict, List, Optional
+
+import aiohttp
+from aiohttp import web
+
+from . import GeniusHubBase, GeniusTestHub
+from .codec import json_fingerprint
+from .const import MODE_TO_IMODE, ZONE_MODE
+
+_LOGGER = logging.getLogger(__name__)
+
+# v3 (local) endpoints, by path: (method, endpoint)
+V3_ROUTES = (
+    ("GET", "zones"),
+    ("GET", "data_manager"),
+    ("GET", "auth/release"),
+    ("PATCH", "zone/{zone_id}"),
+)
+# v1 (cloud) endpoints
+V1_ROUTES = (
+    ("GET", "zones"),
+    ("GET", "zones/summary"),
+    ("GET", "devices"),
+    ("GET", "devices/summary"),
+    ("GET", "issues"),
+    ("GET", "version"),
+    ("PUT", "zones/{zone_id}/mode"),
+    ("POST", "zones/{zone_id}/override"),
+)
+
+
+def default_zones() -> List[Dict]:
+    """Return the v3 zones of a small house: a manager, a radiator & hot water."""
+
+    def zone(zone_id, name, zone_type) -> Dict:
+        return {
+            "iID": zone_id,
+            "strName": name,
+            "iType": zone_type,
+            "iMode": 2,
+            "lOptions": 0,
+            "bIsActive": 1,
+            "bInHeatEnabled": 0,
+            "bOutRequestHeat": 0,
+            "fBoostSP": 0,
+            "fPV": 19.5,
+            "fSP": 16.0,
+            "iBoostTimeRemaining": 0,
+            "iFlagExpectedKit": 517 if zone_type == 3 else 0,
+            "strBuildDate": "Jan 16 2020",
+            "zoneSubType": 1,
+            "lstIssues": [],
+            "objFootprint": {
+                "bIsNight": 0,
+                "fFootprintAwaySP": 14.0,
+                "iFootprintTmNightStart": 75600,
+                "iProfile": 1,
+                "lstSP": [
+                    {"fSP": 16.0, "iDay": day, "iTm": tm}
+                    for day in range(7)
+                    for tm in (0, 75600)
+                ],
+                "objReactive": {"fActivityLevel": 0.0},
+            },
+            "objTimer": [
+                {"fSP": sp, "iDay": day, "iTm": tm}
+                for day in range(7)
+                for sp, tm in ((14.0, -1), (20.0, 25200), (14.0, 32400))
+            ],
+            "trigger": {"reactive": 0, "output": 0},
+            "zoneReactive": {"fActivityLevel": 0},
+        }
+
+    return [
+        zone(0, "My House", 1),
+        zone(1, "Lounge", 3),
+        zone(2, "Hot Water", 5),
+    ]
+
+
+def default_data_manager() -> Dict:
+    """Return the v3 data_manager of a small house (one radiator valve)."""
+
+    def value(val) -> Dict:
+        return {"path": "/Genius/2", "val": val}
+
+    return {
+        "error": 0,
+        "data": {
+            "addr": "root",
+            "childValues": {},
+            "childNodes": {
+                "WeatherData": {"addr": "WeatherData", "childNodes": {}},
+                "Genius": {
+                    "addr": "Genius",
+                    "childValues": {},
+                    "childNodes": {
+                        "1": {"addr": "1", "childNodes": {}, "childValues": {}},
+                        "2": {
+                            "addr": "2",
+                            "childValues": {
+                                "hash": value("Danfoss/eTRV0100"),
+                                "location": value("Lounge"),
+                                "Battery": value(100),
+                                "HEATING_1": value(16.0),
+                                "TEMPERATURE": value(19.5),
+                            },
+                            "childNodes": {
+                                "_cfg": {
+                                    "addr": "_cfg",
+                                    "childNodes": {},
+                                    "childValues": {"sku": value("da-wrv-e")},
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+
+class MockHub:
+    """A virtual Genius Hub: its credentials, state (fixtures) and latency.
+
+    latency is the delay before each response, in seconds: either a number, a
+    (min, max) tuple for a uniformly random delay, or a callable that returns one
+    (e.g. to simulate a long tail). The v1 fixtures, if not given,
+    are converted from the v3 fixtures by the client library itself (once for each
+    state of the hub, not for every request).
+    """
+
+    def __init__(
+        self,
+        username="username",
+        password="password",
+        token="token",
+        zones=None,
+        data_manager=None,
+        release="5.3.6",
+        uid="0x0123456789ABCDEF",
+        v1=None,
+        latency=0.0,
+    ) -> None:
+        self.username = username
+        self.password = sha256((username + password).encode("utf-8")).hexdigest()
+        self.token = token
+        self.latency = latency
+
+        self.zones = zones if zones is not None else default_zones()
+        self.data_manager = data_manager or default_data_manager()
+        self.release = {"error": 0, "data": {"release": release, "UID": uid}}
+        self._v1 = v1  # by endpoint
+        self._v1_view: Dict[str, Dict] = {}  # converted from the v3 state, by endpoint
+        self._v1_fingerprint = None  # of the v3 state that _v1_view is of
+
+        self.requests: Dict[str, int] = {}  # count, by endpoint
+
+    async def delay(self) -> None:
+        """Wait for the hub's latency."""
+        if callable(self.latency):
+            await asyncio.sleep(self.latency())
+        elif isinstance(self.latency, tuple):
+            await asyncio.sleep(random.uniform(*self.latency))
+        elif self.latency:
+            await asyncio.sleep(self.latency)
+
+    def is_authorized(self, request, api_version) -> bool:
+        """Return True if the request has the hub's credentials."""
+        header = request.headers.get("Authorization", "")
+        if api_version == 1:
+            return header == f"Bearer {self.token}"
+        try:
+            auth = aiohttp.BasicAuth.decode(header)
+        except ValueError:
+            return False
+        return auth.login == self.username and auth.password == self.password
+
+    async def v1(self, endpoint) -> Dict:
+        """Return a v1 response (by default, converted from the v3 state)."""
+        if self._v1 is not None:
+            return self._v1[endpoint]
+
+        # the state may be changed by a write, or directly (e.g. by a load test)
+        fingerprint = json_fingerprint([self.zones, self.data_manager])
+        if fingerprint != self._v1_fingerprint:
+            self._v1_view = await self._convert_v1()
+            self._v1_fingerprint = fingerprint
+        return self._v1_view[endpoint]
+
+    async def _convert_v1(self) -> Dict[str, Dict]:
+        """Return the v1 responses of every endpoint, converted from the v3 state."""
+        hub = GeniusTestHub(
+            copy.deepcopy(self.zones),
+            GeniusHubBase._devices_via_v3_data_mgr(copy.deepcopy(self.data_manager)),
+        )
+        await hub.update()
+
+        hub.verbosity = 0
+        view = {"zones/summary": hub.zones, "devices/summary": hub.devices}
+        hub.verbosity = 1
+        view.update(
+            zones=hub.zones, devices=hub.devices, issues=hub.issues, version=hub.version
+        )
+        return view
+
+    def patch_zone(self, zone_id, data) -> Optional[Dict]:
+        """Apply a v3 PATCH to a zone, and return the zone (None if not found)."""
+        for zone in self.zones:
+            if zone["iID"] == zone_id:
+                zone.update(data)
+                return zone
+        return None
+
+    def set_mode(self, zone_id, mode) -> Optional[Dict]:
+        """Apply a v1 mode change to a zone."""
+        return self.patch_zone(zone_id, {"iMode": MODE_TO_IMODE[mode]})
+
+    def set_override(self, zone_id, data) -> Optional[Dict]:
+        """Apply a v1 override to a zone."""
+        return self.patch_zone(
+            zone_id,
+            {
+                "iMode": ZONE_MODE.Boost,
+                "fBoostSP": data["setpoint"],
+                "iBoostTimeRemaining": data["duration"],
+            },
+        )
+
+
+class MockHubServer:
+    """An aiohttp server for any number of virtual hubs (by path, or by port)."""
+
+    def __init__(self, host="127.0.0.1") -> None:
+        self.host = host
+        self.hubs: Dict[str, MockHub] = {}
+        self._hub_by_port: Dict[int, MockHub] = {}
+
+        self._app = web.Application()
+        for prefix in ("/{hub_key}", ""):
+            for version, routes in (("v3", V3_ROUTES), ("v1", V1_ROUTES)):
+                for method, endpoint in routes:
+                    self._app.router.add_route(
+                        method,
+                        f"{prefix}/{version}/{endpoint}",
+                        self._handler(version, endpoint),
+                    )
+
+        self._runner = web.AppRunner(self._app, access_log=None)
+        self._port = None
+
+    async def __aenter__(self) -> "MockHubServer":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+    def add_hub(self, key, hub=None, port=None) -> MockHub:
+        """Add a virtual hub, served under /{key}/ (and at / on port, if given)."""
+        hub = hub or MockHub()
+        self.hubs[key] = hub
+        if port:
+            self._hub_by_port[port] = hub
+        return hub
+
+    def url(self, key) -> str:
+        """Return the base_url of a virtual hub (served by path)."""
+        return f"http://{self.host}:{self._port}/{key}"
+
+    async def start(self, port=0) -> None:
+        """Start serving on port (any free port if 0), and on each hub's own port."""
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, self.host, port)
+        await site.start()
+        self._port = site._server.sockets[0].getsockname()[1]
+
+        for hub_port in self._hub_by_port:
+            await web.TCPSite(self._runner, self.host, hub_port).start()
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        await self._runner.cleanup()
+
+    def _hub_of(self, request) -> Optional[MockHub]:
+        if "hub_key" in request.match_info:
+            return self.hubs.get(request.match_info["hub_key"])
+        port = request.transport.get_extra_info("sockname")[1]
+        return self._hub_by_port.get(port)
+
+    def _handler(self, version, endpoint):
+        async def handler(request) -> web.Response:
+            hub = self._hub_of(request)
+            if hub is None:
+                raise web.HTTPNotFound()
+
+            hub.requests[f"{version}/{endpoint}"] = (
+                hub.requests.get(f"{version}/{endpoint}", 0) + 1
+            )
+            await hub.delay()
+
+            if not hub.is_authorized(request, 1 if version == "v1" else 3):
+                raise web.HTTPUnauthorized()
+
+            if version == "v1":
+                result = await self._v1(hub, request, endpoint)
+            else:
+                result = await self._v3(hub, request, endpoint)
+
+            if result is None:
+                raise web.HTTPNotFound()
+            return web.json_response(result)
+
+        return handler
+
+    @staticmethod
+    async def _v3(hub, request, endpoint) -> Optional[Dict]:
+        if endpoint == "zones":
+            return {"error": 0, "data": hub.zones}
+        if endpoint == "data_manager":
+            return hub.data_manager
+        if endpoint == "auth/release":
+            return hub.release
+
+        zone = hub.patch_zone(int(request.match_info["zone_id"]), await request.json())
+        return {"error": 0, "data": zone} if zone else None
+
+    @staticmethod
+    async def _v1(hub, request, endpoint) -> Optional[Dict]:
+        if request.method == "GET":
+            return await hub.v1(endpoint)
+
+        zone_id = int(request.match_info["zone_id"])
+        if endpoint == "zones/{zone_id}/mode":
+            zone = hub.set_mode(zone_id, await request.json())
+        else:
+            zone = hub.set_override(zone_id, await request.json())
+        return {"error": 0, "data": {}} if zone else None
+
+
+async def _serve(args) -> None:
+    server = MockHubServer(args.host)
+    for idx in range(args.hubs):
+        server.add_hub(f"hub-{idx}", MockHub(latency=args.latency))
+
+    await server.start(args.port)
+    print(f"Serving {args.hubs} hub(s), e.g. at: {server.url('hub-0')}")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve virtual Genius Hubs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--hubs", type=int, default=1, help="number of hubs")
+    parser.add_argument("--latency", type=float, default=0.0, help="in seconds")
+
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,123 @@
+"""Python client library for the Genius Hub API."""
+
+import copy
+import logging
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .const import DEFAULT_PATCH_LOG_SIZE
+from .events import ADDED, REMOVED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Delta(NamedTuple):
+    """The patches a replica needs to catch up (or a snapshot, if it cannot)."""
+
+    seq: int  # the sequence number of the latest patch
+    patches: List[Tuple[int, List[Dict]]]  # (seq, ops), since the replica's seq
+    snapshot: Optional[Dict]  # the whole state, if the patches are not in the log
+
+
+def _pointer(*tokens) -> str:
+    """Return a JSON pointer (RFC 6901) to a location in the state."""
+    return "".join("/" + str(t).replace("~", "~0").replace("/", "~1") for t in tokens)
+
+
+def _tokens(pointer) -> List[str]:
+    """Return the (unescaped) reference tokens of a JSON pointer."""
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer.split("/")[1:]]
+
+
+def change_to_ops(change) -> List[Dict]:
+    """Return the JSON Patch (RFC 6902) ops of an EntityChange."""
+    path = _pointer(change.kind, change.id)
+    if change.action == ADDED:
+        return [{"op": "add", "path": path, "value": change.data}]
+    if change.action == REMOVED:
+        return [{"op": "remove", "path": path}]
+
+    ops = []
+    for key, (old, new) in change.changes.items():
+        path = _pointer(change.kind, change.id, key)
+        if key not in change.data:
+            ops.append({"op": "remove", "path": path})
+        elif old is None:  # an add replaces the value, if there is one
+            ops.append({"op": "add", "path": path, "value": new})
+        else:
+            ops.append({"op": "replace", "path": path, "value": new})
+    return ops
+
+
+def apply_patch(state, ops) -> Dict:
+    """Apply JSON Patch ops (add, remove & replace only) to a state, in place."""
+    for op in ops:
+        *parents, last = _tokens(op["path"])
+        target = state
+        for token in parents:
+            target = target[token]
+        if op["op"] == "remove":
+            del target[last]
+        else:  # "add" or "replace"
+            target[last] = copy.deepcopy(op["value"])
+    return state
+
+
+class PatchFeed:
+    """A feed of the changes to a hub's state, as sequence-numbered JSON Patches.
+
+    The state is the (v1) data of each zone & device, by id, i.e. {"zones":
+    {"1": {...}}, "devices": {"2-1": {...}}}. Each change to a zone/device (see:
+    GeniusHub.subscribe) is a patch, with the next sequence number, and the latest
+    size patches are kept. A replica that has applied the patches up to seq can
+    catch up via patches_since(seq), or resync from the snapshot, if it has fallen
+    too far behind.
+
+        feed = PatchFeed(hub)
+        await hub.update()
+        delta = feed.patches_since(replica_seq)
+    """
+
+    def __init__(self, hub, size=DEFAULT_PATCH_LOG_SIZE) -> None:
+        self.seq = 0
+        self._log: deque = deque(maxlen=size)  # (seq, ops)
+
+        self._state: Dict[str, Dict[str, Any]] = {"zones": {}, "devices": {}}
+        for kind, objs in (("zones", hub.zone_objs), ("devices", hub.device_objs)):
+            for entity in objs:  # the state of the hub, as of its latest update
+                self._state[kind][str(entity.id)] = entity._plain_data()
+
+        hub.subscribe(self._on_change)  # the hub holds the feed weakly
+
+    def _on_change(self, change) -> None:
+        """Append the patch of a change to the log, and apply it to the state."""
+        ops = change_to_ops(change)
+        if not ops:
+            return
+
+        self.seq += 1
+        self._log.append((self.seq, ops))
+
+        entities = self._state[change.kind]
+        if change.action == REMOVED:
+            entities.pop(str(change.id), None)
+        else:
+            entities[str(change.id)] = change.data
+
+    def snapshot(self) -> Dict:
+        """Return (a copy of) the whole state, as at the latest patch."""
+        return copy.deepcopy(self._state)
+
+    def patches_since(self, seq=None) -> Delta:
+        """Return the patches after seq, or a snapshot if they are not all logged.
+
+        A replica with no state (seq is None), or at a seq that is ahead of the
+        feed (e.g. the feed was restarted), is also given a snapshot.
+        """
+        if seq == self.seq:
+            return Delta(self.seq, [], None)
+        if seq is not None and 0 <= seq < self.seq and self._log[0][0] <= seq + 1:
+            return Delta(self.seq, [p for p in self._log if p[0] > seq], None)
+
+        _LOGGER.debug("patches_since(seq=%s): a snapshot, at %s", seq, self.seq)
+        return Delta(self.seq, [], self.snapshot())
@@ -0,0 +1,163 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime as dt
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from .const import (
+    DEFAULT_BURST_PER_HOST,
+    DEFAULT_BURST_PER_TOKEN,
+    DEFAULT_RATE_LIMIT_PRUNE,
+    DEFAULT_RATE_PER_HOST,
+    DEFAULT_RATE_PER_TOKEN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Return the number of seconds in a Retry-After header (None if invalid)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - dt.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Allow rate requests per second, with bursts of up to burst requests.
+
+    A bucket may be shared by the event loops of many threads (e.g. of each
+    SyncGeniusHub), so its state is changed only under a lock.
+    """
+
+    def __init__(self, rate, burst) -> None:
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return 0, or return the seconds until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def is_idle(self, now) -> bool:
+        """Return True if the bucket is full (and not blocked), i.e. as if new."""
+        with self._lock:
+            return (
+                now >= self._blocked_until
+                and self._tokens + (now - self._updated_at) * self.rate >= self.burst
+            )
+
+    async def acquire(self) -> None:
+        """Wait until a request is allowed."""
+        while (delay := self._reserve()) > 0:
+            await asyncio.sleep(delay)
+
+    def block(self, seconds) -> None:
+        """Allow no requests for the next number of seconds (e.g. after a 429)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+class RateLimiter:
+    """Limit the rate of requests to the v1 API, both per token and per host.
+
+    A single instance is shared by every GeniusService that uses the v1 API (see:
+    SHARED_RATE_LIMITER), so that all the hubs of a process stay within the quota.
+    It is thread-safe, as those hubs may be polled from many threads (and loops).
+
+    A bucket that is full again is the same as a new one, so idle buckets (e.g. of
+    tokens no longer used) are evicted every prune_interval seconds.
+    """
+
+    def __init__(
+        self,
+        rate_per_token=DEFAULT_RATE_PER_TOKEN,
+        burst_per_token=DEFAULT_BURST_PER_TOKEN,
+        rate_per_host=DEFAULT_RATE_PER_HOST,
+        burst_per_host=DEFAULT_BURST_PER_HOST,
+        prune_interval=DEFAULT_RATE_LIMIT_PRUNE,
+    ) -> None:
+        self._limits = {
+            "host": (rate_per_host, burst_per_host),
+            "token": (rate_per_token, burst_per_token),
+        }
+        self._buckets: Dict[tuple, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+        self.prune_interval = prune_interval
+        self._pruned_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _bucket(self, kind, key) -> TokenBucket:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._pruned_at >= self.prune_interval:
+                self._prune(now)
+
+            try:
+                return self._buckets[(kind, key)]
+            except KeyError:
+                bucket = self._buckets[(kind, key)] = TokenBucket(*self._limits[kind])
+                return bucket
+
+    def _prune(self, now) -> None:
+        """Evict the idle buckets (under the lock)."""
+        self._buckets = {k: b for k, b in self._buckets.items() if not b.is_idle(now)}
+        self._pruned_at = now
+
+    async def acquire(self, host, token) -> None:
+        """Wait until a request to the host, using the token, is allowed.
+
+        The token's bucket is waited upon first, so that a token that is held back
+        (e.g. by a Retry-After) does not take from the host's budget meanwhile.
+        """
+        await self._bucket("token", token).acquire()
+        await self._bucket("host", host).acquire()
+
+    def throttled(self, host, token, retry_after=None) -> None:
+        """Back off after the host has responded with a 429 (Too Many Requests)."""
+        seconds = parse_retry_after(retry_after)
+        if seconds is None:
+            seconds = 1 / self._limits["token"][0]
+
+        _LOGGER.warning(
+            "Requests to %s have been throttled, backing off for %.1f s.",
+            host,
+            seconds,
+        )
+        self._bucket("token", token).block(seconds)
+
+
+SHARED_RATE_LIMITER = RateLimiter()
@@ -0,0 +1,302 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import logging
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Dict, Iterator, Optional, Tuple
+
+from .codec import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAGIC = b"GHRA2\n"  # an archive of recorded responses
+_API_VERSION = struct.Struct("<B")  # of the hub's responses: 1 or 3, after _MAGIC
+
+_HEADER = struct.Struct("<dBHI")  # timestamp, kind, len(endpoint), len(payload)
+_FULL, _DELTA, _SAME = range(3)  # kinds of record
+
+_OP = struct.Struct("<BII")  # _COPY: offset, length; _LITERAL: length, 0
+_COPY, _LITERAL = range(2)
+
+# responses are delta-encoded in chunks, each ending after an object/array
+_CHUNK_END = re.compile(rb"[}\]],?")
+
+
+def _chunks(body) -> Iterator[bytes]:
+    """Split a (JSON) body into chunks, so that unchanged chunks can be found."""
+    start = 0
+    for match in _CHUNK_END.finditer(body):
+        yield body[start : match.end()]
+        start = match.end()
+    if start < len(body):
+        yield body[start:]
+
+
+def encode_delta(prev, body) -> bytes:
+    """Encode a body as a delta of the previous body (of the same endpoint).
+
+    The delta is a sequence of ops: either a copy of a range of the previous body,
+    or a literal of new bytes. As most of a poll's response is unchanged since the
+    last poll, it is mostly (adjacent, so merged) copies.
+    """
+    index = {}  # chunk: offset in prev
+    offset = 0
+    for chunk in _chunks(prev):
+        index.setdefault(chunk, offset)
+        offset += len(chunk)
+
+    ops = bytearray()
+    copy_start = copy_len = 0
+    literal = bytearray()
+
+    def flush_copy() -> None:
+        if copy_len:
+            ops.extend(_OP.pack(_COPY, copy_start, copy_len))
+
+    def flush_literal() -> None:
+        if literal:
+            ops.extend(_OP.pack(_LITERAL, len(literal), 0))
+            ops.extend(literal)
+            literal.clear()
+
+    for chunk in _chunks(body):
+        if copy_len and prev.startswith(chunk, copy_start + copy_len):
+            copy_len += len(chunk)  # the chunk follows on, in both bodies
+            continue
+
+        offset = index.get(chunk)
+        if offset is None:
+            flush_copy()
+            copy_len = 0
+            literal.extend(chunk)
+        else:
+            flush_literal()
+            flush_copy()
+            copy_start, copy_len = offset, len(chunk)
+
+    flush_literal()
+    flush_copy()
+    return bytes(ops)
+
+
+def decode_delta(prev, delta) -> bytes:
+    """Decode a body from its delta, and the previous body."""
+    result = bytearray()
+    pos = 0
+    while pos < len(delta):
+        op, arg1, arg2 = _OP.unpack_from(delta, pos)
+        pos += _OP.size
+        if op == _COPY:
+            result.extend(prev[arg1 : arg1 + arg2])
+        else:
+            result.extend(delta[pos : pos + arg1])
+            pos += arg1
+    return bytes(result)
+
+
+def _read_api_version(fh, path) -> int:
+    """Read the header of an archive, and return the API version of its responses."""
+    if fh.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError(f"{path} is not an archive of Genius Hub responses.")
+    return _API_VERSION.unpack(fh.read(_API_VERSION.size))[0]
+
+
+def archive_api_version(path) -> int:
+    """Return the API version (1 or 3) of the responses of an archive."""
+    with open(path, "rb") as fh:
+        return _read_api_version(fh, path)
+
+
+class ResponseRecorder:
+    """Append raw responses (with their timestamp & endpoint) to an archive.
+
+    Each response is delta-encoded against the previous response of the same
+    endpoint (or recorded as the same, if unchanged), and then compressed, so that
+    a day of polling stays small. The archive is appended to, if it exists.
+
+    The API version of the responses is in the archive's header, so it is set (by
+    the GeniusService that it is given to) before the first response is recorded.
+    Responses may be recorded from any thread (e.g. an executor).
+    """
+
+    def __init__(self, path, level=6, api_version=3) -> None:
+        self.path = path
+        self.api_version = api_version
+        self._level = level
+        self._prev: Dict[str, bytes] = {}  # endpoint: previous body
+        self._lock = threading.Lock()
+
+        self._file = open(path, "ab")
+        self._header_written = self._file.tell() != 0
+        self._archive_version = (  # that of the archive being appended to, if any
+            archive_api_version(path) if self._header_written else None
+        )
+
+        self.bytes_in = self.bytes_out = 0
+
+    def __enter__(self) -> "ResponseRecorder":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def record(self, endpoint, body, timestamp=None) -> None:
+        """Append a response to the archive."""
+        timestamp = time.time() if timestamp is None else timestamp
+
+        with self._lock:
+            self._record(endpoint, body, timestamp)
+
+    def _record(self, endpoint, body, timestamp) -> None:
+        if not self._header_written:
+            self._file.write(_MAGIC + _API_VERSION.pack(self.api_version))
+            self._header_written = True
+        elif self._archive_version not in (None, self.api_version):
+            raise ValueError(
+                f"{self.path} is an archive of the v{self._archive_version} API, "
+                f"not of the v{self.api_version} API."
+            )
+
+        prev = self._prev.get(endpoint)
+        if prev == body:
+            kind, payload = _SAME, b""
+        elif prev is None:
+            kind, payload = _FULL, zlib.compress(body, self._level)
+        else:
+            kind = _DELTA
+            payload = zlib.compress(encode_delta(prev, body), self._level)
+        self._prev[endpoint] = body
+
+        endpoint_bytes = endpoint.encode("utf-8")
+        self._file.write(
+            _HEADER.pack(timestamp, kind, len(endpoint_bytes), len(payload))
+        )
+        self._file.write(endpoint_bytes)
+        self._file.write(payload)
+        self._file.flush()
+
+        self.bytes_in += len(body)
+        self.bytes_out += _HEADER.size + len(endpoint_bytes) + len(payload)
+
+    def close(self) -> None:
+        """Close the archive."""
+        self._file.close()
+
+
+def read_archive(path) -> Iterator[Tuple[float, str, bytes]]:
+    """Yield each (timestamp, endpoint, body) of an archive, in the order recorded."""
+    prev: Dict[str, bytes] = {}
+
+    with open(path, "rb") as fh:
+        _read_api_version(fh, path)
+
+        while True:
+            header = fh.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return  # a truncated record (e.g. the recorder crashed) is ignored
+            timestamp, kind, endpoint_len, payload_len = _HEADER.unpack(header)
+            endpoint = fh.read(endpoint_len).decode("utf-8")
+            payload = fh.read(payload_len)
+            if len(payload) < payload_len:
+                return
+
+            if kind == _SAME:
+                body = prev[endpoint]
+            elif kind == _FULL:
+                body = zlib.decompress(payload)
+            else:
+                body = decode_delta(prev[endpoint], zlib.decompress(payload))
+            prev[endpoint] = body
+
+            yield timestamp, endpoint, body
+
+
+class ReplayService:
+    """Serve the responses of an archive, in place of a GeniusService.
+
+    Each GET of an endpoint is served the next recorded response of that endpoint.
+    If speed is None, responses are served as fast as possible, otherwise they are
+    served at the pace they were recorded (speed=1.0), or faster (e.g. speed=60.0).
+    Writes are not sent anywhere. Once the archive is exhausted, GETs raise
+    EOFError.
+
+        hub = GeniusHub("replay", "username", "password", replay=ReplayService(path))
+    """
+
+    def __init__(self, path, speed=None, decoder=None) -> None:
+        self.path = path
+        self._speed = speed
+        self._decoder = decoder if decoder else json_loads
+
+        self._records = read_archive(path)
+        self._pending: Dict[str, deque] = {}  # endpoint: records, not yet served
+
+        self._use_v1_api = archive_api_version(path) == 1
+
+        self.timings = None  # the recorded timings are not replayed
+        self._started_at: Optional[Tuple[float, float]] = None  # (wall, recorded)
+
+    async def __aenter__(self) -> "ReplayService":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the archive."""
+        self._records.close()
+
+    def _next(self, endpoint) -> Tuple[float, bytes]:
+        """Return the next (timestamp, body) of an endpoint."""
+        while not self._pending.get(endpoint):
+            try:
+                timestamp, key, body = next(self._records)
+            except StopIteration:
+                raise EOFError(f"The archive has no more '{endpoint}' responses.")
+            self._pending.setdefault(key, deque()).append((timestamp, body))
+        return self._pending[endpoint].popleft()
+
+    async def request_raw(self, method, url, data=None) -> bytes:
+        """Return the next recorded response of the endpoint (writes are ignored)."""
+        if method != "GET":
+            _LOGGER.debug("request(method=%s, url=%s): not replayed", method, url)
+            return b""
+
+        timestamp, body = self._next(url)
+
+        if self._speed:
+            if self._started_at is None:
+                self._started_at = (time.monotonic(), timestamp)
+            wall, recorded = self._started_at
+            delay = wall + (timestamp - recorded) / self._speed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        return body
+
+    async def request_stream(self, method, url, parser_factory, data=None):
+        """Feed the next recorded response of the endpoint to a parser."""
+        parser = parser_factory()
+        parser.feed(await self.request_raw(method, url, data))
+        parser.close()
+        return parser
+
+    async def request(self, method, url, data=None):
+        """Return the decoded JSON of the next recorded response."""
+        return self.decode(await self.request_raw(method, url, data))
+
+    def decode(self, body):
+        """Decode the body of a response (None if it is empty)."""
+        if not body or body.isspace():
+            return None
+        return self._decoder(body)
+
+    @property
+    def use_v1_api(self) -> bool:
+        """Return True if the archive is of the v1 API."""
+        return self._use_v1_api
@@ -0,0 +1,135 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import logging
+import random
+import time
+
+import aiohttp
+
+from .const import (
+    API_STATUS_RETRY,
+    DEFAULT_CIRCUIT_RESET,
+    DEFAULT_CIRCUIT_THRESHOLD,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_MAX_BACKOFF,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = ("GET", "PUT")
+
+
+class GeniusHubUnavailable(aiohttp.ClientConnectionError):
+    """The hub is known to be down, so the request was not made."""
+
+
+def is_outage(exc) -> bool:
+    """Return True if the exception suggests that the hub (not the request) failed."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 502  # "The hub is offline."
+    return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+class RetryPolicy:
+    """Decide if, and when, a failed request is retried.
+
+    Retries are delayed by an exponential backoff, with (full) jitter. A write
+    (i.e. a non-idempotent method) is retried only if it is known that the hub did
+    not process it, so that it is never duplicated.
+    """
+
+    def __init__(
+        self,
+        attempts=DEFAULT_RETRY_ATTEMPTS,
+        backoff=DEFAULT_RETRY_BACKOFF,
+        max_backoff=DEFAULT_RETRY_MAX_BACKOFF,
+        jitter=True,
+        retry_status=None,
+    ) -> None:
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_status = API_STATUS_RETRY if retry_status is None else retry_status
+
+    def should_retry(self, method, exc, attempt) -> bool:
+        """Return True if a request that failed on its attempt (from 0) is retried."""
+        if attempt + 1 >= self.attempts:
+            return False
+
+        if isinstance(exc, aiohttp.ClientResponseError):
+            return self.retry_status.get(exc.status, False)
+
+        if isinstance(exc, aiohttp.ClientConnectorError):
+            return True  # the connection was never made, so nothing was sent
+
+        if isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+            return method in IDEMPOTENT_METHODS  # a write may have been processed
+
+        return False
+
+    def delay(self, attempt) -> float:
+        """Return the number of seconds to wait before the next attempt."""
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class CircuitBreaker:
+    """Fail fast while a hub is known to be down.
+
+    After threshold consecutive outages, the circuit opens and requests fail
+    immediately with GeniusHubUnavailable. After reset_timeout seconds, a single
+    trial request is allowed: if it succeeds the circuit closes, otherwise it opens
+    again.
+    """
+
+    def __init__(
+        self, threshold=DEFAULT_CIRCUIT_THRESHOLD, reset_timeout=DEFAULT_CIRCUIT_RESET
+    ) -> None:
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if requests are currently failing fast."""
+        return self._opened_at is not None
+
+    def check(self) -> None:
+        """Raise GeniusHubUnavailable if a request should not be made."""
+        if self._opened_at is None:
+            return
+
+        if (
+            not self._trial_in_flight
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._trial_in_flight = True  # half-open: allow this one request
+            return
+
+        raise GeniusHubUnavailable(
+            f"The hub is unavailable after {self.failures} consecutive failures."
+        )
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        if self._opened_at is not None:
+            _LOGGER.info("The hub is available again, closing the circuit.")
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count an outage, and open the circuit if there have been enough of them."""
+        self.failures += 1
+        self._trial_in_flight = False
+
+        if self._opened_at is not None or self.failures >= self.threshold:
+            if self._opened_at is None:
+                _LOGGER.warning("The hub is unavailable, opening the circuit.")
+            self._opened_at = time.monotonic()
@@ -0,0 +1,118 @@
+"""Python client library for the Genius Hub API."""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+from .codec import json_fingerprint
+from .const import DEFAULT_SCHEDULE_CACHE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"'{type(self).__name__}' object is read-only (it is shared)")
+
+
+class FrozenDict(dict):
+    """A read-only dict, that can be shared (e.g. by the zones of many hubs)."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo) -> dict:
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}  # a mutable copy
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """A read-only list, that can be shared (e.g. by the zones of many hubs)."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo) -> list:
+        return [copy.deepcopy(v, memo) for v in self]  # a mutable copy
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(obj) -> Any:
+    """Return a read-only copy of some JSON (its dicts & lists, recursively)."""
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    return obj
+
+
+class ScheduleCache:
+    """A (thread-safe) LRU cache of converted schedules, keyed by their raw JSON.
+
+    Schedules change only when they are edited, and many zones have the same
+    schedule, so each distinct schedule is converted once, and the (read-only)
+    result is shared by every zone that has it, of every hub in the process (see:
+    SCHEDULE_CACHE).
+    """
+
+    def __init__(self, size=DEFAULT_SCHEDULE_CACHE_SIZE) -> None:
+        self.size = size
+        self._cache: Dict[bytes, FrozenDict] = OrderedDict()
+        self._lock = threading.Lock()  # hubs may be polled from many threads
+
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, raw_json, convert: Callable[[], Dict]) -> FrozenDict:
+        """Return the converted schedule of some raw JSON, converting it if need be.
+
+        raw_json is (only) the JSON the conversion depends upon.
+        """
+        key = json_fingerprint(raw_json)
+        with self._lock:
+            schedule = self._cache.get(key)
+            if schedule is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return schedule
+
+        schedule = freeze(convert())  # not under the lock, it may be slow
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = schedule
+            while len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+        return schedule
+
+    def clear(self) -> None:
+        """Remove every schedule from the cache."""
+        with self._lock:
+            self._cache.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the number of schedules cached, hits, misses & evictions."""
+        return {
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+SCHEDULE_CACHE = ScheduleCache()
@@ -0,0 +1,108 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict
+
+from .const import DEFAULT_MAX_CONCURRENT_REQUESTS
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_WRITE = 0  # e.g. Zone.set_mode(), Zone.set_override()
+PRIORITY_READ = 1  # e.g. Hub.update()
+
+PRIORITY_NAMES = {PRIORITY_WRITE: "write", PRIORITY_READ: "read"}
+
+
+class RequestScheduler:
+    """Limit the number of in-flight requests to a hub, serving writes first.
+
+    Requests wait (in order of priority, then of arrival) for one of the
+    max_concurrent slots, so that a hub is never sent more than that many requests
+    at a time, and a user's command does not queue behind a background poll.
+    """
+
+    def __init__(self, max_concurrent=DEFAULT_MAX_CONCURRENT_REQUESTS) -> None:
+        self.max_concurrent = max_concurrent
+
+        self._in_flight = 0
+        self._waiters = []  # a heap of (priority, sequence, future)
+        self._sequence = itertools.count()
+
+        self._max_queue_depth = 0
+        self._waits = {
+            p: {"requests": 0, "total": 0.0, "max": 0.0} for p in PRIORITY_NAMES
+        }
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently in flight."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests currently waiting for a slot."""
+        return sum(1 for _, _, f in self._waiters if not f.done())
+
+    @property
+    def stats(self) -> Dict:
+        """Return the queue depths, and the wait times (in seconds) by priority."""
+        result = {
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+        }
+        for priority, name in PRIORITY_NAMES.items():
+            waits = self._waits[priority]
+            result[name] = {
+                "requests": waits["requests"],
+                "wait_mean": (
+                    waits["total"] / waits["requests"] if waits["requests"] else 0.0
+                ),
+                "wait_max": waits["max"],
+            }
+        return result
+
+    @asynccontextmanager
+    async def slot(self, priority=PRIORITY_READ):
+        """Hold one of the in-flight slots for the duration of a request."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority) -> None:
+        start = time.monotonic()
+
+        if self._in_flight < self.max_concurrent and not self.queue_depth:
+            self._in_flight += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+            self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+
+            try:
+                await future  # the slot is handed over by _release()
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self._release()  # the slot was handed over, so pass it on
+                raise
+
+        wait = time.monotonic() - start
+        waits = self._waits[priority]
+        waits["requests"] += 1
+        waits["total"] += wait
+        waits["max"] = max(waits["max"], wait)
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():  # i.e. not cancelled
+                future.set_result(None)
+                return
+        self._in_flight -= 1
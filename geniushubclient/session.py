@@ -1,38 +1,289 @@
 """Python client library for the Genius Hub API."""
 
+import asyncio
 import logging
+import time
 from hashlib import sha256
 
 import aiohttp
+from yarl import URL
 
-from .const import DEFAULT_TIMEOUT_V1, DEFAULT_TIMEOUT_V3
+from .coalesce import WriteCoalescer, write_key
+from .codec import json_loads
+from .const import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_POOL_DNS_TTL,
+    DEFAULT_POOL_LIMIT_PER_HOST,
+    DEFAULT_TIMEOUT_V1,
+    DEFAULT_TIMEOUT_V3,
+)
+from .hedge import HedgePolicy
+from .ratelimit import SHARED_RATE_LIMITER
+from .retry import RetryPolicy, is_outage
+from .scheduler import PRIORITY_READ, PRIORITY_WRITE, RequestScheduler
+from .timing import RequestTimings, endpoint_of
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class GeniusService:
-    """Handle all communication to the Genius Hub."""
+    """Handle all communication to the Genius Hub.
 
-    def __init__(self, hub_id, username=None, password=None, session=None) -> None:
-        self._session = session if session else aiohttp.ClientSession()
+    By default, each request to the v3 API uses a new connection (it sends a
+    `Connection: close` header). If pooled is True, connections are kept alive and
+    re-used instead, and DNS lookups are cached.
+
+    If the service creates its own session, it should be closed when no longer
+    required, either via close(), or by using the service as an async context
+    manager. A session provided by the caller is never closed by the service.
+
+    Failed requests are retried as per retry_policy (by default, a RetryPolicy()).
+    If a circuit_breaker is provided, requests fail fast (with GeniusHubUnavailable)
+    while the hub is known to be down.
+
+    No more than max_concurrent requests are in flight at any one time, and writes
+    are sent before reads (see: RequestScheduler).
+
+    Requests to the v1 API are rate-limited by token and by host, by default using
+    a RateLimiter shared by all the hubs in the process (SHARED_RATE_LIMITER).
+
+    If timings is True (or a RequestTimings), the phases of each request (e.g.
+    dns, connect, ttfb, transfer) are recorded, by endpoint, in self.timings.
+
+    If write_debounce (seconds) is given, writes to the same zone (whatever their
+    url) within that window are coalesced, so that only the latest is sent.
+
+    The API is at http://{hub_id}:1223/v3/ (or https://my.geniushub.co.uk/v1/),
+    unless a base_url is given (e.g. that of a MockHubServer), without the version.
+
+    If hedge is True (or a HedgePolicy), a GET that is slow to answer (relative to
+    the recent latencies of its endpoint) is duplicated, and the first response
+    wins. This cuts the tail latency of the v1 API, for a little extra load.
+
+    If a recorder (a ResponseRecorder) is given, the raw response to every GET is
+    appended to its archive (in an executor, as that compresses & writes a file),
+    for replay (see: ReplayService).
+
+    Responses are decoded by decoder, a callable that takes the raw bytes. By
+    default, this is orjson if it is installed, otherwise the stdlib's json.
+    """
+
+    def __init__(
+        self,
+        hub_id,
+        username=None,
+        password=None,
+        session=None,
+        pooled=False,
+        limit_per_host=DEFAULT_POOL_LIMIT_PER_HOST,
+        retry_policy=None,
+        circuit_breaker=None,
+        max_concurrent=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        rate_limiter=None,
+        decoder=None,
+        timings=False,
+        write_debounce=None,
+        base_url=None,
+        recorder=None,
+        hedge=None,
+    ) -> None:
+        self._recorder = recorder
+        if isinstance(hedge, HedgePolicy):
+            self.hedge = hedge
+        else:
+            self.hedge = HedgePolicy() if hedge else None
+        self._coalescer = WriteCoalescer(write_debounce) if write_debounce else None
+
+        if isinstance(timings, RequestTimings):
+            self.timings = timings
+        else:
+            self.timings = RequestTimings() if timings else None
+
+        self._decoder = decoder if decoder else json_loads
+        self.scheduler = RequestScheduler(max_concurrent)
+        self._retry_policy = retry_policy if retry_policy else RetryPolicy()
+        self._circuit_breaker = circuit_breaker
+
+        self._owns_session = session is None
+        trace_configs = [self.timings.trace_config] if self.timings else None
+        if session:
+            self._session = session
+            if self.timings and self.timings.trace_config not in (
+                session.trace_configs
+            ):
+                _LOGGER.warning(
+                    "The session lacks timings.trace_config, so only the transfer, "
+                    "bytes & decode phases will be timed."
+                )
+        elif pooled:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=limit_per_host,
+                    use_dns_cache=True,
+                    ttl_dns_cache=DEFAULT_POOL_DNS_TTL,
+                ),
+                trace_configs=trace_configs,
+            )
+        else:
+            self._session = aiohttp.ClientSession(trace_configs=trace_configs)
 
         if username or password:  # use the v3 Api
             sha = sha256()
             sha.update((username + password).encode("utf-8"))
             self._auth = aiohttp.BasicAuth(login=username, password=sha.hexdigest())
-            self._url_base = f"http://{hub_id}:1223/v3/"
-            self._headers = {"Connection": "close"}
+            if base_url:
+                self._url_base = f"{base_url.rstrip('/')}/v3/"
+            else:
+                self._url_base = f"http://{hub_id}:1223/v3/"
+            self._headers = {} if pooled else {"Connection": "close"}
             self._timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT_V3)
+            self._rate_limiter = None
         else:
             self._auth = None
-            self._url_base = "https://my.geniushub.co.uk/v1/"
+            if base_url:
+                self._url_base = f"{base_url.rstrip('/')}/v1/"
+            else:
+                self._url_base = "https://my.geniushub.co.uk/v1/"
             self._headers = {"authorization": f"Bearer {hub_id}"}
             self._timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT_V1)
+            self._rate_limiter = rate_limiter if rate_limiter else SHARED_RATE_LIMITER
+            self._rate_limit_key = (URL(self._url_base).host, hub_id)
 
-    async def request(self, method, url, data=None):
-        """Perform a request."""
+        if recorder:  # the API version is in the archive's header
+            recorder.api_version = 1 if self.use_v1_api else 3
+
+    async def __aenter__(self) -> "GeniusService":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session, but only if it was created by this service.
+
+        Any writes still being debounced are sent first.
+        """
+        if self._coalescer:
+            await self._coalescer.flush()
+        if self._owns_session and not self._session.closed:
+            await self._session.close()
+
+    async def request_raw(self, method, url, data=None) -> bytes:
+        """Perform a request, and return the (undecoded) body of the response."""
+
+        async def read_body(resp) -> bytes:
+            return await resp.read()
+
+        body = await self._request(method, url, data, read_body)
+        if self._recorder and method == "GET":
+            await self._record(url, body)
+        return body
+
+    async def request_stream(self, method, url, parser_factory, data=None):
+        """Perform a request, and feed the body to a parser, chunk by chunk.
+
+        The parser (e.g. a DataManagerParser) has feed(chunk) and close() methods,
+        and a new one is used for each attempt. Return the parser, once closed.
+        """
+
+        async def read_stream(resp):
+            parser = parser_factory()
+            chunks = []  # of this attempt (a hedged GET has others), if recording
+            async for chunk in resp.content.iter_any():
+                parser.feed(chunk)
+                if self._recorder:
+                    chunks.append(chunk)
+            parser.close()
+            return parser, chunks
+
+        parser, chunks = await self._request(method, url, data, read_stream)
+        if self._recorder and method == "GET":
+            await self._record(url, b"".join(chunks))
+        return parser
+
+    async def _record(self, url, body) -> None:
+        """Append a response to the recorder's archive, without blocking the loop."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._recorder.record, url, body, time.time()
+        )
+
+    async def _request(self, method, url, data, reader):
+        """Perform a request, and return the body of the response, as per reader.
+
+        Each attempt waits for the rate limiter (if any), and then for a slot from
+        the scheduler. Failed requests are retried according to the retry policy
+        and, if there is a circuit breaker, requests fail fast while the hub is
+        known to be down.
+
+        If there is a hedge policy, the attempts of a GET are hedged (only the
+        request itself, once it has its slot, is timed & duplicated).
+        """
         _LOGGER.debug("request(method=%s, url=%s, data=%s)", method, url, data)
 
+        priority = PRIORITY_READ if method == "GET" else PRIORITY_WRITE
+
+        attempt = 0
+        while True:
+            trial = False  # if this is the trial request of a half-open circuit
+            if self._circuit_breaker:
+                self._circuit_breaker.check()
+                trial = self._circuit_breaker.is_open
+
+            try:
+                if self._rate_limiter:
+                    await self._rate_limiter.acquire(*self._rate_limit_key)
+                async with self.scheduler.slot(priority):
+                    if self.hedge and method == "GET":
+                        body = await self.hedge.request(
+                            url, lambda: self._request_once(method, url, data, reader)
+                        )
+                    else:
+                        body = await self._request_once(method, url, data, reader)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                if self._circuit_breaker:
+                    if is_outage(exc):
+                        self._circuit_breaker.record_failure()
+                    else:  # the hub responded, even if it was with an error
+                        self._circuit_breaker.record_success()
+
+                if (
+                    self._rate_limiter
+                    and isinstance(exc, aiohttp.ClientResponseError)
+                    and exc.status == 429
+                ):
+                    self._rate_limiter.throttled(
+                        *self._rate_limit_key,
+                        retry_after=(
+                            exc.headers.get("Retry-After") if exc.headers else None
+                        ),
+                    )
+
+                if not self._retry_policy.should_retry(method, exc, attempt):
+                    raise
+
+                delay = self._retry_policy.delay(attempt)
+                _LOGGER.debug(
+                    "request(): %s (attempt %s), retrying in %.2f s.",
+                    repr(exc),
+                    attempt + 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+            except BaseException:  # noqa: B902; e.g. cancelled (the hub was closed)
+                if trial:  # otherwise, the circuit would never close again
+                    self._circuit_breaker.record_failure()
+                raise
+
+            else:
+                if self._circuit_breaker:
+                    self._circuit_breaker.record_success()
+                return body
+
+    async def _request_once(self, method, url, data, reader):
+        """Perform a single attempt at a request."""
         http_method = {
             "GET": self._session.get,
             "PATCH": self._session.patch,
@@ -40,7 +291,7 @@ class GeniusService:
             "PUT": self._session.put,
         }.get(method)
 
-        try:
+        if not self.timings:
             async with http_method(
                 self._url_base + url,
                 auth=self._auth,
@@ -49,24 +300,53 @@ class GeniusService:
                 raise_for_status=True,
                 timeout=self._timeout,
             ) as resp:
-                response = await resp.json(content_type=None)
+                return await reader(resp)
 
-        except aiohttp.ServerDisconnectedError as exc:
-            _LOGGER.debug("request(): ServerDisconnectedError (msg=%s), retrying.", exc)
-            async with http_method(
-                self._url_base + url,
-                auth=self._auth,
-                headers=self._headers,
-                json=data,
-                raise_for_status=True,
-                timeout=self._timeout,
-            ) as resp:
-                response = await resp.json(content_type=None)
+        trace_ctx = {"endpoint": endpoint_of(url)}
+        start = time.perf_counter()
+
+        async with http_method(
+            self._url_base + url,
+            auth=self._auth,
+            headers=self._headers,
+            json=data,
+            raise_for_status=True,
+            timeout=self._timeout,
+            trace_request_ctx=trace_ctx,
+        ) as resp:
+            result = await reader(resp)
+
+        transfer = time.perf_counter() - trace_ctx.get("ttfb_end", start)
+        self.timings.record(trace_ctx["endpoint"], "transfer", transfer)
+        self.timings.record(trace_ctx["endpoint"], "bytes", resp.content.total_bytes)
+        return result
+
+    async def request(self, method, url, data=None):
+        """Perform a request, and return the decoded JSON of the response.
+
+        If writes are being debounced, a write that is superseded (by another write
+        to the same zone, e.g. a mode after an override) within the window is not
+        sent, and the response is that of the write that was.
+        """
+        if self._coalescer and method != "GET":
+            return await self._coalescer.submit(
+                write_key(url), lambda: self._request_decoded(method, url, data)
+            )
+        return await self._request_decoded(method, url, data)
+
+    async def _request_decoded(self, method, url, data=None):
+        response = self.decode(await self.request_raw(method, url, data=data))
 
         if method != "GET":
             _LOGGER.debug("request(): response=%s", response)
         return response
 
+    def decode(self, body):
+        """Decode the body of a response (None if it is empty)."""
+        if not body or body.isspace():
+            return None
+        return self._decoder(body)
+
     @property
     def use_v1_api(self) -> bool:
         """Return True is using the v1 API."""
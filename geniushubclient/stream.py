@@ -0,0 +1,216 @@
+"""Python client library for the Genius Hub API."""
+
+import codecs
+import json
+import logging
+import re
+from hashlib import blake2b
+from typing import Dict, List
+
+from .device import flatten_device
+
+_LOGGER = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+_SCALAR = re.compile(r"[^,}\]\s]*")
+_SKIP_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]"]')
+
+_TRIM_AT = 64 * 1024  # discard the consumed part of the buffer beyond this size
+
+# parser states
+_OPEN, _KEY, _COLON, _NEXT, _SKIP, _SKIP_CONTAINER, _EMIT, _DONE = range(8)
+
+# actions for a key's value, by depth (root, data, sites, site, devices)
+_DESCEND, _SKIP_VALUE, _EMIT_VALUE = "descend", "skip", "emit"
+
+
+def _action(depth, key) -> str:
+    """Return what to do with the value of a key, at a depth of the document.
+
+    {"data": {"childNodes": {SITE: {"childNodes": {DEVICE: {...}}}}}}
+
+    Sites & devices are keyed by their addr, so the WeatherData site and the "1"
+    (hub) device can be skipped without being decoded.
+    """
+    if depth == 0:
+        return _DESCEND if key == "data" else _SKIP_VALUE
+    if depth in (1, 3):
+        return _DESCEND if key == "childNodes" else _SKIP_VALUE
+    if depth == 2:
+        return _SKIP_VALUE if key == "WeatherData" else _DESCEND
+    return _SKIP_VALUE if key == "1" else _EMIT_VALUE
+
+
+class DataManagerParser:
+    """Incrementally parse a /v3/data_manager response into device records.
+
+    The response is fed in chunks (as it arrives), and the devices (and their
+    channels) are returned as each device completes, so that the document is never
+    held in memory in full, either as bytes, or as nested dicts. The records are
+    the same as those from GeniusHubBase._devices_via_v3_data_mgr().
+    """
+
+    def __init__(self) -> None:
+        self.devices = []  # all the records so far
+        self._digest = blake2b(digest_size=16)
+
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._keys = {}  # so that devices share their keys, as with json.loads()
+        self._decoder = json.JSONDecoder(object_pairs_hook=self._object)
+        self._buf, self._pos = "", 0
+        self._closed = False
+
+        self._state = _OPEN
+        self._stack = []  # the depth of each object being descended
+        self._key = None
+        self._skip_depth = 0
+        self._emit_after = 0  # retry a partial device once the buffer is this long
+
+    @property
+    def digest(self) -> bytes:
+        """Return a digest of the raw bytes fed so far."""
+        return self._digest.digest()
+
+    def _object(self, pairs) -> Dict:
+        return {self._keys.setdefault(k, k): v for k, v in pairs}
+
+    def feed(self, chunk) -> List[Dict]:
+        """Parse the next chunk of the response, and return any completed records."""
+        self._digest.update(chunk)
+
+        if self._pos > _TRIM_AT:
+            self._buf, self._emit_after = (
+                self._buf[self._pos :],
+                self._emit_after - self._pos,
+            )
+            self._pos = 0
+        self._buf += self._utf8.decode(chunk)
+
+        return self._parse()
+
+    def close(self) -> List[Dict]:
+        """Parse the remainder of the response, and return any completed records."""
+        self._buf += self._utf8.decode(b"", final=True)
+        self._closed = True
+
+        result = self._parse()
+        if self._state != _DONE:
+            raise ValueError("The data_manager response is incomplete.")
+        return result
+
+    def _parse(self) -> List[Dict]:
+        result = []
+        buf = self._buf
+
+        while self._state != _DONE:
+            pos = _WHITESPACE.match(buf, self._pos).end()
+            if pos >= len(buf):
+                break
+            char = buf[pos]
+
+            if self._state == _OPEN:
+                if char != "{":
+                    raise ValueError(f"Expecting '{{' at {pos}, not '{char}'.")
+                self._stack.append(len(self._stack))
+                self._pos, self._state = pos + 1, _KEY
+
+            elif self._state in (_KEY, _NEXT) and char == "}":
+                self._stack.pop()
+                self._pos, self._state = pos + 1, _NEXT if self._stack else _DONE
+
+            elif self._state == _NEXT:
+                if char != ",":
+                    raise ValueError(f"Expecting ',' at {pos}, not '{char}'.")
+                self._pos, self._state = pos + 1, _KEY
+
+            elif self._state == _KEY:
+                match = _STRING.match(buf, pos)
+                if not match:
+                    if char == '"':
+                        break  # the key is incomplete
+                    raise ValueError(f"Expecting a key at {pos}, not '{char}'.")
+                self._key = json.loads(match.group())
+                self._pos, self._state = match.end(), _COLON
+
+            elif self._state == _COLON:
+                if char != ":":
+                    raise ValueError(f"Expecting ':' at {pos}, not '{char}'.")
+                self._pos = pos + 1
+
+                action = _action(len(self._stack) - 1, self._key)
+                if action == _DESCEND:
+                    self._state = _OPEN
+                else:
+                    self._state = _SKIP if action == _SKIP_VALUE else _EMIT
+
+            elif self._state in (_SKIP, _SKIP_CONTAINER):
+                if not self._skip(pos):
+                    break
+
+            elif self._state == _EMIT:
+                if not self._emit(pos, result):
+                    break
+
+        return result
+
+    def _skip(self, pos) -> bool:
+        """Skip over a value (without decoding it), return False if it is partial."""
+        buf = self._buf
+
+        if self._state == _SKIP:
+            char = buf[pos]
+            if char in "{[":
+                self._skip_depth = 0
+                self._state = _SKIP_CONTAINER
+            elif char == '"':
+                match = _STRING.match(buf, pos)
+                if not match:
+                    return False
+                self._pos, self._state = match.end(), _NEXT
+                return True
+            else:
+                end = _SCALAR.match(buf, pos).end()
+                if end == len(buf) and not self._closed:
+                    return False  # e.g. a number may continue in the next chunk
+                self._pos, self._state = end, _NEXT
+                return True
+
+        for match in _SKIP_TOKEN.finditer(buf, pos):
+            token = match.group()
+            if token == '"':  # an incomplete string
+                self._pos = match.start()
+                return False
+            if token in "{[":
+                self._skip_depth += 1
+            elif token in "}]":
+                self._skip_depth -= 1
+                if self._skip_depth == 0:
+                    self._pos, self._state = match.end(), _NEXT
+                    return True
+
+        self._pos = len(buf)
+        return False
+
+    def _emit(self, pos, result) -> bool:
+        """Decode a device, return False if it is partial."""
+        if len(self._buf) < self._emit_after and not self._closed:
+            return False
+
+        try:
+            device, end = self._decoder.raw_decode(self._buf, pos)
+        except json.JSONDecodeError:
+            if self._closed:
+                raise
+            # wait for the buffer to double (so partial devices are decoded O(n))
+            self._pos = pos
+            self._emit_after = pos + 2 * (len(self._buf) - pos)
+            return False
+
+        if device.get("addr") != "1":
+            records = flatten_device(device)
+            self.devices.extend(records)
+            result.extend(records)
+
+        self._pos, self._state, self._emit_after = end, _NEXT, 0
+        return True
@@ -0,0 +1,184 @@
+"""Python client library for the Genius Hub API."""
+
+import asyncio
+import concurrent.futures
+import copy
+import logging
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from . import GeniusHub
+from .const import DEFAULT_SYNC_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HubSnapshot(NamedTuple):
+    """The state of a hub, as at one poll (it is never changed once published)."""
+
+    zones: Tuple[Dict, ...]
+    devices: Tuple[Dict, ...]
+    issues: Tuple[Dict, ...]
+    version: Dict
+    uid: Optional[str]
+    polls: int  # the number of successful polls, including this one
+    updated_at: float  # time.time() of the poll
+
+
+class SyncGeniusHub:
+    """A thread-safe, synchronous facade to a GeniusHub.
+
+    The GeniusHub runs on its own event loop, in a background thread, and polls
+    the hub every interval (seconds). Each successful poll publishes a new
+    HubSnapshot (by replacing self.snapshot, an atomic assignment), so that any
+    thread can read the latest state without a lock, or a round-trip to the loop.
+
+    Writes can be made from any thread: they are submitted to the loop, and return
+    a concurrent.futures.Future, which completes once the write has been made, and
+    a new snapshot (that includes it) has been published.
+
+        with SyncGeniusHub(hub_id, username, password) as hub:
+            print(hub.snapshot.zones)
+            hub.set_mode(3, "off").result()
+    """
+
+    def __init__(
+        self,
+        hub_id,
+        username=None,
+        password=None,
+        interval=DEFAULT_SYNC_INTERVAL,
+        verbosity=1,
+        **kwargs,
+    ) -> None:
+        self.hub_id = hub_id
+        self.interval = interval
+        self._verbosity = verbosity
+
+        self.snapshot: Optional[HubSnapshot] = None  # None until the first poll
+        self.last_error: Optional[BaseException] = None  # of the latest poll
+        self._polls = 0
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name=f"SyncGeniusHub-{hub_id}", daemon=True
+        )
+        self._thread.start()
+
+        async def create_hub() -> GeniusHub:  # so its session belongs to the loop
+            return GeniusHub(hub_id, username, password, **kwargs)
+
+        self._hub = self._submit(create_hub()).result()
+        self._task: Optional[asyncio.Task] = None
+
+    def __enter__(self) -> "SyncGeniusHub":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _submit(self, coro) -> concurrent.futures.Future:
+        """Submit a coroutine to the loop (from any thread)."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def start(self, wait=True) -> None:
+        """Start polling, and (by default) wait for the first poll to complete.
+
+        If wait is True, the first poll's exception (if any) is raised.
+        """
+
+        async def start() -> None:
+            if self._task is None:
+                self._task = asyncio.ensure_future(self._run())
+            await self._update()
+
+        future = self._submit(start())
+        if wait:
+            future.result()
+
+    def close(self) -> None:
+        """Stop polling, close the hub's session, and stop the loop's thread."""
+        if not self._thread.is_alive():
+            return
+
+        async def close() -> None:
+            if self._task is not None:
+                self._task.cancel()
+                await asyncio.gather(self._task, return_exceptions=True)
+            await self._hub.close()
+
+        self._submit(close()).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def refresh(self) -> concurrent.futures.Future:
+        """Poll the hub now, the Future's result is the new snapshot."""
+        return self._submit(self._update())
+
+    def set_mode(self, zone_id, mode) -> concurrent.futures.Future:
+        """Set the mode of a zone (see: GeniusZone.set_mode)."""
+        return self._submit(self._write(zone_id, "set_mode", mode))
+
+    def set_override(
+        self, zone_id, setpoint, duration=None
+    ) -> concurrent.futures.Future:
+        """Set a zone to override (see: GeniusZone.set_override)."""
+        return self._submit(self._write(zone_id, "set_override", setpoint, duration))
+
+    async def _write(self, zone_id, method, *args) -> HubSnapshot:
+        """Make a write to a zone, then poll, so the snapshot reflects the write.
+
+        A poll that is in flight when the write is made may have fetched the state
+        from before it, so the poll is made only once that one has finished (rather
+        than sharing it).
+        """
+        if not self._hub.zone_by_id:
+            await self._hub.update(max_age=self.interval)
+
+        await getattr(self._hub.zone_by_id[zone_id], method)(*args)
+
+        stale = self._hub._update_task  # the update in flight (started before)
+        if stale is not None:
+            await asyncio.wait([stale])
+        return await self._update()
+
+    async def _run(self) -> None:
+        """Poll the hub every interval."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self._update()
+            except Exception:  # noqa: B902; a poll must not end the polling
+                _LOGGER.exception("Hub %s: the poll failed.", self.hub_id)
+
+    async def _update(self) -> HubSnapshot:
+        """Poll the hub, and publish a new snapshot."""
+        unchanged_polls = self._hub.unchanged_polls
+        try:
+            await self._hub.update()
+        except Exception as exc:  # noqa: B902; is re-raised
+            self.last_error = exc
+            raise
+        self.last_error = None
+        self._polls += 1
+
+        if self.snapshot and self._hub.unchanged_polls > unchanged_polls:
+            self.snapshot = self.snapshot._replace(  # the state is shared, unchanged
+                polls=self._polls, updated_at=time.time()
+            )
+            return self.snapshot
+
+        self._hub.verbosity = self._verbosity
+        self.snapshot = HubSnapshot(  # the only reference to fresh copies
+            zones=tuple(copy.deepcopy(self._hub.zones)),
+            devices=tuple(copy.deepcopy(self._hub.devices)),
+            issues=tuple(copy.deepcopy(self._hub.issues)),
+            version=copy.deepcopy(self._hub.version),
+            uid=self._hub.uid,
+            polls=self._polls,
+            updated_at=time.time(),
+        )
+        return self.snapshot
@@ -0,0 +1,143 @@
+"""Python client library for the Genius Hub API."""
+
+import bisect
+import logging
+import re
+import time
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+import aiohttp
+
+from .const import DEFAULT_TIMING_SAMPLES
+
+_LOGGER = logging.getLogger(__name__)
+
+# the phases of a request (in seconds, except bytes), in the order they occur
+# (connect includes dns, which is done only if the address is not cached)
+PHASES = ("queued", "dns", "connect", "ttfb", "transfer", "bytes", "decode")
+
+# the time to convert the JSON (all endpoints) is recorded as this endpoint/phase
+CONVERT = "update"
+
+_ENTITY_ID = re.compile(r"/\d+")
+
+
+def endpoint_of(url) -> str:
+    """Return the endpoint of a url, e.g. 'zone/{id}' for 'zone/3'."""
+    return _ENTITY_ID.sub("/{id}", url)
+
+
+class RollingHistogram:
+    """The most recent samples of a measurement, and their distribution."""
+
+    def __init__(self, size=DEFAULT_TIMING_SAMPLES) -> None:
+        self._samples = deque(maxlen=size)
+
+    def add(self, value) -> None:
+        """Add a sample, discarding the oldest if there are already size of them."""
+        self._samples.append(value)
+
+    @property
+    def count(self) -> int:
+        """Return the number of samples."""
+        return len(self._samples)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Return the mean of the samples."""
+        return sum(self._samples) / len(self._samples) if self._samples else None
+
+    def percentile(self, pct) -> Optional[float]:
+        """Return the pct-th percentile (0-100) of the samples (nearest rank)."""
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+    def histogram(self, bounds: Sequence[float]) -> List[int]:
+        """Return the count of samples <= each bound (and a final count > all)."""
+        result = [0] * (len(bounds) + 1)
+        for value in self._samples:
+            result[bisect.bisect_left(bounds, value)] += 1
+        return result
+
+    def summary(self) -> Dict:
+        """Return the count, mean & common percentiles of the samples."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class RequestTimings:
+    """Record per-endpoint phase timings, and byte counts, of a hub's requests.
+
+    The network phases (queued, dns, connect, ttfb) are recorded via aiohttp's
+    tracing, so trace_config must be one of the session's trace_configs: this is
+    done automatically if GeniusService creates its own session.
+    """
+
+    def __init__(self, size=DEFAULT_TIMING_SAMPLES) -> None:
+        self._size = size
+        self._histograms: Dict[tuple, RollingHistogram] = {}
+
+        self.trace_config = aiohttp.TraceConfig()
+        for signal, callback in (
+            ("on_connection_queued_start", self._start("queued")),
+            ("on_connection_queued_end", self._end("queued")),
+            ("on_dns_resolvehost_start", self._start("dns")),
+            ("on_dns_resolvehost_end", self._end("dns")),
+            ("on_connection_create_start", self._start("connect")),
+            ("on_connection_create_end", self._end("connect")),
+            ("on_request_headers_sent", self._start("ttfb")),
+            ("on_request_end", self._end("ttfb")),
+        ):
+            getattr(self.trace_config, signal).append(callback)
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Return the endpoints that have been recorded."""
+        return sorted({endpoint for endpoint, _ in self._histograms})
+
+    def histogram(self, endpoint, phase) -> RollingHistogram:
+        """Return the histogram of a phase of an endpoint's requests."""
+        try:
+            return self._histograms[(endpoint, phase)]
+        except KeyError:
+            histogram = self._histograms[(endpoint, phase)] = RollingHistogram(
+                self._size
+            )
+            return histogram
+
+    def record(self, endpoint, phase, value) -> None:
+        """Record a sample of a phase of an endpoint's request."""
+        self.histogram(endpoint, phase).add(value)
+
+    def summary(self) -> Dict[str, Dict[str, Dict]]:
+        """Return a summary of every phase, by endpoint."""
+        result = {}
+        for (endpoint, phase), histogram in sorted(self._histograms.items()):
+            result.setdefault(endpoint, {})[phase] = histogram.summary()
+        return result
+
+    @staticmethod
+    def _start(phase):
+        async def on_start(session, trace_config_ctx, params) -> None:
+            request_ctx = trace_config_ctx.trace_request_ctx
+            if isinstance(request_ctx, dict) and "endpoint" in request_ctx:
+                request_ctx[phase] = time.perf_counter()
+
+        return on_start
+
+    def _end(self, phase):
+        async def on_end(session, trace_config_ctx, params) -> None:
+            request_ctx = trace_config_ctx.trace_request_ctx
+            if isinstance(request_ctx, dict) and phase in request_ctx:
+                request_ctx[f"{phase}_end"] = now = time.perf_counter()
+                self.record(request_ctx["endpoint"], phase, now - request_ctx[phase])
+
+        return on_end
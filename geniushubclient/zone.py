@@ -17,9 +17,18 @@ from .const import (
     ZONE_TYPE,
 )
 from .device import GeniusBase
+from .lazy import LazyData
+from .schedule import SCHEDULE_CACHE
 
 _LOGGER = logging.getLogger(__name__)
 
+_ZONE_SECTIONS = (  # the keys of each section of a zone's v1 data (see: LazyData)
+    ("type", "mode", "temperature", "setpoint", "occupied", "_occupied", "override"),
+    ("schedule", "_schedule"),
+    ("_state", "output"),
+)
+_SECTION_OF_KEY = {k: idx for idx, keys in enumerate(_ZONE_SECTIONS) for k in keys}
+
 
 def natural_sort(dict_list, dict_key) -> List[Dict]:
     """Return a case-insensitively sorted list with '11' after '2-2'."""
@@ -33,9 +42,72 @@ def natural_sort(dict_list, dict_key) -> List[Dict]:
     return sorted(dict_list, key=alphanum_key)
 
 
+def timer_schedule(raw_json) -> Dict:
+    """Convert a zone's v3 timer schedule (objTimer) to the v1 schema."""
+    root = {"weekly": {}}
+    day = -1
+
+    setpoints = raw_json["objTimer"]
+    for idx, setpoint in enumerate(setpoints):
+        tm_next = setpoint["iTm"]
+        sp_next = setpoint["fSP"]
+        if raw_json["iType"] == ZONE_TYPE.OnOffTimer:
+            sp_next = bool(sp_next)
+
+        if setpoint["iDay"] > day:
+            day += 1
+            node = root["weekly"][IDAY_TO_DAY[day]] = {}
+            node["defaultSetpoint"] = sp_next
+            node["heatingPeriods"] = []
+
+        elif sp_next != node["defaultSetpoint"]:
+            # reactive = self._hub._sense_mode & bool(setpoint.get("bReactive"))
+            if len(setpoints) == idx + 1 or setpoints[idx + 1]["iTm"] == -1:
+                tm_last = 86400  # 24 * 60 * 60
+            else:
+                tm_last = setpoints[idx + 1]["iTm"]
+
+            node["heatingPeriods"].append(
+                {"end": tm_last, "start": tm_next, "setpoint": sp_next}
+            )
+
+    return root
+
+
+def footprint_schedule(raw_json) -> Dict:
+    """Convert a zone's v3 footprint schedule (objFootprint) to the v1 schema."""
+    root = {"weekly": {}}
+    day = -1
+
+    setpoints = raw_json["objFootprint"]
+    for idx, setpoint in enumerate(setpoints["lstSP"]):
+        tm_next = setpoint["iTm"]
+        sp_next = setpoint["fSP"]
+
+        if setpoint["iDay"] > day:
+            day += 1
+            node = root["weekly"][IDAY_TO_DAY[day]] = {}
+            node["defaultSetpoint"] = setpoints["fFootprintAwaySP"]
+            node["heatingPeriods"] = []
+
+        if sp_next != setpoints["fFootprintAwaySP"]:
+            if tm_next == setpoints["iFootprintTmNightStart"]:
+                tm_last = 86400  # 24 * 60 * 60
+            else:
+                tm_last = setpoints["lstSP"][idx + 1]["iTm"]
+
+            node["heatingPeriods"].append(
+                {"end": tm_last, "start": tm_next, "setpoint": sp_next}
+            )
+
+    return root
+
+
 class GeniusZone(GeniusBase):
     """The class for a Genius Zone."""
 
+    __slots__ = ("device_objs", "device_by_id")
+
     def __init__(self, zone_id, raw_json, hub) -> None:
         super().__init__(zone_id, raw_json, hub, ATTRS_ZONE)
 
@@ -44,8 +116,12 @@ class GeniusZone(GeniusBase):
 
     @property
     def data(self) -> Dict:
-        """Convert a zone's v3 JSON to the v1 schema."""
-        if self._data:
+        """Convert a zone's v3 JSON to the v1 schema.
+
+        Each section of the v1 data (e.g. the schedules) is converted only when one
+        of its keys is first read (see: LazyData).
+        """
+        if self._data is not None:
             return self._data
         if self._hub.api_version == 1:
             self._data = self._raw
@@ -81,143 +157,114 @@ class GeniusZone(GeniusBase):
 
             return A if p and u and d and (not s) else (O if c > 0 else R)
 
-        def timer_schedule(raw_json) -> Dict:
-            root = {"weekly": {}}
-            day = -1
-
-            setpoints = raw_json["objTimer"]
-            for idx, setpoint in enumerate(setpoints):
-                tm_next = setpoint["iTm"]
-                sp_next = setpoint["fSP"]
-                if raw_json["iType"] == ZONE_TYPE.OnOffTimer:
-                    sp_next = bool(sp_next)
-
-                if setpoint["iDay"] > day:
-                    day += 1
-                    node = root["weekly"][IDAY_TO_DAY[day]] = {}
-                    node["defaultSetpoint"] = sp_next
-                    node["heatingPeriods"] = []
-
-                elif sp_next != node["defaultSetpoint"]:
-                    # reactive = self._hub._sense_mode & bool(setpoint.get("bReactive"))
-                    if len(setpoints) == idx + 1 or setpoints[idx + 1]["iTm"] == -1:
-                        tm_last = 86400  # 24 * 60 * 60
-                    else:
-                        tm_last = setpoints[idx + 1]["iTm"]
+        raw_json = self._raw  # the sections are converted from this (not a later) JSON
 
-                    node["heatingPeriods"].append(
-                        {"end": tm_last, "start": tm_next, "setpoint": sp_next}
-                    )
+        def convert_zone() -> Dict:
+            result = {}
+            try:  # convert zone (v1 attributes)
+                result["type"] = ITYPE_TO_TYPE[raw_json["iType"]]
+                if raw_json["iType"] == ZONE_TYPE.TPI and raw_json["zoneSubType"] == 0:
+                    result["type"] = ITYPE_TO_TYPE[ZONE_TYPE.ControlOnOffPID]
 
-            return root
+                result["mode"] = IMODE_TO_MODE[raw_json["iMode"]]
 
-        def footprint_schedule(raw_json) -> Dict:
-            root = {"weekly": {}}
-            day = -1
+                if raw_json["iType"] in [ZONE_TYPE.ControlSP, ZONE_TYPE.TPI]:
+                    # some zones have a fPV without raw_json["activeTemperatureDevices"]
+                    result["temperature"] = raw_json["fPV"]
+                    result["setpoint"] = raw_json["fSP"]
 
-            setpoints = raw_json["objFootprint"]
-            for idx, setpoint in enumerate(setpoints["lstSP"]):
-                tm_next = setpoint["iTm"]
-                sp_next = setpoint["fSP"]
+                if raw_json["iType"] == ZONE_TYPE.Manager:
+                    if raw_json["fPV"]:
+                        result["temperature"] = raw_json["fPV"]
 
-                if setpoint["iDay"] > day:
-                    day += 1
-                    node = root["weekly"][IDAY_TO_DAY[day]] = {}
-                    node["defaultSetpoint"] = setpoints["fFootprintAwaySP"]
-                    node["heatingPeriods"] = []
+                elif raw_json["iType"] == ZONE_TYPE.OnOffTimer:
+                    result["setpoint"] = bool(raw_json["fSP"])
 
-                if sp_next != setpoints["fFootprintAwaySP"]:
-                    if tm_next == setpoints["iFootprintTmNightStart"]:
-                        tm_last = 86400  # 24 * 60 * 60
+                if raw_json["iFlagExpectedKit"] & ZONE_KIT.PIR:  # i.e. self._has_pir
+                    if TYPE_TO_ITYPE[result["type"]] == ZONE_TYPE.ControlSP:
+                        result["occupied"] = is_occupied(raw_json)
                     else:
-                        tm_last = setpoints["lstSP"][idx + 1]["iTm"]
-
-                    node["heatingPeriods"].append(
-                        {"end": tm_last, "start": tm_next, "setpoint": sp_next}
-                    )
+                        result["_occupied"] = is_occupied(raw_json)
+
+                if raw_json["iType"] in [
+                    ZONE_TYPE.OnOffTimer,
+                    ZONE_TYPE.ControlSP,
+                    ZONE_TYPE.TPI,
+                ]:
+                    result["override"] = {}
+                    result["override"]["duration"] = raw_json["iBoostTimeRemaining"]
+                    if raw_json["iType"] == ZONE_TYPE.OnOffTimer:
+                        result["override"]["setpoint"] = raw_json["fBoostSP"] != 0
+                    else:
+                        result["override"]["setpoint"] = raw_json["fBoostSP"]
 
-            return root
+            except (AttributeError, LookupError, TypeError, ValueError):
+                _LOGGER.exception("Failed to convert Zone %s.", raw_json["iID"])
 
-        self._data = result = {"id": self._raw["iID"], "name": self._raw["strName"]}
-        raw_json = self._raw  # TODO: remove raw_json, use self._raw
+            return result
 
-        try:  # convert zone (v1 attributes)
-            result["type"] = ITYPE_TO_TYPE[raw_json["iType"]]
-            if raw_json["iType"] == ZONE_TYPE.TPI and raw_json["zoneSubType"] == 0:
-                result["type"] = ITYPE_TO_TYPE[ZONE_TYPE.ControlOnOffPID]
+        def convert_schedule() -> Dict:
+            result = {"schedule": {"timer": {}, "footprint": {}}}  # for all zone types
 
-            result["mode"] = IMODE_TO_MODE[raw_json["iMode"]]
+            try:  # convert timer schedule (v1 attributes)
+                if raw_json["iType"] not in [
+                    ZONE_TYPE.Manager,
+                    ZONE_TYPE.Surrogate,
+                ]:  # timer = {} if: Manager, Group
+                    on_off = raw_json["iType"] == ZONE_TYPE.OnOffTimer
+                    result["schedule"]["timer"] = SCHEDULE_CACHE.get(
+                        ["timer", on_off, raw_json["objTimer"]],
+                        lambda: timer_schedule(raw_json),
+                    )
 
-            if raw_json["iType"] in [ZONE_TYPE.ControlSP, ZONE_TYPE.TPI]:
-                # some zones have a fPV without raw_json["activeTemperatureDevices"]
-                result["temperature"] = raw_json["fPV"]
-                result["setpoint"] = raw_json["fSP"]
+            except (AttributeError, LookupError, TypeError, ValueError):
+                _LOGGER.exception(
+                    "Failed to convert Zone %s timer schedule.", raw_json["iID"]
+                )
+
+            try:  # convert footprint schedule (v1 attributes)
+                if raw_json["iType"] in [ZONE_TYPE.ControlSP]:
+                    # footprint={...} iff: ControlSP, _even_ if no PIR, otherwise ={}
+                    footprint = raw_json["objFootprint"]
+                    result["schedule"]["footprint"] = SCHEDULE_CACHE.get(
+                        [
+                            "footprint",
+                            footprint["fFootprintAwaySP"],
+                            footprint["iFootprintTmNightStart"],
+                            footprint["lstSP"],
+                        ],
+                        lambda: footprint_schedule(raw_json),
+                    )
+                    result["_schedule"] = {
+                        "footprint": {"profile": FOOTPRINT_MODES[footprint["iProfile"]]}
+                    }
 
-            if raw_json["iType"] == ZONE_TYPE.Manager:
-                if raw_json["fPV"]:
-                    result["temperature"] = raw_json["fPV"]
+            except (AttributeError, LookupError, TypeError, ValueError):
+                _LOGGER.exception(
+                    "Failed to convert Zone %s footprint schedule.", raw_json["iID"]
+                )
 
-            elif raw_json["iType"] == ZONE_TYPE.OnOffTimer:
-                result["setpoint"] = bool(raw_json["fSP"])
-
-            if self._has_pir:
-                if TYPE_TO_ITYPE[result["type"]] == ZONE_TYPE.ControlSP:
-                    result["occupied"] = is_occupied(raw_json)
-                else:
-                    result["_occupied"] = is_occupied(raw_json)
-
-            if raw_json["iType"] in [
-                ZONE_TYPE.OnOffTimer,
-                ZONE_TYPE.ControlSP,
-                ZONE_TYPE.TPI,
-            ]:
-                result["override"] = {}
-                result["override"]["duration"] = raw_json["iBoostTimeRemaining"]
-                if raw_json["iType"] == ZONE_TYPE.OnOffTimer:
-                    result["override"]["setpoint"] = raw_json["fBoostSP"] != 0
-                else:
-                    result["override"]["setpoint"] = raw_json["fBoostSP"]
-
-            result["schedule"] = {"timer": {}, "footprint": {}}  # for all zone types
-
-        except (AttributeError, LookupError, TypeError, ValueError):
-            _LOGGER.exception("Failed to convert Zone %s.", result["id"])
-
-        try:  # convert timer schedule (v1 attributes)
-            if raw_json["iType"] not in [
-                ZONE_TYPE.Manager,
-                ZONE_TYPE.Surrogate,
-            ]:  # timer = {} if: Manager, Group
-                result["schedule"]["timer"] = timer_schedule(raw_json)
-
-        except (AttributeError, LookupError, TypeError, ValueError):
-            _LOGGER.exception("Failed to convert Zone %s timer schedule.", result["id"])
-
-        try:  # convert footprint schedule (v1 attributes)
-            if raw_json["iType"] in [ZONE_TYPE.ControlSP]:
-                # footprint={...} iff: ControlSP, _even_ if no PIR, otherwise ={}
-                result["schedule"]["footprint"] = footprint_schedule(raw_json)
-                result["_schedule"] = {
-                    "footprint": {
-                        "profile": FOOTPRINT_MODES[raw_json["objFootprint"]["iProfile"]]
-                    }
-                }
+            return result
 
-        except (AttributeError, LookupError, TypeError, ValueError):
-            _LOGGER.exception(
-                "Failed to convert Zone %s footprint schedule.", result["id"]
-            )
+        def convert_extras() -> Dict:
+            result = {}
+            try:  # convert extras (v3 attributes)
+                result["_state"] = {"bIsActive": raw_json["bIsActive"]}
+                result["output"] = int(raw_json["bOutRequestHeat"])
 
-        try:  # convert extras (v3 attributes)
-            result["_state"] = {"bIsActive": raw_json["bIsActive"]}
-            result["output"] = int(raw_json["bOutRequestHeat"])
+                if raw_json["iType"] in [ZONE_TYPE.ControlSP]:
+                    result["_state"]["bInHeatEnabled"] = raw_json["bInHeatEnabled"]
 
-            if raw_json["iType"] in [ZONE_TYPE.ControlSP]:
-                result["_state"]["bInHeatEnabled"] = raw_json["bInHeatEnabled"]
+            except (AttributeError, LookupError, TypeError, ValueError):
+                _LOGGER.exception("Failed to convert Zone %s extras.", raw_json["iID"])
 
-        except (AttributeError, LookupError, TypeError, ValueError):
-            _LOGGER.exception("Failed to convert Zone %s extras.", result["id"])
+            return result
 
+        self._data = LazyData(
+            {"id": raw_json["iID"], "name": raw_json["strName"]},
+            [convert_zone, convert_schedule, convert_extras],
+            _SECTION_OF_KEY,
+        )
         return self._data
 
     @property
@@ -58,12 +58,12 @@ Examples:
 # import ast
 import argparse
 import asyncio
-import json
 import logging
 
 import aiohttp
 
 from geniushubclient import GeniusHub, GeniusTestHub
+from geniushubclient.codec import json_dumps, json_loads
 
 DEBUG_ADDR = "172.27.0.138"
 DEBUG_PORT = 5678
@@ -149,10 +149,10 @@ async def main(loop):
     # Option of providing test data (as list of Dicts), or leave both as None
     if FILE_MODE:
         with open("raw_zones.json", mode="r") as fh:
-            z = json.loads(fh.read())  # file from: ghclient zones -vvv
+            z = json_loads(fh.read())  # file from: ghclient zones -vvv
             # z = ast.literal_eval(fh.read())  # file from HA logs
         with open("raw_devices.json", mode="r") as fh:
-            d = json.loads(fh.read())  # file from: ghclient zones -vvv
+            d = json_loads(fh.read())  # file from: ghclient zones -vvv
             # d = ast.literal_eval(fh.read())  # file from HA logs
 
         session = None
@@ -188,7 +188,19 @@ async def main(loop):
 
         hub.verbosity = args.verbosity
 
-    await hub.update()  # initialise: enumerate all zones, devices & issues
+    # fetch only what is needed for the command (e.g. not the devices for zones)
+    if FILE_MODE:
+        kinds = None
+    elif args.device_id:
+        kinds = {"devices"}
+    elif args.zone_id:
+        kinds = {"zones", "devices"} if args.command == "devices" else {"zones"}
+    elif args.command in ("zones", "devices", "issues"):
+        kinds = {args.command}
+    else:  # args.command == "info"
+        kinds = {"version", "zones"} if hub.api_version == 3 else {"version"}
+
+    await hub.update(kinds=kinds)  # initialise: enumerate the zones, devices, etc.
     # ait hub.update()  # for testing, do twice in a row to check for no duplicates
 
     # these can be used for debugging, above - save as files, above
@@ -222,15 +234,15 @@ async def main(loop):
         elif args.temp:
             await zone.set_override(args.temp, args.secs)
         elif args.command == "devices":
-            print(json.dumps(zone.devices))
+            print(json_dumps(zone.devices))
         elif args.command == "issues":
-            print(json.dumps(zone.issues))
+            print(json_dumps(zone.issues))
         else:  # args.command == "info"
             if DEBUG_NO_SCHEDULES:
                 _info = {k: v for k, v in zone.data.items() if k != "schedule"}
-                print(json.dumps(_info))
+                print(json_dumps(_info))
             else:
-                print(json.dumps(zone.data))
+                print(json_dumps(zone.data))
 
     else:  # as per: args.hub_id
         if args.command == "reboot":
@@ -240,15 +252,15 @@ async def main(loop):
                 _zones = [
                     {k: v for k, v in z.items() if k != "schedule"} for z in hub.zones
                 ]
-                print(json.dumps(_zones))
+                print(json_dumps(_zones))
             else:
-                print(json.dumps(hub.zones))
+                print(json_dumps(hub.zones))
         elif args.command == "devices":
-            print(json.dumps(hub.devices))
+            print(json_dumps(hub.devices))
         elif args.command == "issues":
-            print(json.dumps(hub.issues))
+            print(json_dumps(hub.issues))
         else:  # args.command == "info"
-            print(f"VER = {json.dumps(hub.version)}")
+            print(f"VER = {json_dumps(hub.version)}")
             print(f"UID = {hub.uid}")
             if hub.api_version == 3:
                 print(f"XXX =", {"weatherData": hub.zone_by_id[0]._raw["weatherData"]})
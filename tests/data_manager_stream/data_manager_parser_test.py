@@ -0,0 +1,106 @@
+"""
+Tests for the DataManagerParser class
+"""
+
+import json
+import unittest
+
+from geniushubclient import GeniusHubBase
+from geniushubclient.stream import DataManagerParser
+
+
+class DataManagerParserTests(unittest.TestCase):
+    """
+    Test for the DataManagerParser Class.
+    """
+
+    raw_json = {
+        "error": 0,
+        "data": {
+            "addr": "root",
+            "childValues": {},
+            "childNodes": {
+                "WeatherData": {
+                    "addr": "WeatherData",
+                    "childNodes": {},
+                    "childValues": {"summary": {"val": 'a "}]" value'}},
+                },
+                "Genius": {
+                    "addr": "Genius",
+                    "childValues": {"count": {"val": [1, {"a": -1.5e3}, None]}},
+                    "childNodes": {
+                        "1": {"addr": "1", "childNodes": {}, "childValues": {}},
+                        "2": {
+                            "addr": "2",
+                            "childNodes": {
+                                "_cfg": {
+                                    "addr": "_cfg",
+                                    "childNodes": {},
+                                    "childValues": {"sku": {"val": "da-wrv-e"}},
+                                },
+                            },
+                            "childValues": {"location": {"val": "Kitchen"}},
+                        },
+                        "3": {
+                            "addr": "3",
+                            "childNodes": {
+                                "1": {
+                                    "addr": "1",
+                                    "childNodes": {},
+                                    "childValues": {"location": {"val": "Lounge"}},
+                                },
+                            },
+                            "childValues": {"location": {"val": "Lounge"}},
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+    def _parse(self, body, chunk_size) -> list:
+        parser = DataManagerParser()
+        result = []
+        for idx in range(0, len(body), chunk_size):
+            result += parser.feed(body[idx : idx + chunk_size])
+        return result + parser.close()
+
+    def test_when_parsed_in_chunks_then_records_match_the_non_streamed(self):
+        "Check that the records are the same, however the response is chunked"
+
+        body = json.dumps(self.raw_json, indent=1).encode("utf-8")
+        expected = GeniusHubBase._devices_via_v3_data_mgr(self.raw_json)
+
+        for chunk_size in (1, 3, 64, len(body)):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self._parse(body, chunk_size), expected)
+
+    def test_when_device_completes_then_its_records_are_returned(self):
+        "Check that a device's records are returned as soon as it completes"
+
+        body = json.dumps(self.raw_json).encode("utf-8")
+        end_of_device_2 = body.index(b'"3": {')
+
+        parser = DataManagerParser()
+        records = parser.feed(body[:end_of_device_2])
+
+        self.assertEqual([r["addr"] for r in records], ["2"])
+
+    def test_when_response_is_truncated_then_an_error_is_raised(self):
+        "Check that an incomplete response is not silently accepted"
+
+        body = json.dumps(self.raw_json).encode("utf-8")
+
+        self.assertRaises(ValueError, self._parse, body[:-1], 64)
+
+    def test_when_responses_are_identical_then_digests_are_identical(self):
+        "Check that the digest is of the raw bytes, however they are chunked"
+
+        body = json.dumps(self.raw_json).encode("utf-8")
+
+        parser_1, parser_2 = DataManagerParser(), DataManagerParser()
+        parser_1.feed(body)
+        parser_2.feed(body[:10])
+        parser_2.feed(body[10:])
+
+        self.assertEqual(parser_1.digest, parser_2.digest)
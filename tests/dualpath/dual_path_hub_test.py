@@ -0,0 +1,123 @@
+"""
+Tests for the DualPathHub class
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from geniushubclient import GeniusHub, RateLimiter
+from geniushubclient.dualpath import DualPathHub
+from geniushubclient.mock_hub import MockHub, MockHubServer
+
+
+class DualPathHubTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the DualPathHub Class.
+    """
+
+    async def asyncSetUp(self):
+        self.server = MockHubServer()
+        self.local = self.server.add_hub("local", MockHub())
+        self.cloud = self.server.add_hub(
+            "cloud",  # the same hub, via the cloud
+            MockHub(zones=self.local.zones, data_manager=self.local.data_manager),
+        )
+        await self.server.start()
+
+        self.hub = DualPathHub(
+            GeniusHub(
+                "local", "username", "password", base_url=self.server.url("local")
+            ),
+            GeniusHub(
+                "token",
+                base_url=self.server.url("cloud"),
+                rate_limiter=RateLimiter(1000, 1000, 1000, 1000),
+            ),
+            probe_interval=0,
+        )
+
+    async def asyncTearDown(self):
+        await self.hub.close()
+        await self.server.stop()
+
+    async def _updates(self, count, **kwargs):
+        for _ in range(count):
+            await self.hub.update(**kwargs)
+            await asyncio.sleep(0.01)  # for any probe to complete
+
+    async def test_when_latency_unknown_then_local_path_is_used(self):
+        "Check that the local path is used, until both paths are measured"
+
+        await self.hub.update()
+
+        self.assertEqual(self.hub.path, "local")
+
+    async def test_when_cloud_is_faster_then_cloud_path_is_used(self):
+        "Check that updates are routed to the faster of the paths"
+
+        self.local.latency = 0.05
+
+        await self._updates(4)
+
+        self.assertEqual(self.hub.path, "cloud")
+
+    async def test_when_local_fails_then_cloud_path_is_used(self):
+        "Check that an update fails over to the other path"
+
+        self.local.password = "wrong"
+
+        await self.hub.update()
+
+        self.assertEqual(self.hub.path, "cloud")
+
+    async def test_when_local_fails_then_it_is_unhealthy(self):
+        "Check that the stats show a failed path as unhealthy"
+
+        self.local.password = "wrong"
+
+        await self.hub.update()
+
+        self.assertFalse(self.hub.stats["local"]["healthy"])
+
+    async def test_when_local_recovers_then_local_path_is_used(self):
+        "Check that updates return to a path once it is faster & healthy again"
+
+        password, self.local.password = self.local.password, "wrong"
+        self.cloud.latency = 0.05
+        await self.hub.update()
+        self.local.password = password
+
+        with patch("geniushubclient.dualpath.DEFAULT_CIRCUIT_RESET", 0):
+            await self._updates(4)
+
+        self.assertEqual(self.hub.path, "local")
+
+    async def test_when_path_changes_then_results_are_the_same(self):
+        "Check that the zones are in the v1 schema, whichever path served them"
+
+        await self.hub.update()
+        local_zones = self.hub.zones
+        self.local.password = "wrong"
+        await self.hub.update()
+
+        self.assertEqual(self.hub.zones, local_zones)
+
+    async def test_when_an_update_is_skipped_then_its_latency_is_not_recorded(self):
+        "Check that an update within max_age does not count as a fast response"
+
+        self.local.latency = 0.05
+
+        await self._updates(4, max_age=60)
+
+        self.assertGreaterEqual(self.hub.stats["local"]["latency"], 0.05)
+
+    async def test_when_a_path_is_probed_then_max_age_is_ignored(self):
+        "Check that a probe always fetches, to measure the path"
+
+        self.cloud.latency = 0.02  # so that the local path serves every update
+        for _ in range(3):
+            await self.hub.update(max_age=60)
+            await asyncio.gather(*self.hub._probes.values())
+
+        self.assertEqual(self.cloud.requests["v1/zones"], 3)
@@ -0,0 +1,146 @@
+"""
+Tests for the GeniusHub class
+"""
+
+import gc
+
+from geniushubclient import ADDED, CHANGED, REMOVED
+from tests.hub_test_case import GeniusHubTestCase
+
+
+class _Listener:
+    def __init__(self, changes):
+        self.changes = changes
+
+    def on_change(self, change):
+        self.changes.append(change)
+
+
+class GeniusHubSubscribeTests(GeniusHubTestCase):
+    """
+    Test for the GeniusHub Class, publishing changes to listeners.
+    """
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.changes = []
+        self.listener = _Listener(self.changes)
+
+    async def test_when_subscribed_then_added_entities_are_published(self):
+        "Check that the first update publishes every zone & device as added"
+
+        self.hub.subscribe(self.listener.on_change)
+        await self.hub.update()
+
+        self.assertEqual(
+            [(c.kind, c.id, c.action) for c in self.changes],
+            [("zones", 0, ADDED), ("zones", 1, ADDED), ("zones", 2, ADDED)]
+            + [("devices", "2", ADDED)],
+        )
+
+    async def test_when_a_zone_changes_then_only_it_is_published(self):
+        "Check that a poll publishes only the changed zone"
+
+        await self.hub.update()
+        self.hub.subscribe(self.listener.on_change)
+        await self.set_temperature(22.5)
+
+        self.assertEqual([(c.id, c.action) for c in self.changes], [(1, CHANGED)])
+
+    async def test_when_a_zone_changes_then_the_changed_keys_are_published(self):
+        "Check that a change has the old & new values of the changed keys"
+
+        self.hub.subscribe(self.listener.on_change)
+        await self.hub.update()
+        await self.set_temperature(22.5)
+
+        self.assertEqual(self.changes[-1].changes, {"temperature": (19.5, 22.5)})
+
+    async def test_when_a_change_is_published_then_its_data_is_a_plain_dict(self):
+        "Check that a change's data is converted in full (e.g. for orjson)"
+
+        self.hub.subscribe(self.listener.on_change)
+        await self.hub.update()
+
+        self.assertIs(type(self.changes[0].data), dict)
+
+    async def test_when_a_zone_is_removed_then_it_is_published(self):
+        "Check that a zone gone from the hub is published as removed"
+
+        self.hub.subscribe(self.listener.on_change)
+        await self.hub.update()
+        del self.zones[2]
+        self.set_zones()
+        await self.hub.update()
+
+        self.assertEqual((self.changes[-1].id, self.changes[-1].action), (2, REMOVED))
+
+    async def test_when_subscribed_to_kinds_then_others_are_not_published(self):
+        "Check that a listener receives only the kinds it subscribed to"
+
+        self.hub.subscribe(self.listener.on_change, kinds={"devices"})
+        await self.hub.update()
+
+        self.assertEqual([c.kind for c in self.changes], ["devices"])
+
+    async def test_when_a_listener_is_dropped_then_it_is_not_called(self):
+        "Check that a callback is held weakly, via its object"
+
+        await self.hub.update()
+        self.hub.subscribe(self.listener.on_change)
+        del self.listener
+        gc.collect()
+        await self.set_temperature(22.5)
+
+        self.assertEqual(self.changes, [])
+
+    async def test_when_unsubscribed_then_a_listener_is_not_called(self):
+        "Check that an unsubscribed callback is not called"
+
+        await self.hub.update()
+        self.hub.subscribe(self.listener.on_change)
+        self.hub.unsubscribe(self.listener.on_change)
+        await self.set_temperature(22.5)
+
+        self.assertEqual(self.changes, [])
+
+    async def test_when_iterated_then_a_subscription_yields_changes(self):
+        "Check that a Subscription is an async iterator of the changes"
+
+        await self.hub.update()
+        subscription = self.hub.subscribe()
+        await self.set_temperature(22.5)
+
+        change = await subscription.__anext__()
+
+        self.assertEqual(change.changes, {"temperature": (19.5, 22.5)})
+
+    async def test_when_a_subscription_falls_behind_then_changes_coalesce(self):
+        "Check that a slow listener has one (merged) change per entity"
+
+        await self.hub.update()
+        subscription = self.hub.subscribe()
+        await self.set_temperature(22.5)
+        await self.set_temperature(23.0)
+
+        change = await subscription.__anext__()
+
+        self.assertEqual(change.changes, {"temperature": (19.5, 23.0)})
+
+    async def test_when_a_subscription_falls_behind_then_its_backlog_is_bounded(self):
+        "Check that a slow listener's pending changes are no more than the entities"
+
+        await self.hub.update()
+        subscription = self.hub.subscribe()
+        for temperature in range(10):
+            await self.set_temperature(21.0 + temperature)
+
+        self.assertEqual(subscription.pending, 1)
+
+    async def test_when_a_subscription_is_dropped_then_it_is_not_held(self):
+        "Check that a Subscription is held weakly"
+
+        self.hub.subscribe()
+        gc.collect()
+
+        self.assertFalse(self.hub._listeners)
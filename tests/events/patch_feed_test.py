@@ -0,0 +1,80 @@
+"""
+Tests for the PatchFeed class
+"""
+
+from geniushubclient import PatchFeed, apply_patch
+from tests.hub_test_case import GeniusHubTestCase
+
+
+class PatchFeedTests(GeniusHubTestCase):
+    """
+    Test for the PatchFeed Class, a feed of JSON Patches of a hub's state.
+    """
+
+    async def test_when_a_zone_changes_then_its_patch_replaces_the_value(self):
+        "Check that a changed key is patched by a replace op"
+
+        await self.hub.update()
+        feed = PatchFeed(self.hub)
+        await self.set_temperature(22.5)
+
+        self.assertEqual(
+            feed.patches_since(feed.seq - 1).patches,
+            [(1, [{"op": "replace", "path": "/zones/1/temperature", "value": 22.5}])],
+        )
+
+    async def test_when_a_replica_has_no_state_then_it_is_given_a_snapshot(self):
+        "Check that a replica with no state is given a snapshot"
+
+        await self.hub.update()
+        feed = PatchFeed(self.hub)
+
+        self.assertEqual(
+            feed.patches_since().snapshot["zones"]["1"], self.hub.zone_by_id[1].data
+        )
+
+    async def test_when_a_replica_applies_the_patches_then_it_is_in_sync(self):
+        "Check that a snapshot, plus the later patches, is the feed's state"
+
+        await self.hub.update()
+        feed = PatchFeed(self.hub)
+        replica = feed.patches_since()
+        state, seq = replica.snapshot, replica.seq
+        await self.set_temperature(22.5)
+        del self.zones[2]
+        self.set_zones()
+        await self.hub.update()
+
+        for _, ops in feed.patches_since(seq).patches:
+            apply_patch(state, ops)
+
+        self.assertEqual(state, feed.snapshot())
+
+    async def test_when_a_replica_is_up_to_date_then_there_are_no_patches(self):
+        "Check that a replica at the latest seq is given nothing"
+
+        await self.hub.update()
+        feed = PatchFeed(self.hub)
+        await self.set_temperature(22.5)
+
+        self.assertEqual(feed.patches_since(feed.seq), (feed.seq, [], None))
+
+    async def test_when_a_replica_falls_out_of_the_log_then_it_is_resynced(self):
+        "Check that a replica behind the log is given a snapshot"
+
+        await self.hub.update()
+        feed = PatchFeed(self.hub, size=2)
+        for temperature in range(3):
+            await self.set_temperature(21.0 + temperature)
+
+        self.assertIsNotNone(feed.patches_since(0).snapshot)
+
+    async def test_when_a_replica_is_in_the_log_then_it_is_not_resynced(self):
+        "Check that a replica within the log is given only the patches"
+
+        await self.hub.update()
+        feed = PatchFeed(self.hub, size=2)
+        for temperature in range(3):
+            await self.set_temperature(21.0 + temperature)
+
+        self.assertEqual([s for s, _ in feed.patches_since(1).patches], [2, 3])
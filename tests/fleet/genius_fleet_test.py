@@ -0,0 +1,95 @@
+"""
+Tests for the GeniusFleet class
+"""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+
+from geniushubclient.fleet import GeniusFleet
+
+
+class GeniusFleetTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the GeniusFleet Class.
+    """
+
+    _interval = 0.2
+
+    async def asyncSetUp(self):
+        self.fleet = GeniusFleet(interval=self._interval)
+        self.started = {}
+
+        for idx in range(4):
+            hub_id = f"192.168.0.{100 + idx}"
+            hub = self.fleet.add_hub(hub_id, "username", "password")
+            hub.update = AsyncMock(side_effect=self._update(hub_id))
+
+    async def asyncTearDown(self):
+        await self.fleet.close()
+
+    def _update(self, hub_id):
+        async def update():
+            self.started.setdefault(hub_id, time.monotonic())
+
+        return update
+
+    async def test_when_started_then_polls_are_staggered_across_interval(self):
+        "Check that the hubs' polls are spread evenly across the interval"
+
+        self.fleet.start()
+        await asyncio.sleep(self._interval * 0.9)
+
+        starts = sorted(self.started.values())
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+
+        self.assertTrue(all(gap > self._interval / 4 * 0.5 for gap in gaps))
+
+    async def test_when_hubs_are_added_then_they_share_the_session(self):
+        "Check that every hub uses the fleet's connection pool"
+
+        sessions = {h.genius_service._session for h in self.fleet.hubs.values()}
+
+        self.assertEqual(len(sessions), 1)
+
+    async def test_when_polls_succeed_then_hubs_are_healthy(self):
+        "Check that the stats count hubs whose latest poll succeeded"
+
+        self.fleet.start()
+        await asyncio.sleep(self._interval)
+
+        self.assertEqual(self.fleet.stats["hubs_healthy"], 4)
+
+    async def test_when_a_poll_fails_then_the_hub_is_unhealthy(self):
+        "Check that the stats exclude hubs whose latest poll failed"
+
+        hub = self.fleet.hubs["192.168.0.100"]
+        hub.update.side_effect = aiohttp.ClientConnectionError()
+
+        self.fleet.start()
+        await asyncio.sleep(self._interval)
+
+        self.assertEqual(self.fleet.stats["hubs_healthy"], 3)
+
+    async def test_when_a_poll_fails_unexpectedly_then_the_hub_is_unhealthy(self):
+        "Check that any exception of a poll marks the hub as unhealthy"
+
+        hub = self.fleet.hubs["192.168.0.100"]
+        hub.update.side_effect = [None, RuntimeError("unexpected")]  # healthy, first
+
+        self.fleet.start()
+        await asyncio.sleep(self._interval * 1.5)
+
+        self.assertEqual(self.fleet.stats["hubs_healthy"], 3)
+
+    async def test_when_the_stats_are_not_read_then_old_polls_are_forgotten(self):
+        "Check that the completed polls are pruned by each poll, not only by stats"
+
+        with patch("geniushubclient.fleet.DEFAULT_FLEET_STATS_WINDOW", 0):
+            self.fleet.start()
+            await asyncio.sleep(self._interval)
+
+        self.assertLessEqual(len(self.fleet._completed), 1)
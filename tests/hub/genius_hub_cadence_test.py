@@ -0,0 +1,83 @@
+"""
+Tests for the GeniusHub class, fetching each endpoint at its own cadence
+"""
+
+import asyncio
+import unittest
+
+import aiohttp
+
+from geniushubclient import GeniusHub
+from geniushubclient.mock_hub import MockHubServer
+
+
+class GeniusHubCadenceTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the GeniusHub Class, with a cadence per endpoint.
+    """
+
+    async def asyncSetUp(self):
+        self.server = MockHubServer()
+        self.mock_hub = self.server.add_hub("hub-1")
+        await self.server.start()
+
+        self.hub = GeniusHub(
+            "hub-1",
+            "username",
+            "password",
+            base_url=self.server.url("hub-1"),
+            cadence={"data_manager": 0.2, "auth/release": None},
+        )
+
+    async def asyncTearDown(self):
+        await self.hub.close()
+        await self.server.stop()
+
+    async def test_when_endpoint_has_no_cadence_then_fetched_every_update(self):
+        "Check that the zones are fetched by every update"
+
+        for _ in range(3):
+            await self.hub.update()
+
+        self.assertEqual(self.mock_hub.requests["v3/zones"], 3)
+
+    async def test_when_endpoint_not_due_then_not_fetched(self):
+        "Check that the data_manager is not refetched within its cadence"
+
+        for _ in range(3):
+            await self.hub.update()
+
+        self.assertEqual(self.mock_hub.requests["v3/data_manager"], 1)
+
+    async def test_when_endpoint_due_then_fetched(self):
+        "Check that the data_manager is refetched once its cadence has elapsed"
+
+        await self.hub.update()
+        await asyncio.sleep(0.25)
+        await self.hub.update()
+
+        self.assertEqual(self.mock_hub.requests["v3/data_manager"], 2)
+
+    async def test_when_zones_change_then_state_is_merged(self):
+        "Check that the zones are updated, with the devices as last fetched"
+
+        await self.hub.update()
+        self.mock_hub.zones[1]["fPV"] = 22.5
+        await self.hub.update()
+
+        self.assertEqual(
+            (self.hub.zone_by_id[1].data["temperature"], len(self.hub.devices)),
+            (22.5, 1),
+        )
+
+    async def test_when_update_failed_then_all_are_refetched(self):
+        "Check that the endpoints fetched once are refetched after a failure"
+
+        await self.hub.update()
+        password, self.mock_hub.password = self.mock_hub.password, "wrong"
+        with self.assertRaises(aiohttp.ClientResponseError):
+            await self.hub.update()
+        self.mock_hub.password = password
+        await self.hub.update()
+
+        self.assertEqual(self.mock_hub.requests["v3/auth/release"], 2)
@@ -0,0 +1,96 @@
+"""
+Tests for the GeniusHub class, fetching only the endpoints needed
+"""
+
+import unittest
+
+from geniushubclient import GeniusHub, NotLoadedError
+from geniushubclient.mock_hub import MockHubServer
+
+
+class GeniusHubFetchPlanTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the GeniusHub Class, with update(kinds=..., verbosity=...).
+    """
+
+    async def asyncSetUp(self):
+        self.server = MockHubServer()
+        self.mock_hub = self.server.add_hub("hub-1")
+        await self.server.start()
+
+        url = self.server.url("hub-1")
+        self.hub = GeniusHub("hub-1", "username", "password", base_url=url)
+        self.hub_v1 = GeniusHub("token", base_url=url)
+
+    async def asyncTearDown(self):
+        await self.hub.close()
+        await self.hub_v1.close()
+        await self.server.stop()
+
+    async def test_when_zones_needed_then_data_manager_not_fetched(self):
+        "Check that the (large) data_manager is not fetched for the zones"
+
+        await self.hub.update(kinds={"zones"})
+
+        self.assertNotIn("v3/data_manager", self.mock_hub.requests)
+
+    async def test_when_zones_needed_then_zones_are_loaded(self):
+        "Check that the zones are converted, when only they are needed"
+
+        await self.hub.update(kinds={"zones"})
+
+        self.assertEqual(len(self.hub.zones), 3)
+
+    async def test_when_devices_not_loaded_then_error_is_raised(self):
+        "Check that reading a kind that was not loaded raises NotLoadedError"
+
+        await self.hub.update(kinds={"zones"})
+
+        with self.assertRaises(NotLoadedError):
+            self.hub.devices
+
+    async def test_when_issues_needed_then_devices_are_fetched(self):
+        "Check that the v3 issues fetch the devices, via which they are converted"
+
+        await self.hub.update(kinds={"issues"})
+
+        self.assertEqual(self.mock_hub.requests["v3/data_manager"], 1)
+
+    async def test_when_all_needed_after_some_then_all_are_loaded(self):
+        "Check that a full update after a partial one loads every kind"
+
+        await self.hub.update(kinds={"zones"})
+        await self.hub.update()
+
+        self.assertEqual([d["id"] for d in self.hub.devices], ["2"])
+
+    async def test_when_kind_invalid_then_value_error(self):
+        "Check that an unknown kind of entity raises ValueError"
+
+        with self.assertRaises(ValueError):
+            await self.hub.update(kinds={"weather"})
+
+    async def test_when_v1_verbosity_0_then_summary_fetched(self):
+        "Check that v1 verbosity 0 uses the /summary endpoints"
+
+        await self.hub_v1.update(kinds={"zones", "devices"}, verbosity=0)
+
+        self.assertEqual(
+            sorted(self.mock_hub.requests), ["v1/devices/summary", "v1/zones/summary"]
+        )
+
+    async def test_when_v1_summary_loaded_then_zones_have_summary_keys(self):
+        "Check that the zones of a summary have the summary keys"
+
+        await self.hub_v1.update(kinds={"zones"}, verbosity=0)
+
+        self.assertEqual(sorted(self.hub_v1.zones[1]), ["id", "name", "output"])
+
+    async def test_when_v1_summary_read_in_detail_then_error_is_raised(self):
+        "Check that reading a summary at a higher verbosity raises NotLoadedError"
+
+        await self.hub_v1.update(kinds={"zones"}, verbosity=0)
+        self.hub_v1.verbosity = 1
+
+        with self.assertRaises(NotLoadedError):
+            self.hub_v1.zones
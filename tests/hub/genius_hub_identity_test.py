@@ -0,0 +1,85 @@
+"""
+Tests for the GeniusHub class
+"""
+
+from tests.hub_test_case import GeniusHubTestCase
+
+
+class GeniusHubIdentityTests(GeniusHubTestCase):
+    """
+    Test for the GeniusHub Class, updating zones/devices in place.
+    """
+
+    async def test_when_a_zone_changes_then_its_object_is_kept(self):
+        "Check that a changed zone is updated in place"
+
+        await self.hub.update()
+        zone = self.hub.zone_by_id[1]
+        self.change_zone(1, fPV=22.5)
+        await self.hub.update()
+
+        self.assertIs(self.hub.zone_by_id[1], zone)
+
+    async def test_when_updated_then_the_dicts_are_kept(self):
+        "Check that zone_by_id is updated in place"
+
+        await self.hub.update()
+        zone_by_id = self.hub.zone_by_id
+        self.change_zone(1, fPV=22.5)
+        await self.hub.update()
+
+        self.assertIs(self.hub.zone_by_id, zone_by_id)
+
+    async def test_when_first_updated_then_all_entities_are_added(self):
+        "Check that the first update reports every zone & device as added"
+
+        await self.hub.update()
+
+        self.assertEqual(
+            self.hub.entities_added, self.hub.zone_objs + self.hub.device_objs
+        )
+
+    async def test_when_a_zone_is_removed_then_it_is_reported(self):
+        "Check that a zone gone from the hub is reported as removed"
+
+        await self.hub.update()
+        zone = self.hub.zone_by_id[2]
+        del self.zones[2]
+        self.set_zones()
+        await self.hub.update()
+
+        self.assertEqual(self.hub.entities_removed, [zone])
+
+    async def test_when_a_zone_is_removed_then_it_is_not_known(self):
+        "Check that a zone gone from the hub is no longer in zone_by_id"
+
+        await self.hub.update()
+        del self.zones[2]
+        self.set_zones()
+        await self.hub.update()
+
+        self.assertNotIn(2, self.hub.zone_by_id)
+
+    async def test_when_a_zone_is_added_then_it_is_reported(self):
+        "Check that a zone new to the hub is reported as added"
+
+        await self.hub.update()
+        self.zones.append(dict(self.zones[1], iID=3, strName="Kitchen"))
+        self.set_zones()
+        await self.hub.update()
+
+        self.assertEqual(self.hub.entities_added, [self.hub.zone_by_id[3]])
+
+    async def test_when_updated_then_devices_are_assigned_to_zones(self):
+        "Check that a device is assigned to the zone of its location"
+
+        await self.hub.update()
+
+        self.assertEqual(list(self.hub.zone_by_id[1].device_by_id), ["2"])
+
+    async def test_when_updated_then_zones_without_devices_have_none(self):
+        "Check that a zone with no device at its location has no devices"
+
+        await self.hub.update()
+
+        self.assertEqual(self.hub.zone_by_id[2].device_objs, [])
@@ -0,0 +1,86 @@
+"""
+Tests for the GeniusHub class
+"""
+
+from geniushubclient import NotLoadedError
+from tests.hub_test_case import GeniusHubTestCase
+
+
+class GeniusHubLeanTests(GeniusHubTestCase):
+    """
+    Test for the GeniusHub Class, in lean mode (keeping no raw JSON).
+    """
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.lean_hub = self.make_hub(lean=True)
+
+    async def _update(self):
+        for hub in self.hubs:
+            await hub.update(verbosity=2)
+
+    async def test_when_lean_then_the_zones_are_the_same(self):
+        "Check that a lean hub's zones are those of any other hub"
+
+        await self._update()
+
+        self.assertEqual(self.lean_hub.zones, self.hub.zones)
+
+    async def test_when_lean_then_the_devices_are_the_same(self):
+        "Check that a lean hub's devices are those of any other hub"
+
+        await self._update()
+
+        self.assertEqual(self.lean_hub.devices, self.hub.devices)
+
+    async def test_when_lean_then_only_the_lean_keys_of_the_raw_json_are_kept(self):
+        "Check that a lean zone keeps only a few keys of its raw JSON"
+
+        await self._update()
+
+        self.assertEqual(
+            self.lean_hub.zone_by_id[1]._raw,
+            {"iID": 1, "iFlagExpectedKit": 517, "iType": 3},
+        )
+
+    async def test_when_lean_then_the_hub_keeps_no_raw_json(self):
+        "Check that a lean hub drops the raw JSON of its zones"
+
+        await self._update()
+
+        self.assertIsNone(self.lean_hub._zones)
+
+    async def test_when_lean_and_only_the_zones_change_then_devices_are_kept(self):
+        "Check that a lean hub keeps its devices when only the zones change"
+
+        await self._update()
+        self.change_zone(1, fPV=22.5)
+        await self._update()
+
+        self.assertEqual(self.lean_hub.zone_by_id[1].device_objs[0].id, "2")
+
+    async def test_when_lean_and_a_zone_changes_then_it_is_reconverted(self):
+        "Check that a lean hub's zone is updated when its JSON changes"
+
+        await self._update()
+        self.change_zone(1, fPV=22.5)
+        await self._update()
+
+        self.assertEqual(self.lean_hub.zone_by_id[1].data["temperature"], 22.5)
+
+    async def test_when_lean_then_the_raw_json_cannot_be_read(self):
+        "Check that verbosity=3 raises NotLoadedError on a lean hub"
+
+        await self._update()
+        self.lean_hub.verbosity = 3
+
+        with self.assertRaises(NotLoadedError):
+            self.lean_hub.zones
+
+    async def test_when_lean_and_the_kinds_change_then_the_zones_are_loaded(self):
+        "Check that a lean hub loads the zones decoded by an update of other kinds"
+
+        await self.lean_hub.update(kinds={"issues"})
+        await self.lean_hub.update(kinds={"zones"})
+
+        self.assertEqual(len(self.lean_hub.zones), 3)
@@ -0,0 +1,70 @@
+"""
+Tests for the GeniusHub class
+"""
+
+from tests.hub_test_case import GeniusHubTestCase
+
+
+class GeniusHubReconversionTests(GeniusHubTestCase):
+    """
+    Test for the GeniusHub Class, reconverting only the changed zones/devices.
+    """
+
+    async def test_when_first_updated_then_all_entities_are_converted(self):
+        "Check that the first update converts every zone & device"
+
+        await self.hub.update()
+
+        self.assertEqual(
+            self.hub.entities_reconverted,
+            len(self.hub.zone_objs) + len(self.hub.device_objs),
+        )
+
+    async def test_when_a_zone_changes_then_only_it_is_reconverted(self):
+        "Check that only the changed zone is reconverted"
+
+        await self.hub.update()
+        self.change_zone(1, fPV=22.5)
+        await self.hub.update()
+
+        self.assertEqual(self.hub.entities_reconverted, 1)
+
+    async def test_when_a_zone_changes_then_the_others_are_skipped(self):
+        "Check that the unchanged zones & devices are counted as skipped"
+
+        await self.hub.update()
+        self.change_zone(1, fPV=22.5)
+        await self.hub.update()
+
+        self.assertEqual(
+            self.hub.entities_skipped,
+            len(self.hub.zone_objs) + len(self.hub.device_objs) - 1,
+        )
+
+    async def test_when_a_zone_changes_then_its_data_is_current(self):
+        "Check that a reconverted zone has the latest data"
+
+        await self.hub.update()
+        self.hub.zone_by_id[1].data  # noqa: B018; converted before the change
+        self.change_zone(1, fPV=22.5)
+        await self.hub.update()
+
+        self.assertEqual(self.hub.zone_by_id[1].data["temperature"], 22.5)
+
+    async def test_when_a_zone_is_unchanged_then_its_data_is_kept(self):
+        "Check that an unchanged zone keeps its converted data"
+
+        await self.hub.update()
+        data = self.hub.zone_by_id[2].data
+        self.change_zone(1, fPV=22.5)
+        await self.hub.update()
+
+        self.assertIs(self.hub.zone_by_id[2].data, data)
+
+    async def test_when_a_poll_is_unchanged_then_all_are_skipped(self):
+        "Check that an unchanged poll reconverts nothing"
+
+        await self.hub.update()
+        await self.hub.update()
+
+        self.assertEqual(self.hub.entities_reconverted, 0)
@@ -0,0 +1,73 @@
+"""
+Tests for the GeniusHub class
+"""
+
+import asyncio
+
+from tests.hub_test_case import GeniusHubTestCase
+
+
+class GeniusHubSingleFlightTests(GeniusHubTestCase):
+    """
+    Test for the GeniusHub Class, coalescing of concurrent updates.
+    """
+
+    latency = 0.01
+
+    async def test_when_updates_overlap_then_requests_are_made_once(self):
+        "Check that concurrent updates share the one set of requests"
+
+        await asyncio.gather(*[self.hub.update() for _ in range(5)])
+
+        self.assertEqual(self.request_raw.await_count, 3)
+
+    async def test_when_updates_are_sequential_then_requests_are_repeated(self):
+        "Check that an update made after another has finished is not shared"
+
+        await self.hub.update()
+        await self.hub.update()
+
+        self.assertEqual(self.request_raw.await_count, 6)
+
+    async def test_when_update_is_fresh_enough_then_no_requests_are_made(self):
+        "Check that an update within max_age of the latest update is skipped"
+
+        await self.hub.update()
+        await self.hub.update(max_age=60)
+
+        self.assertEqual(self.request_raw.await_count, 3)
+
+    async def test_when_update_fails_then_all_callers_get_the_exception(self):
+        "Check that the outcome of a shared update is given to every caller"
+
+        self.request_raw.side_effect = ValueError("hub error")
+
+        results = await asyncio.gather(
+            *[self.hub.update() for _ in range(3)], return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+    async def test_when_closed_then_an_update_in_flight_is_cancelled(self):
+        "Check that closing the hub cancels an update that is in flight"
+
+        task = asyncio.ensure_future(self.hub.update())
+        await asyncio.sleep(0)
+        await self.hub.close()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_when_a_full_update_overlaps_a_partial_one_then_all_are_loaded(self):
+        "Check that a concurrent update of fewer kinds does not unload the others"
+
+        await asyncio.gather(self.hub.update(), self.hub.update(kinds={"zones"}))
+
+        self.assertEqual([d["id"] for d in self.hub.devices], ["2"])
+
+    async def test_when_a_partial_update_is_followed_by_a_full_one_then_merged(self):
+        "Check that an update queued behind another loads the kinds of both"
+
+        await asyncio.gather(self.hub.update(kinds={"zones"}), self.hub.update())
+
+        self.assertEqual([d["id"] for d in self.hub.devices], ["2"])
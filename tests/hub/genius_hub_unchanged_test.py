@@ -0,0 +1,37 @@
+"""
+Tests for the GeniusHub class
+"""
+
+from tests.hub_test_case import GeniusHubTestCase
+
+
+class GeniusHubUnchangedTests(GeniusHubTestCase):
+    """
+    Test for the GeniusHub Class, skipping unchanged responses.
+    """
+
+    async def test_when_responses_unchanged_then_poll_is_short_circuited(self):
+        "Check that a poll with no changed responses is counted as unchanged"
+
+        await self.hub.update()
+        await self.hub.update()
+
+        self.assertEqual(self.hub.unchanged_polls, 1)
+
+    async def test_when_responses_unchanged_then_objects_are_kept(self):
+        "Check that a poll with no changed responses keeps the existing zones"
+
+        await self.hub.update()
+        zone = self.hub.zone_by_id[0]
+        await self.hub.update()
+
+        self.assertIs(self.hub.zone_by_id[0], zone)
+
+    async def test_when_a_response_changes_then_it_is_converted(self):
+        "Check that a changed response is decoded and converted"
+
+        await self.hub.update()
+        self.change_zone(0, strName="Our House")
+        await self.hub.update()
+
+        self.assertEqual(self.hub.zone_by_id[0].name, "Our House")
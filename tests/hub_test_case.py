@@ -0,0 +1,64 @@
+"""
+A base class for the tests of GeniusHub, with its responses served from fixtures
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock
+
+from geniushubclient import GeniusHub
+from geniushubclient.mock_hub import default_data_manager, default_zones
+
+
+class GeniusHubTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Base for the tests of the GeniusHub Class, polling a (mock) small house.
+
+    The hub's requests are served from self.responses, by endpoint. The zones are
+    in self.zones (a manager, the Lounge & hot water), and set_zones() serves them.
+    """
+
+    latency = 0.0  # the delay before each response, in seconds
+
+    async def asyncSetUp(self):
+        self.zones = default_zones()
+        self.responses = {
+            "data_manager": json.dumps(default_data_manager()).encode(),
+            "auth/release": json.dumps(
+                {"error": 0, "data": {"release": "5.3.6", "UID": "0x01"}}
+            ).encode(),
+        }
+        self.set_zones()
+
+        async def request_raw(method, url, data=None):
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self.responses[url]
+
+        self.request_raw = AsyncMock(side_effect=request_raw)
+        self.hubs = []
+        self.hub = self.make_hub()
+
+    async def asyncTearDown(self):
+        for hub in self.hubs:
+            await hub.close()
+
+    def make_hub(self, **kwargs) -> GeniusHub:
+        """Return a (v3) hub whose requests are served from self.responses."""
+        hub = GeniusHub("192.168.0.100", "username", "password", **kwargs)
+        hub.genius_service.request_raw = self.request_raw
+        self.hubs.append(hub)
+        return hub
+
+    def set_zones(self):
+        self.responses["zones"] = json.dumps({"error": 0, "data": self.zones}).encode()
+
+    def change_zone(self, zone_id, **changes):
+        [zone for zone in self.zones if zone["iID"] == zone_id][0].update(changes)
+        self.set_zones()
+
+    async def set_temperature(self, temperature):
+        """Change the Lounge's temperature, and update the hub."""
+        self.change_zone(1, fPV=temperature)
+        await self.hub.update()
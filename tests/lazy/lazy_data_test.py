@@ -0,0 +1,161 @@
+"""
+Tests for the LazyData class
+"""
+
+import copy
+import json
+import unittest
+from unittest.mock import Mock
+
+import orjson
+
+from geniushubclient.codec import json_dumps
+from geniushubclient.lazy import LazyData
+from geniushubclient.mock_hub import default_zones
+from geniushubclient.zone import GeniusZone
+
+
+class LazyDataTests(unittest.TestCase):
+    """
+    Test for the LazyData Class, a dict whose sections are converted when read.
+    """
+
+    def setUp(self):
+        self.conversions = []
+        self.data = self._data()
+
+    def _data(self):
+        def section(idx, **values):
+            def convert():
+                self.conversions.append(idx)
+                return values
+
+            return convert
+
+        return LazyData(
+            {"id": 1, "name": "Lounge"},
+            [section(0, mode="timer"), section(1, schedule={"timer": {}})],
+            {"mode": 0, "schedule": 1},
+        )
+
+    def test_when_an_eager_key_is_read_then_nothing_is_converted(self):
+        "Check that reading the name converts no section"
+
+        self.data["name"]
+
+        self.assertEqual(self.conversions, [])
+
+    def test_when_a_lazy_key_is_read_then_only_its_section_is_converted(self):
+        "Check that reading the mode converts only its section"
+
+        self.data["mode"]
+
+        self.assertEqual(self.conversions, [0])
+
+    def test_when_a_key_is_read_twice_then_its_section_is_converted_once(self):
+        "Check that a section is converted only once"
+
+        self.data["schedule"]
+        self.data.get("schedule")
+
+        self.assertEqual(self.conversions, [1])
+
+    def test_when_sections_are_read_out_of_order_then_the_key_order_is_kept(self):
+        "Check that the keys are in section order, whatever the order read"
+
+        self.data["schedule"]
+        self.data["mode"]
+
+        self.assertEqual(list(self.data), ["id", "name", "mode", "schedule"])
+
+    def test_when_a_subset_is_taken_then_only_its_sections_are_converted(self):
+        "Check that a subset converts only the sections of its keys"
+
+        self.data.subset(("id", "mode"))
+
+        self.assertEqual(self.conversions, [0])
+
+    def test_when_compared_with_a_dict_then_it_is_equal(self):
+        "Check that the data compares equal to the same plain dict"
+
+        self.assertEqual(
+            self.data,
+            {"id": 1, "name": "Lounge", "mode": "timer", "schedule": {"timer": {}}},
+        )
+
+    def test_when_compared_with_unconverted_data_then_it_is_equal(self):
+        "Check that the data compares equal to the same data, not yet converted"
+
+        self.data["mode"]
+
+        self.assertEqual(self.data, self._data())
+
+    def test_when_compared_with_unconverted_data_then_it_is_not_unequal(self):
+        "Check that the data does not compare unequal to the same, unconverted data"
+
+        self.data["mode"]
+
+        self.assertFalse(self.data != self._data())
+
+    def test_when_reversed_then_every_key_is_included(self):
+        "Check that reversing the data converts every section first"
+
+        self.assertEqual(list(reversed(self.data)), ["schedule", "mode", "name", "id"])
+
+    def test_when_copied_then_it_is_a_plain_dict(self):
+        "Check that a copy is a plain dict"
+
+        self.assertIs(type(copy.copy(self.data)), dict)
+
+    def test_when_changed_then_every_section_is_converted_first(self):
+        "Check that a change is made to the whole of the data"
+
+        self.data["mode"] = "off"
+
+        self.assertEqual(self.data["schedule"], {"timer": {}})
+
+
+class LazyZoneDataTests(unittest.TestCase):
+    """
+    Test for the lazy data of the GeniusZone Class.
+    """
+
+    def setUp(self):
+        self.hub = Mock()
+        self.hub.api_version = 3
+        self.hub.verbosity = 1
+        self.raw_json = default_zones()[1]  # the Lounge
+
+    def _zone(self):
+        return GeniusZone(self.raw_json["iID"], copy.deepcopy(self.raw_json), self.hub)
+
+    def test_when_the_name_is_read_then_the_schedule_is_not_converted(self):
+        "Check that reading a zone's name does not convert its schedule"
+
+        zone = self._zone()
+
+        zone.name
+
+        self.assertNotIn("schedule", dict.keys(zone.data))
+
+    def test_when_serialised_then_the_json_is_that_of_the_whole_dict(self):
+        "Check that json.dumps sees every section, as for a plain dict"
+
+        zone = self._zone()
+
+        self.assertEqual(json.dumps(zone.data), json.dumps(dict(self._zone().data)))
+
+    def test_when_info_is_serialised_by_orjson_then_it_is_complete(self):
+        "Check that orjson sees every section of a zone's info, at verbosity 2"
+
+        self.hub.verbosity = 2
+        zone = self._zone()
+
+        self.assertEqual(orjson.loads(orjson.dumps(zone.info)), dict(self._zone().data))
+
+    def test_when_serialised_by_the_codec_then_every_section_is_included(self):
+        "Check that json_dumps converts every section"
+
+        zone = self._zone()
+
+        self.assertEqual(json.loads(json_dumps(zone.data)), dict(self._zone().data))
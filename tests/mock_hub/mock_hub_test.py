@@ -0,0 +1,133 @@
+"""
+Tests for the MockHubServer class
+"""
+
+import asyncio
+import unittest
+
+import aiohttp
+
+from geniushubclient import GeniusHub
+from geniushubclient.const import IMODE_TO_MODE
+from geniushubclient.mock_hub import MockHub, MockHubServer
+
+
+class MockHubServerTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the MockHubServer Class.
+    """
+
+    async def asyncSetUp(self):
+        self.server = MockHubServer()
+        self.mock_hub = self.server.add_hub("hub-1", MockHub())
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    def _hub(self, key="hub-1", username="username", password="password"):
+        return GeniusHub(
+            key, username, password, base_url=self.server.url(key), pooled=True
+        )
+
+    async def test_when_v3_hub_updated_then_zones_are_converted(self):
+        "Check that a GeniusHub can poll a virtual hub, via the v3 API"
+
+        async with self._hub() as hub:
+            await hub.update()
+
+        self.assertEqual(
+            [z["name"] for z in hub.zones], ["My House", "Lounge", "Hot Water"]
+        )
+
+    async def test_when_v3_hub_updated_then_devices_are_converted(self):
+        "Check that the devices of the data_manager are converted"
+
+        async with self._hub() as hub:
+            await hub.update()
+
+        self.assertEqual([d["id"] for d in hub.devices], ["2"])
+
+    async def test_when_v3_override_set_then_hub_state_is_changed(self):
+        "Check that a PATCH changes the state of the virtual hub"
+
+        async with self._hub() as hub:
+            await hub.update()
+            await hub.zone_by_id[1].set_override(21.5)
+
+        self.assertEqual(self.mock_hub.zones[1]["fBoostSP"], 21.5)
+
+    async def test_when_v1_hub_updated_then_zones_are_as_v3(self):
+        "Check that the v1 responses are converted from the v3 state"
+
+        async with GeniusHub("token", base_url=self.server.url("hub-1")) as hub:
+            await hub.update()
+
+        self.assertEqual(
+            [z["name"] for z in hub.zones], ["My House", "Lounge", "Hot Water"]
+        )
+
+    async def test_when_v1_writes_to_a_zone_are_debounced_then_the_latest_wins(self):
+        "Check that a v1 mode & override, within the window, send only the latest"
+
+        base_url = self.server.url("hub-1")
+        async with GeniusHub("token", base_url=base_url, write_debounce=0.05) as hub:
+            await hub.update()
+            zone = hub.zone_by_id[1]
+            await asyncio.gather(
+                zone.set_mode("timer"), zone.set_override(22), zone.set_mode("off")
+            )
+
+        self.assertEqual(IMODE_TO_MODE[self.mock_hub.zones[1]["iMode"]], "off")
+
+    async def test_when_credentials_wrong_then_unauthorized(self):
+        "Check that a request with the wrong password gets a 401"
+
+        async with self._hub(password="wrong") as hub:
+            with self.assertRaises(aiohttp.ClientResponseError) as context:
+                await hub.update()
+
+        self.assertEqual(context.exception.status, 401)
+
+    async def test_when_hub_updated_then_requests_are_counted(self):
+        "Check that the virtual hub counts its requests, by endpoint"
+
+        async with self._hub() as hub:
+            await hub.update()
+
+        self.assertEqual(self.mock_hub.requests["v3/zones"], 1)
+
+
+class MockHubV1Tests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the MockHub Class, its v1 responses.
+    """
+
+    async def asyncSetUp(self):
+        self.mock_hub = MockHub()
+        self.conversions = 0
+        convert_v1 = self.mock_hub._convert_v1
+
+        async def count_conversions():
+            self.conversions += 1
+            return await convert_v1()
+
+        self.mock_hub._convert_v1 = count_conversions
+
+    async def test_when_the_state_is_unchanged_then_v1_is_converted_once(self):
+        "Check that the v1 responses are not converted for every request"
+
+        for endpoint in ("zones", "zones/summary", "devices", "zones"):
+            await self.mock_hub.v1(endpoint)
+
+        self.assertEqual(self.conversions, 1)
+
+    async def test_when_the_state_changes_then_v1_is_converted_again(self):
+        "Check that the v1 responses are of the latest state"
+
+        await self.mock_hub.v1("zones")
+        self.mock_hub.set_override(1, {"setpoint": 21.5, "duration": 3600})
+
+        zones = await self.mock_hub.v1("zones")
+
+        self.assertEqual(zones[1]["mode"], "override")
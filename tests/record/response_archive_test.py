@@ -0,0 +1,184 @@
+"""
+Tests for the ResponseRecorder & ReplayService classes
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+import zlib
+
+from geniushubclient import GeniusHub
+from geniushubclient.mock_hub import (
+    MockHub,
+    MockHubServer,
+    default_data_manager,
+    default_zones,
+)
+from geniushubclient.record import (
+    ReplayService,
+    ResponseRecorder,
+    decode_delta,
+    encode_delta,
+    read_archive,
+)
+from geniushubclient.session import GeniusService
+
+
+def _poll(temperature):
+    zones = default_zones()
+    zones[1]["fPV"] = temperature
+    return {
+        "zones": json.dumps({"error": 0, "data": zones}).encode(),
+        "data_manager": json.dumps(default_data_manager()).encode(),
+        "auth/release": json.dumps(
+            {"error": 0, "data": {"release": "5.3.6", "UID": "0x01"}}
+        ).encode(),
+    }
+
+
+class _Parser:
+    def feed(self, chunk):
+        pass
+
+    def close(self):
+        pass
+
+
+class _Content:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def iter_any(self):
+        for chunk in self._chunks:
+            await asyncio.sleep(0)  # so that concurrent attempts interleave
+            yield chunk
+
+
+class _Response:
+    def __init__(self, chunks):
+        self.content = _Content(chunks)
+
+
+class ResponseArchiveTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the ResponseRecorder & ReplayService Classes.
+    """
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "hub.archive")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _record(self, temperatures):
+        with ResponseRecorder(self.path) as recorder:
+            for idx, temperature in enumerate(temperatures):
+                for endpoint, body in _poll(temperature).items():
+                    recorder.record(endpoint, body, timestamp=1000.0 + idx * 60)
+        return recorder
+
+    def test_when_delta_decoded_then_body_is_restored(self):
+        "Check that a body can be restored from its delta"
+
+        prev, body = _poll(19.5)["zones"], _poll(21.0)["zones"]
+
+        delta = encode_delta(prev, body)
+
+        self.assertEqual(decode_delta(prev, delta), body)
+
+    def test_when_consecutive_polls_recorded_then_archive_is_compact(self):
+        "Check that polls are smaller than if each response is compressed"
+
+        temperatures = [19.5 + (i % 10) / 10 for i in range(100)]
+        recorder = self._record(temperatures)
+
+        compressed = sum(
+            len(zlib.compress(b)) for t in temperatures for b in _poll(t).values()
+        )
+        self.assertLess(recorder.bytes_out, compressed / 2)
+
+    def test_when_archive_read_then_bodies_are_as_recorded(self):
+        "Check that the archive yields the responses, in the order recorded"
+
+        self._record([19.5, 20.0, 20.0])
+
+        bodies = [body for _, _, body in read_archive(self.path)]
+
+        expected = [b for t in (19.5, 20.0, 20.0) for b in _poll(t).values()]
+        self.assertEqual(bodies, expected)
+
+    async def test_when_archive_replayed_then_hub_has_recorded_state(self):
+        "Check that a replayed archive is converted by GeniusHub.update()"
+
+        self._record([19.5, 21.0])
+        hub = GeniusHub("replay", replay=ReplayService(self.path))
+
+        await hub.update()
+        await hub.update()
+
+        self.assertEqual(hub.zone_by_id[1].data["temperature"], 21.0)
+
+    async def test_when_archive_exhausted_then_eof_error(self):
+        "Check that replaying beyond the end of the archive raises EOFError"
+
+        self._record([19.5])
+        hub = GeniusHub("replay", replay=ReplayService(self.path))
+        await hub.update()
+
+        with self.assertRaises(EOFError):
+            await hub.update()
+
+    async def test_when_hub_recording_then_responses_are_archived(self):
+        "Check that a GeniusHub with a recorder archives each GET response"
+
+        async with MockHubServer() as server:
+            server.add_hub("hub-1", MockHub())
+            await server.start()
+            with ResponseRecorder(self.path) as recorder:
+                async with GeniusHub(
+                    "hub-1",
+                    "username",
+                    "password",
+                    base_url=server.url("hub-1"),
+                    recorder=recorder,
+                ) as hub:
+                    await hub.update()
+
+        endpoints = sorted(endpoint for _, endpoint, _ in read_archive(self.path))
+
+        self.assertEqual(endpoints, ["auth/release", "data_manager", "zones"])
+
+    async def test_when_v1_responses_recorded_then_replayed_as_v1(self):
+        "Check that the API version of an archive is in its header"
+
+        with ResponseRecorder(self.path, api_version=1) as recorder:
+            recorder.record("zones", b'{"error": 0, "data": []}')
+
+        self.assertTrue(ReplayService(self.path).use_v1_api)
+
+    async def test_when_a_streamed_get_is_hedged_then_only_the_winner_is_recorded(
+        self,
+    ):
+        "Check that concurrent attempts of a GET do not mix their recorded bodies"
+
+        with ResponseRecorder(self.path) as recorder:
+            service = GeniusService("192.168.0.100", "username", "password")
+            service._recorder = recorder
+
+            async def request(method, url, data, reader):  # two attempts, one wins
+                winner, _ = await asyncio.gather(
+                    reader(_Response([b'{"error": ', b"0}"])),
+                    reader(_Response([b'{"hedge": ', b"1}"])),
+                )
+                return winner
+
+            service._request = request
+            await service.request_stream("GET", "data_manager", _Parser)
+            await service.close()
+
+        bodies = [body for _, _, body in read_archive(self.path)]
+
+        self.assertEqual(bodies, [b'{"error": 0}'])
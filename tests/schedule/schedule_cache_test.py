@@ -0,0 +1,156 @@
+"""
+Tests for the ScheduleCache class
+"""
+
+import copy
+import json
+import unittest
+from unittest.mock import Mock
+
+from geniushubclient.mock_hub import default_zones
+from geniushubclient.schedule import FrozenDict, FrozenList, ScheduleCache, freeze
+from geniushubclient.zone import GeniusZone
+
+
+class ScheduleCacheTests(unittest.TestCase):
+    """
+    Test for the ScheduleCache Class, an LRU cache of converted schedules.
+    """
+
+    def setUp(self):
+        self.cache = ScheduleCache(size=2)
+        self.conversions = 0
+
+    def _convert(self, raw_json):
+        def convert():
+            self.conversions += 1
+            return {"weekly": {"monday": {"defaultSetpoint": raw_json[0]}}}
+
+        return self.cache.get(raw_json, convert)
+
+    def test_when_a_schedule_is_cached_then_it_is_shared(self):
+        "Check that the same raw schedule returns the same object"
+
+        schedule = self._convert([14.0])
+
+        self.assertIs(self._convert([14.0]), schedule)
+
+    def test_when_a_schedule_is_cached_then_it_is_not_reconverted(self):
+        "Check that the same raw schedule is converted only once"
+
+        self._convert([14.0])
+        self._convert([14.0])
+
+        self.assertEqual(self.conversions, 1)
+
+    def test_when_a_schedule_differs_then_it_is_converted(self):
+        "Check that a different raw schedule is converted"
+
+        self._convert([14.0])
+
+        self.assertEqual(
+            self._convert([16.0])["weekly"]["monday"]["defaultSetpoint"], 16.0
+        )
+
+    def test_when_the_cache_is_full_then_the_least_recent_is_evicted(self):
+        "Check that the least recently used schedule is evicted"
+
+        self._convert([14.0])
+        self._convert([16.0])
+        self._convert([14.0])
+        self._convert([18.0])  # evicts 16.0
+        self._convert([14.0])
+        self._convert([16.0])
+
+        self.assertEqual(self.conversions, 4)
+
+    def test_when_a_schedule_is_cached_then_it_is_read_only(self):
+        "Check that a cached schedule cannot be changed"
+
+        schedule = self._convert([14.0])
+
+        with self.assertRaises(TypeError):
+            schedule["weekly"]["monday"]["defaultSetpoint"] = 16.0
+
+
+class FrozenTests(unittest.TestCase):
+    """
+    Test for the FrozenDict & FrozenList Classes.
+    """
+
+    _json = {"weekly": {"monday": {"heatingPeriods": [{"start": 0, "end": 60}]}}}
+
+    def test_when_frozen_then_a_list_cannot_be_appended_to(self):
+        "Check that a frozen list cannot be changed"
+
+        frozen = freeze(self._json)
+
+        with self.assertRaises(TypeError):
+            frozen["weekly"]["monday"]["heatingPeriods"].append({})
+
+    def test_when_frozen_then_it_equals_the_json(self):
+        "Check that frozen JSON equals the original"
+
+        self.assertEqual(freeze(self._json), self._json)
+
+    def test_when_frozen_then_it_is_serialised_as_the_json(self):
+        "Check that frozen JSON is serialised as the original"
+
+        self.assertEqual(json.dumps(freeze(self._json)), json.dumps(self._json))
+
+    def test_when_deep_copied_then_it_equals_the_json(self):
+        "Check that a deep copy of frozen JSON equals the original"
+
+        frozen = freeze(self._json)
+
+        self.assertEqual(copy.deepcopy(frozen), self._json)
+
+    def test_when_deep_copied_then_it_can_be_changed(self):
+        "Check that a deep copy of frozen JSON is mutable, all the way down"
+
+        schedule = copy.deepcopy(freeze(self._json))
+        schedule["weekly"]["monday"]["heatingPeriods"].append({})
+
+        self.assertEqual(type(schedule["weekly"]["monday"]["heatingPeriods"]), list)
+
+    def test_when_copied_then_it_is_shared(self):
+        "Check that a (shallow) copy of frozen JSON is itself, as it cannot change"
+
+        frozen = freeze(self._json)
+
+        self.assertIs(copy.copy(frozen), frozen)
+
+    def test_when_frozen_then_lists_are_frozen(self):
+        "Check that the lists of frozen JSON are FrozenLists"
+
+        frozen = freeze(self._json)
+
+        self.assertIsInstance(frozen["weekly"]["monday"]["heatingPeriods"], FrozenList)
+
+
+class GeniusZoneScheduleTests(unittest.TestCase):
+    """
+    Test for the GeniusZone Class, sharing converted schedules.
+    """
+
+    def test_when_zones_have_the_same_schedule_then_it_is_shared(self):
+        "Check that two zones with the same timer schedule share its conversion"
+
+        hub = Mock()
+        hub.api_version = 3
+        raw_json = default_zones()[1]
+        zone_1 = GeniusZone(1, raw_json, hub)
+        zone_2 = GeniusZone(3, dict(copy.deepcopy(raw_json), iID=3), hub)
+
+        self.assertIs(
+            zone_1.data["schedule"]["timer"], zone_2.data["schedule"]["timer"]
+        )
+
+    def test_when_a_zone_is_converted_then_its_schedule_is_frozen(self):
+        "Check that a zone's converted schedule is read-only"
+
+        hub = Mock()
+        hub.api_version = 3
+        zone = GeniusZone(1, default_zones()[1], hub)
+
+        self.assertIsInstance(zone.data["schedule"]["timer"], FrozenDict)
@@ -0,0 +1,46 @@
+"""
+Tests for the GeniusService class
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from geniushubclient.session import GeniusService
+
+
+class GeniusServiceDecodeTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the GeniusService Class, decoding of responses.
+    """
+
+    _hub_id = "192.168.0.100"
+
+    async def test_when_decoder_is_provided_then_it_decodes_the_body(self):
+        "Check that a custom decoder is given the raw bytes"
+
+        decoder = Mock(return_value={"error": 0})
+
+        async with GeniusService(
+            self._hub_id, "username", "password", decoder=decoder
+        ) as genius_service:
+            genius_service.decode(b'{"error": 0}')
+
+        decoder.assert_called_once_with(b'{"error": 0}')
+
+    async def test_when_body_is_empty_then_decoded_as_none(self):
+        "Check that an empty (or whitespace) body is decoded as None"
+
+        async with GeniusService(
+            self._hub_id, "username", "password"
+        ) as genius_service:
+            for body in (b"", b" \r\n"):
+                with self.subTest(body=body):
+                    self.assertIsNone(genius_service.decode(body))
+
+    async def test_when_decoder_is_default_then_json_is_decoded(self):
+        "Check that the default decoder decodes JSON"
+
+        async with GeniusService(
+            self._hub_id, "username", "password"
+        ) as genius_service:
+            self.assertEqual(genius_service.decode(b'{"error": 0}'), {"error": 0})
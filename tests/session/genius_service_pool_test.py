@@ -0,0 +1,58 @@
+"""
+Tests for the GeniusService class
+"""
+
+import unittest
+
+import aiohttp
+
+from geniushubclient.session import GeniusService
+
+
+class GeniusServicePoolTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the GeniusService Class, connection pool & session lifecycle.
+    """
+
+    _hub_id = "192.168.0.100"
+    _username = "username"
+    _password = "password"
+
+    async def test_when_pooled_then_connection_close_header_not_sent(self):
+        "Check that keep-alive connections are used when pooled"
+
+        async with GeniusService(
+            self._hub_id, self._username, self._password, pooled=True
+        ) as genius_service:
+            self.assertFalse("Connection" in genius_service._headers)
+
+    async def test_when_not_pooled_then_connection_close_header_sent(self):
+        "Check that a new connection is used per request when not pooled"
+
+        async with GeniusService(
+            self._hub_id, self._username, self._password
+        ) as genius_service:
+            self.assertEqual(genius_service._headers["Connection"], "close")
+
+    async def test_when_session_is_owned_then_it_is_closed_on_exit(self):
+        "Check that a session created by the service is closed by it"
+
+        async with GeniusService(
+            self._hub_id, self._username, self._password, pooled=True
+        ) as genius_service:
+            pass
+
+        self.assertTrue(genius_service._session.closed)
+
+    async def test_when_session_is_provided_then_it_is_not_closed_on_exit(self):
+        "Check that a session provided by the caller is left open"
+
+        session = aiohttp.ClientSession()
+
+        async with GeniusService(
+            self._hub_id, self._username, self._password, session=session
+        ):
+            pass
+
+        self.assertFalse(session.closed)
+        await session.close()
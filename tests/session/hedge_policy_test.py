@@ -0,0 +1,143 @@
+"""
+Tests for the HedgePolicy class
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from geniushubclient.hedge import HedgePolicy
+from geniushubclient.session import GeniusService
+
+
+class HedgePolicyTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the HedgePolicy Class.
+    """
+
+    def setUp(self):
+        self.policy = HedgePolicy(percentile=90, budget=1.0, min_samples=10)
+        for _ in range(10):
+            self.policy.record("zones", 0.01)
+        self.sent = 0
+
+    def _send(self, *delays):
+        async def send():
+            delay = delays[self.sent]
+            self.sent += 1
+            await asyncio.sleep(delay)
+            return delay
+
+        return send
+
+    def test_when_too_few_samples_then_no_delay(self):
+        "Check that there is no hedging until an endpoint has enough samples"
+
+        delay = self.policy.delay("devices")
+
+        self.assertIsNone(delay)
+
+    def test_when_samples_recorded_then_delay_is_percentile(self):
+        "Check that the hedge delay is the percentile of recent latencies"
+
+        delay = self.policy.delay("zones")
+
+        self.assertEqual(delay, 0.01)
+
+    def test_when_urls_have_ids_then_latencies_are_shared(self):
+        "Check that the latencies are by endpoint, e.g. zones/{id}"
+
+        for _ in range(10):
+            self.policy.record("zones/3", 0.02)
+
+        self.assertEqual(self.policy.delay("zones/7"), 0.02)
+
+    async def test_when_request_fast_then_not_hedged(self):
+        "Check that a request that answers in time is not duplicated"
+
+        await self.policy.request("zones", self._send(0.001))
+
+        self.assertEqual(self.sent, 1)
+
+    async def test_when_request_slow_then_hedge_wins(self):
+        "Check that a slow request is duplicated, and the first response wins"
+
+        result = await self.policy.request("zones", self._send(1.0, 0.001))
+
+        self.assertEqual(result, 0.001)
+
+    async def test_when_hedge_wins_then_it_is_counted(self):
+        "Check that the stats count the hedges, and those that won"
+
+        await self.policy.request("zones", self._send(1.0, 0.001))
+
+        self.assertEqual(
+            self.policy.stats, {"requests": 1, "hedges": 1, "hedges_won": 1}
+        )
+
+    async def test_when_hedge_wins_then_the_first_is_still_a_sample(self):
+        "Check that a request that lost to its hedge is recorded, as a straggler"
+
+        await self.policy.request("zones", self._send(1.0, 0.001))
+
+        self.assertEqual(self.policy._latencies["zones"].count, 12)
+
+    def test_when_defaults_then_budget_exceeds_the_requests_past_percentile(self):
+        "Check that the default budget is more than the requests it would hedge"
+
+        policy = HedgePolicy()
+
+        self.assertGreater(policy.budget, (100 - policy.percentile) / 100)
+
+    async def test_when_budget_exhausted_then_not_hedged(self):
+        "Check that the budget caps the number of hedges"
+
+        policy = HedgePolicy(percentile=0, budget=0.5, min_samples=1)
+        policy.record("zones", 0.001)
+
+        for _ in range(4):
+            self.sent = 0
+            await policy.request("zones", self._send(0.02, 0.001))
+
+        self.assertEqual(policy.hedges, 2)
+
+    async def test_when_first_fails_then_hedge_response_wins(self):
+        "Check that a failed request does not beat a hedge that succeeds"
+
+        async def send():
+            self.sent += 1
+            if self.sent == 1:
+                await asyncio.sleep(0.05)
+                raise asyncio.TimeoutError
+            await asyncio.sleep(0.1)
+            return "hedge"
+
+        result = await self.policy.request("zones", send)
+
+        self.assertEqual(result, "hedge")
+
+
+class HedgedServiceTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the hedged requests of a GeniusService.
+    """
+
+    async def asyncSetUp(self):
+        async def acquire(host, token):
+            await asyncio.sleep(0.05)
+
+        self.policy = HedgePolicy(min_samples=1)
+        self.service = GeniusService(
+            "token", rate_limiter=Mock(acquire=acquire), hedge=self.policy
+        )
+        self.service._request_once = AsyncMock(return_value=b"{}")
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    async def test_when_rate_limited_then_the_wait_is_not_timed(self):
+        "Check that only the request itself is timed, not its wait for a token"
+
+        await self.service.request_raw("GET", "zones")
+
+        self.assertLess(self.policy.delay("zones"), 0.05)
@@ -0,0 +1,108 @@
+"""
+Tests for the RateLimiter class
+"""
+
+import asyncio
+import time
+import unittest
+
+from geniushubclient.ratelimit import RateLimiter, parse_retry_after
+
+
+class RateLimiterTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the RateLimiter Class.
+    """
+
+    _host = "my.geniushub.co.uk"
+    _token = "hub-token"
+
+    async def test_when_within_burst_then_requests_are_not_delayed(self):
+        "Check that a burst of requests is allowed without waiting"
+
+        rate_limiter = RateLimiter(rate_per_token=1, burst_per_token=4)
+
+        start = time.monotonic()
+        for _ in range(4):
+            await rate_limiter.acquire(self._host, self._token)
+
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    async def test_when_burst_is_exceeded_then_requests_are_smoothed(self):
+        "Check that requests beyond the burst wait for the sustained rate"
+
+        rate_limiter = RateLimiter(rate_per_token=20, burst_per_token=1)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await rate_limiter.acquire(self._host, self._token)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    async def test_when_tokens_differ_then_limits_are_separate(self):
+        "Check that one token's requests do not delay another's"
+
+        rate_limiter = RateLimiter(rate_per_token=0.1, burst_per_token=1)
+        await rate_limiter.acquire(self._host, self._token)
+
+        start = time.monotonic()
+        await rate_limiter.acquire(self._host, "other-token")
+
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    async def test_when_throttled_then_requests_wait_for_retry_after(self):
+        "Check that a 429's Retry-After is respected"
+
+        rate_limiter = RateLimiter(rate_per_token=100, burst_per_token=10)
+        rate_limiter.throttled(self._host, self._token, retry_after="0.1")
+
+        start = time.monotonic()
+        await rate_limiter.acquire(self._host, self._token)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    async def test_when_a_token_is_throttled_then_it_takes_no_host_budget(self):
+        "Check that a token held back by a 429 does not delay other tokens"
+
+        rate_limiter = RateLimiter(rate_per_host=0.1, burst_per_host=1)
+        rate_limiter.throttled(self._host, self._token, retry_after="10")
+        task = asyncio.ensure_future(rate_limiter.acquire(self._host, self._token))
+        await asyncio.sleep(0)
+
+        start = time.monotonic()
+        await rate_limiter.acquire(self._host, "other-token")
+        task.cancel()
+
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    async def test_when_buckets_are_idle_then_they_are_evicted(self):
+        "Check that the buckets of tokens no longer used are not kept"
+
+        rate_limiter = RateLimiter(rate_per_token=1000, prune_interval=0)
+        await rate_limiter.acquire(self._host, self._token)
+        await asyncio.sleep(0.01)  # long enough for the token's bucket to refill
+
+        await rate_limiter.acquire(self._host, "other-token")
+
+        self.assertEqual(len(rate_limiter), 2)  # the host's, and other-token's
+
+
+class ParseRetryAfterTests(unittest.TestCase):
+    """
+    Test for parsing the Retry-After header.
+    """
+
+    def test_when_retry_after_is_seconds_then_it_is_parsed(self):
+        "Check that a delay in seconds is parsed"
+
+        self.assertEqual(parse_retry_after("120"), 120.0)
+
+    def test_when_retry_after_is_a_past_date_then_it_is_zero(self):
+        "Check that an HTTP-date in the past gives no delay"
+
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_when_retry_after_is_invalid_then_it_is_none(self):
+        "Check that an invalid header is ignored"
+
+        self.assertIsNone(parse_retry_after("soon"))
@@ -0,0 +1,76 @@
+"""
+Tests for the RequestScheduler class
+"""
+
+import asyncio
+import unittest
+
+from geniushubclient.scheduler import PRIORITY_READ, PRIORITY_WRITE, RequestScheduler
+
+
+class RequestSchedulerTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the RequestScheduler Class.
+    """
+
+    async def _request(self, scheduler, priority, name, log, duration=0.01):
+        async with scheduler.slot(priority):
+            log.append(name)
+            self.max_in_flight = max(self.max_in_flight, scheduler.in_flight)
+            await asyncio.sleep(duration)
+
+    async def asyncSetUp(self):
+        self.max_in_flight = 0
+
+    async def test_when_requests_exceed_the_cap_then_in_flight_is_capped(self):
+        "Check that no more than max_concurrent requests are in flight"
+
+        scheduler = RequestScheduler(max_concurrent=2)
+
+        await asyncio.gather(
+            *[self._request(scheduler, PRIORITY_READ, i, []) for i in range(6)]
+        )
+
+        self.assertEqual(self.max_in_flight, 2)
+
+    async def test_when_requests_are_queued_then_writes_are_served_first(self):
+        "Check that a queued write is sent before earlier queued reads"
+
+        scheduler = RequestScheduler(max_concurrent=1)
+        log = []
+
+        tasks = [
+            asyncio.create_task(self._request(scheduler, PRIORITY_READ, n, log))
+            for n in ("read-1", "read-2", "read-3")
+        ]
+        await asyncio.sleep(0)
+        tasks.append(
+            asyncio.create_task(self._request(scheduler, PRIORITY_WRITE, "write", log))
+        )
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(log, ["read-1", "write", "read-2", "read-3"])
+
+    async def test_when_a_waiter_is_cancelled_then_its_slot_is_not_lost(self):
+        "Check that cancelling a queued request does not leak a slot"
+
+        scheduler = RequestScheduler(max_concurrent=1)
+
+        first = asyncio.create_task(self._request(scheduler, PRIORITY_READ, 1, []))
+        second = asyncio.create_task(self._request(scheduler, PRIORITY_READ, 2, []))
+        await asyncio.sleep(0)
+        second.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+
+        self.assertEqual(scheduler.in_flight, 0)
+
+    async def test_when_requests_have_waited_then_stats_report_it(self):
+        "Check that the wait times of queued requests are reported"
+
+        scheduler = RequestScheduler(max_concurrent=1)
+
+        await asyncio.gather(
+            *[self._request(scheduler, PRIORITY_READ, i, []) for i in range(3)]
+        )
+
+        self.assertGreater(scheduler.stats["read"]["wait_max"], 0)
@@ -0,0 +1,65 @@
+"""
+Tests for the RollingHistogram and RequestTimings classes
+"""
+
+import unittest
+
+from geniushubclient.timing import RequestTimings, RollingHistogram, endpoint_of
+
+
+class RollingHistogramTests(unittest.TestCase):
+    """
+    Test for the RollingHistogram Class.
+    """
+
+    def test_when_full_then_oldest_samples_are_discarded(self):
+        "Check that only the most recent samples are kept"
+
+        histogram = RollingHistogram(size=3)
+        for value in (10, 1, 2, 3):
+            histogram.add(value)
+
+        self.assertEqual(histogram.percentile(100), 3)
+
+    def test_when_samples_added_then_percentiles_are_by_nearest_rank(self):
+        "Check that percentiles are calculated from the samples"
+
+        histogram = RollingHistogram()
+        for value in range(1, 101):
+            histogram.add(value)
+
+        self.assertEqual(histogram.percentile(95), 96)
+
+    def test_when_empty_then_percentile_is_none(self):
+        "Check that an empty histogram has no percentiles"
+
+        self.assertIsNone(RollingHistogram().percentile(50))
+
+    def test_when_bounds_given_then_samples_are_bucketed(self):
+        "Check that samples are counted against the bucket bounds"
+
+        histogram = RollingHistogram()
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.add(value)
+
+        self.assertEqual(histogram.histogram([0.1, 1.0]), [2, 1, 1])
+
+
+class RequestTimingsTests(unittest.TestCase):
+    """
+    Test for the RequestTimings Class.
+    """
+
+    def test_when_url_has_an_id_then_endpoint_is_generic(self):
+        "Check that requests for different zones share an endpoint"
+
+        self.assertEqual(endpoint_of("zones/12/override"), "zones/{id}/override")
+
+    def test_when_phases_recorded_then_summary_is_by_endpoint(self):
+        "Check that the summary groups phases by endpoint"
+
+        timings = RequestTimings()
+        timings.record("zones", "ttfb", 0.1)
+        timings.record("zones", "bytes", 2048)
+
+        self.assertEqual(sorted(timings.summary()["zones"]), ["bytes", "ttfb"])
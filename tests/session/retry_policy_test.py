@@ -0,0 +1,148 @@
+"""
+Tests for the RetryPolicy and CircuitBreaker classes
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+
+from geniushubclient.retry import CircuitBreaker, GeniusHubUnavailable, RetryPolicy
+from geniushubclient.session import GeniusService
+
+
+def _response_error(status) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(Mock(), (), status=status)
+
+
+class RetryPolicyTests(unittest.TestCase):
+    """
+    Test for the RetryPolicy Class.
+    """
+
+    def setUp(self):
+        self.retry_policy = RetryPolicy(attempts=3)
+
+    def test_when_status_is_hub_offline_then_request_is_retried(self):
+        "Check that a 502 (hub offline) is retried, even for writes"
+
+        for method in ("GET", "PATCH"):
+            with self.subTest(method=method):
+                self.assertTrue(
+                    self.retry_policy.should_retry(method, _response_error(502), 0)
+                )
+
+    def test_when_status_is_unauthorized_then_request_is_not_retried(self):
+        "Check that a 401 (unauthorized) fails fast"
+
+        self.assertFalse(self.retry_policy.should_retry("GET", _response_error(401), 0))
+
+    def test_when_disconnected_then_only_idempotent_requests_are_retried(self):
+        "Check that a write that may have been processed is not retried"
+
+        exc = aiohttp.ServerDisconnectedError()
+
+        test_values = {"GET": True, "PUT": True, "PATCH": False, "POST": False}
+
+        for method, expected in test_values.items():
+            with self.subTest(method=method):
+                self.assertEqual(
+                    self.retry_policy.should_retry(method, exc, 0), expected
+                )
+
+    def test_when_attempts_are_exhausted_then_request_is_not_retried(self):
+        "Check that there are no more than the configured number of attempts"
+
+        self.assertFalse(self.retry_policy.should_retry("GET", _response_error(502), 2))
+
+    def test_when_jitter_is_disabled_then_delay_is_exponential(self):
+        "Check that the backoff doubles after each attempt"
+
+        retry_policy = RetryPolicy(backoff=0.5, max_backoff=10, jitter=False)
+
+        delays = [retry_policy.delay(attempt) for attempt in range(6)]
+
+        self.assertEqual(delays, [0.5, 1.0, 2.0, 4.0, 8.0, 10])
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    """
+    Test for the CircuitBreaker Class.
+    """
+
+    def test_when_failures_reach_threshold_then_requests_fail_fast(self):
+        "Check that the circuit opens after enough consecutive failures"
+
+        circuit_breaker = CircuitBreaker(threshold=3, reset_timeout=60)
+        for _ in range(3):
+            circuit_breaker.record_failure()
+
+        self.assertRaises(GeniusHubUnavailable, circuit_breaker.check)
+
+    def test_when_failures_are_below_threshold_then_requests_are_made(self):
+        "Check that the circuit stays closed before enough failures"
+
+        circuit_breaker = CircuitBreaker(threshold=3, reset_timeout=60)
+        for _ in range(2):
+            circuit_breaker.record_failure()
+
+        self.assertIsNone(circuit_breaker.check())
+
+    def test_when_reset_timeout_has_passed_then_one_trial_is_allowed(self):
+        "Check that a half-open circuit allows only a single trial request"
+
+        circuit_breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+        circuit_breaker.record_failure()
+        circuit_breaker.check()  # the trial request
+
+        self.assertRaises(GeniusHubUnavailable, circuit_breaker.check)
+
+    def test_when_trial_succeeds_then_circuit_is_closed(self):
+        "Check that a successful request closes the circuit"
+
+        circuit_breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+        circuit_breaker.record_failure()
+        circuit_breaker.check()
+        circuit_breaker.record_success()
+
+        self.assertFalse(circuit_breaker.is_open)
+
+
+class CircuitBreakerTrialTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the CircuitBreaker Class, with the trial request of a GeniusService.
+    """
+
+    async def asyncSetUp(self):
+        self.circuit_breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+        self.circuit_breaker.record_failure()  # so the next request is the trial
+        self.service = GeniusService(
+            "192.168.0.100", circuit_breaker=self.circuit_breaker
+        )
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    async def _trial(self, exc):
+        self.service._request_once = AsyncMock(side_effect=exc)
+        try:
+            await self.service.request_raw("GET", "zones")
+        except BaseException:  # noqa: B902; the trial fails, either way
+            pass
+
+    async def test_when_the_trial_is_cancelled_then_another_trial_is_allowed(self):
+        "Check that a cancelled trial request does not hold the circuit open"
+
+        await self._trial(asyncio.CancelledError())
+        self.service._request_once = AsyncMock(return_value=b"{}")
+        await self.service.request_raw("GET", "zones")
+
+        self.assertFalse(self.circuit_breaker.is_open)
+
+    async def test_when_the_trial_fails_unexpectedly_then_it_is_a_failure(self):
+        "Check that a trial request that raises any exception is a failure"
+
+        await self._trial(RuntimeError("unexpected"))
+
+        self.assertEqual(self.circuit_breaker.failures, 2)
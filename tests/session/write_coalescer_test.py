@@ -0,0 +1,115 @@
+"""
+Tests for the WriteCoalescer class
+"""
+
+import asyncio
+import unittest
+
+from geniushubclient.coalesce import WriteCoalescer, write_key
+
+
+class WriteCoalescerTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test for the WriteCoalescer Class.
+    """
+
+    async def asyncSetUp(self):
+        self.sent = []
+        self.write_coalescer = WriteCoalescer(window=0.01)
+
+    def _send(self, value):
+        async def send():
+            self.sent.append(value)
+            return {"error": 0, "data": value}
+
+        return send
+
+    async def test_when_writes_within_window_then_only_latest_is_sent(self):
+        "Check that a burst of writes to a zone is collapsed to the latest"
+
+        await asyncio.gather(
+            *[self.write_coalescer.submit("zone/3", self._send(v)) for v in range(5)]
+        )
+
+        self.assertEqual(self.sent, [4])
+
+    async def test_when_writes_are_collapsed_then_all_callers_get_the_outcome(self):
+        "Check that every caller receives the response of the write that was sent"
+
+        results = await asyncio.gather(
+            *[self.write_coalescer.submit("zone/3", self._send(v)) for v in range(3)]
+        )
+
+        self.assertEqual([r["data"] for r in results], [2, 2, 2])
+
+    async def test_when_writes_are_to_different_zones_then_all_are_sent(self):
+        "Check that writes are only collapsed for the same key"
+
+        await asyncio.gather(
+            self.write_coalescer.submit("zone/3", self._send(3)),
+            self.write_coalescer.submit("zone/4", self._send(4)),
+        )
+
+        self.assertEqual(sorted(self.sent), [3, 4])
+
+    async def test_when_write_fails_then_all_callers_get_the_exception(self):
+        "Check that a failed write is raised to every caller"
+
+        async def send():
+            raise ValueError("hub error")
+
+        results = await asyncio.gather(
+            *[self.write_coalescer.submit("zone/3", send) for _ in range(2)],
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+    async def test_when_flushed_then_pending_writes_are_sent_now(self):
+        "Check that flush() does not wait for the window to close"
+
+        write_coalescer = WriteCoalescer(window=60)
+        task = asyncio.ensure_future(write_coalescer.submit("zone/3", self._send(1)))
+        await asyncio.sleep(0)
+        await write_coalescer.flush()
+        await task
+
+        self.assertEqual(self.sent, [1])
+
+    async def test_when_a_window_closes_during_a_flush_then_it_is_sent_once(self):
+        "Check that flush() skips a write already sent by its own window"
+
+        async def send_slowly():
+            await asyncio.sleep(0.05)  # longer than the window of zone/2
+            self.sent.append(1)
+
+        tasks = [
+            asyncio.ensure_future(self.write_coalescer.submit("zone/1", send_slowly)),
+            asyncio.ensure_future(self.write_coalescer.submit("zone/2", self._send(2))),
+        ]
+        await asyncio.sleep(0)
+        await self.write_coalescer.flush()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(sorted(self.sent), [1, 2])
+
+
+class WriteKeyTests(unittest.TestCase):
+    """
+    Test for write_key, the key by which writes are coalesced.
+    """
+
+    def test_when_v1_writes_are_to_a_zone_then_they_have_the_same_key(self):
+        "Check that a v1 mode & override, of the same zone, are coalesced"
+
+        self.assertEqual(write_key("zones/3/mode"), write_key("zones/3/override"))
+
+    def test_when_v1_and_v3_writes_are_to_a_zone_then_they_have_the_same_key(self):
+        "Check that the key of a zone is the same for both APIs"
+
+        self.assertEqual(write_key("zones/3/mode"), write_key("zone/3"))
+
+    def test_when_writes_are_to_different_zones_then_the_keys_differ(self):
+        "Check that zone 3 is not zone 31"
+
+        self.assertNotEqual(write_key("zone/3"), write_key("zone/31"))
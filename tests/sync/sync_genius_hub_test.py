@@ -0,0 +1,137 @@
+"""
+Tests for the SyncGeniusHub class
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from geniushubclient.mock_hub import MockHubServer
+from geniushubclient.sync import SyncGeniusHub
+
+
+class SyncGeniusHubTests(unittest.TestCase):
+    """
+    Test for the SyncGeniusHub Class.
+    """
+
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+        self.server = MockHubServer()
+        self.mock_hub = self.server.add_hub("hub-1")
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+
+        self.hub = SyncGeniusHub(
+            "hub-1",
+            "username",
+            "password",
+            interval=0.05,
+            base_url=self.server.url("hub-1"),
+        )
+
+    def tearDown(self):
+        self.hub.close()
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def test_when_started_then_snapshot_is_published(self):
+        "Check that the first snapshot is published by start()"
+
+        self.hub.start()
+
+        self.assertEqual(
+            [z["name"] for z in self.hub.snapshot.zones],
+            ["My House", "Lounge", "Hot Water"],
+        )
+
+    def test_when_started_then_hub_polls_by_itself(self):
+        "Check that new snapshots are published every interval"
+
+        self.hub.start()
+        time.sleep(0.5)
+
+        self.assertGreater(self.hub.snapshot.polls, 2)
+
+    def test_when_a_poll_fails_unexpectedly_then_polling_continues(self):
+        "Check that any error (e.g. a TypeError) does not end the polling"
+
+        self.hub.start()
+        update, failures = self.hub._hub.update, []
+
+        async def fail_once(*args, **kwargs):
+            if not failures:
+                failures.append(TypeError("'NoneType' object is not subscriptable"))
+                raise failures[0]
+            await update(*args, **kwargs)
+
+        self.hub._hub.update = fail_once
+        time.sleep(0.5)
+
+        self.assertGreater(self.hub.snapshot.polls, 2)
+
+    def test_when_write_made_then_future_has_new_snapshot(self):
+        "Check that a write's future gives a snapshot that includes the write"
+
+        self.hub.start()
+
+        snapshot = self.hub.set_override(1, 21.5).result(timeout=5)
+
+        self.assertEqual(snapshot.zones[1]["mode"], "override")
+
+    def test_when_a_poll_is_in_flight_then_a_write_has_a_new_snapshot(self):
+        "Check that a write's snapshot is not that of a poll made before the write"
+
+        self.hub.start()
+        service = self.hub._hub.genius_service
+        request_raw = service.request_raw
+
+        async def slow_request_raw(method, url, data=None):
+            if method != "GET":  # so that the poll's GETs are made first
+                await asyncio.sleep(0.05)
+            body = await request_raw(method, url, data=data)
+            if method == "GET":  # so that the poll is still in flight, after
+                await asyncio.sleep(0.2)
+            return body
+
+        service.request_raw = slow_request_raw
+        self.hub.refresh()  # i.e. a poll in flight, when the write is made
+
+        snapshot = self.hub.set_override(1, 21.5).result(timeout=5)
+
+        self.assertEqual(snapshot.zones[1]["mode"], "override")
+
+    def test_when_new_snapshot_published_then_old_is_unchanged(self):
+        "Check that a published snapshot is never changed by later polls"
+
+        self.hub.start()
+        old = self.hub.snapshot
+
+        self.hub.set_override(1, 21.5).result(timeout=5)
+
+        self.assertEqual(old.zones[1]["mode"], "timer")
+
+    def test_when_read_from_many_threads_then_snapshots_are_consistent(self):
+        "Check that threads can read snapshots while the hub is polling"
+
+        self.hub.start()
+        errors = []
+
+        def read():
+            for _ in range(1000):
+                snapshot = self.hub.snapshot
+                if len(snapshot.zones) != 3:
+                    errors.append(snapshot)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])